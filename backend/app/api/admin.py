@@ -1,5 +1,10 @@
 from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
 from app.core.security import require_role
+from app.database import get_db
+from app.services.screening_cache import screening_cache
+from app.services.screening_index import get_watchlist_index
+from app.services.ingestion_telemetry_service import ingestion_report
 
 router = APIRouter(
     prefix="/admin",
@@ -10,3 +15,30 @@ router = APIRouter(
 @router.get("/dashboard")
 def admin_dashboard():
     return {"admin": "secure"}
+
+
+@router.get("/screening-cache")
+def screening_cache_stats():
+    return screening_cache.stats()
+
+
+@router.get("/screening-index")
+def screening_index_stats(db: Session = Depends(get_db)):
+    index = get_watchlist_index(db)
+
+    return {
+        "entries": len(index),
+        "version": index.version,
+        "tiers": dict(index.tier_counters),
+        # Set when workers share a memory-mapped index file
+        "file": getattr(index, "path", None),
+    }
+
+
+@router.get("/ingestion-runs")
+def ingestion_runs(
+    feed_name: str | None = None,
+    limit: int = 20,
+    db: Session = Depends(get_db),
+):
+    return ingestion_report(db, feed_name, limit)
@@ -1,5 +1,32 @@
 from app.graph.graph_client import get_session
 
+
+def risk_from_neighborhood(related: list) -> float:
+    return min(len(related) * 10, 50)
+
+
+def neighborhoods(entity_names: list[str]) -> dict:
+    """
+    Returns {name: sorted names reached over 1..3 RELATION hops}, one item
+    per path (as counted by propagate_risk), for many entities in one
+    round trip. Entities missing from the graph map to [].
+    """
+    with get_session() as session:
+        result = session.run(
+            """
+            UNWIND $names AS name
+            OPTIONAL MATCH (e:Entity {name: name})-[:RELATION*1..3]->(r)
+            RETURN name, [node IN collect(r) | coalesce(node.name, '')] as related
+            """,
+            names=entity_names
+        )
+
+        return {
+            record["name"]: sorted(record["related"])
+            for record in result
+        }
+
+
 def propagate_risk(entity_name: str) -> float:
     with get_session() as session:
         result = session.run(
@@ -14,3 +41,4 @@ def propagate_risk(entity_name: str) -> float:
         connections = record["connections"] if record else 0
 
         return min(connections * 10, 50)
+
@@ -80,3 +80,7 @@ def startup_event():
     # START BACKGROUND SCHEDULER
     from app.services.scheduler_service import start_scheduler
     start_scheduler()
+
+    # START ASSESSMENT JOB WORKERS
+    from app.services.assessment_job_service import start_job_workers
+    start_job_workers()
@@ -7,6 +7,7 @@ from sqlalchemy import (
     Boolean,
     JSON,
     UniqueConstraint,
+    Index,
     BigInteger,
     Float,
 )
@@ -70,12 +71,23 @@ class GlobalEntity(Base):
 class GlobalEntityAlias(Base):
     __tablename__ = "global_entity_aliases"
 
+    __table_args__ = (
+        Index("ix_global_entity_aliases_source_key", "source", "source_key"),
+    )
+
     id = Column(Integer, primary_key=True)
-    entity_id = Column(Integer, ForeignKey("global_entities.id"), nullable=False)
+    entity_id = Column(Integer, ForeignKey("global_entities.id"), index=True, nullable=False)
 
     alias = Column(String, nullable=False)
     normalized_alias = Column(String, index=True, nullable=False)
 
+    # Feed provenance; NULL for aliases recorded by entity resolution
+    source = Column(String, nullable=True)  # OFAC
+    source_key = Column(String, nullable=True)  # alt_num in OFAC alt.csv
+
+    # Bumped on in-place renames so the supplier index notices them
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
+
     entity = relationship("GlobalEntity", back_populates="aliases")
 
 
@@ -119,6 +131,7 @@ class Supplier(Base):
     is_global = Column(Boolean, default=False, nullable=False)
 
     created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
 
     # Relationships
     organization = relationship("Organization", back_populates="suppliers")
@@ -153,12 +166,27 @@ class SupplierEntityLink(Base):
 class SanctionedEntity(Base):
     __tablename__ = "sanctioned_entities"
 
+    __table_args__ = (
+        Index("ix_sanctioned_entities_source_key", "source", "source_key"),
+        # Active-list scans walk only live rows, in id order
+        Index("ix_sanctioned_entities_active", "is_active", "id"),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     source = Column(String, nullable=False)  # OFAC | BIS | UN | EU | etc.
     program = Column(String, nullable=True)
 
     entity_id = Column(Integer, ForeignKey("global_entities.id"), nullable=False)
 
+    # Feed reconciliation: stable row id within the source feed and a hash
+    # of the row as last ingested
+    source_key = Column(String, nullable=True)
+    row_hash = Column(String, nullable=True)
+
+    # Delisted rows are kept as tombstones
+    is_active = Column(Boolean, default=True, nullable=False)
+    delisted_at = Column(DateTime, nullable=True)
+
     entity = relationship("GlobalEntity", back_populates="sanctions")
 
 
@@ -168,6 +196,11 @@ class SanctionedEntity(Base):
 class CoveredEntity(Base):
     __tablename__ = "covered_entities"
 
+    __table_args__ = (
+        Index("ix_covered_entities_source_key", "source", "source_key"),
+        Index("ix_covered_entities_active", "is_active", "id"),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
 
     designation = Column(String, nullable=False)  # e.g., "Section 889(a)(1)(B)"
@@ -175,6 +208,12 @@ class CoveredEntity(Base):
 
     entity_id = Column(Integer, ForeignKey("global_entities.id"), nullable=False)
 
+    source_key = Column(String, nullable=True)
+    row_hash = Column(String, nullable=True)
+
+    is_active = Column(Boolean, default=True, nullable=False)
+    delisted_at = Column(DateTime, nullable=True)
+
     created_at = Column(DateTime, default=datetime.utcnow)
 
     entity = relationship("GlobalEntity", back_populates="covered_designations")
@@ -207,11 +246,50 @@ class AssessmentHistory(Base):
     # Full Raw Snapshot (future-proofing)
     snapshot = Column(JSON, nullable=True)
 
+    # Versions of the inputs this assessment read (list, config, graph
+    # neighborhood, supplier row); unchanged fingerprints skip rescoring
+    input_fingerprint = Column(JSON, nullable=True)
+
     created_at = Column(DateTime, default=datetime.utcnow)
 
     supplier = relationship("Supplier", back_populates="assessments")
 
 
+# =====================================================
+# ASSESSMENT JOBS (DB-BACKED QUEUE)
+# =====================================================
+class AssessmentJob(Base):
+    __tablename__ = "assessment_jobs"
+
+    __table_args__ = (
+        Index("ix_assessment_jobs_status_created", "status", "created_at"),
+    )
+
+    # Opaque ID handed to the client for polling
+    id = Column(String, primary_key=True)
+
+    supplier_id = Column(Integer, ForeignKey("suppliers.id"), nullable=False)
+    requested_by_user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+
+    status = Column(String, nullable=False, default="QUEUED")  # QUEUED | RUNNING | SUCCEEDED | FAILED
+
+    # supplier_id while QUEUED or RUNNING, NULL once finished: the unique
+    # constraint allows one in-flight job per supplier on any database
+    in_flight_supplier_id = Column(Integer, unique=True, nullable=True)
+
+    worker = Column(String, nullable=True)  # claim token of the executing worker
+    attempts = Column(Integer, default=0)
+
+    result = Column(JSON, nullable=True)  # run_assessment payload
+    error_message = Column(String, nullable=True)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime, nullable=True)
+    # Refreshed by the executing worker while the job runs
+    heartbeat_at = Column(DateTime, nullable=True)
+    completed_at = Column(DateTime, nullable=True)
+
+
 # =====================================================
 # SCORING CONFIG
 # =====================================================
@@ -257,14 +335,105 @@ class IngestionRun(Base):
     id = Column(Integer, primary_key=True)
 
     feed_name = Column(String, nullable=False)
-    status = Column(String, nullable=False)  # SUCCESS | FAILED
+    status = Column(String, nullable=False)  # SUCCESS | FAILED | NO_CHANGE
     record_count = Column(Integer, default=0)
 
     error_message = Column(String, nullable=True)
 
+    # Feed validators for the next conditional fetch
+    etag = Column(String, nullable=True)
+    last_modified = Column(String, nullable=True)
+    content_hash = Column(String, nullable=True)  # sha256 of the downloaded body
+
+    # Checkpoint: byte offset in the content_hash download up to which rows
+    # are committed; a FAILED run with one is resumed by the next run
+    checkpoint_offset = Column(BigInteger, nullable=True)
+    resumed_from_run_id = Column(Integer, ForeignKey("ingestion_runs.id"), nullable=True)
+
+    # Watchlist index version before and after the run's changes were
+    # applied (None before: no index was loaded yet)
+    previous_list_version = Column(String, nullable=True)
+    list_version = Column(String, nullable=True, index=True)
+
+    # feed_name while a single-runner job (the supplier rescore) is RUNNING,
+    # NULL once finished: the unique constraint allows one live run per job
+    # across every app process
+    running_feed_name = Column(String, unique=True, nullable=True)
+    # Refreshed by that run; one not refreshed for RESCORE_STALE_SECONDS
+    # lost its process
+    heartbeat_at = Column(DateTime, nullable=True)
+
+    # Telemetry: where the run's time went
+    bytes_downloaded = Column(BigInteger, nullable=True)
+    download_ms = Column(Float, nullable=True)
+    parse_ms = Column(Float, nullable=True)
+    resolve_ms = Column(Float, nullable=True)  # snapshot diff + entity matching
+    db_write_ms = Column(Float, nullable=True)  # bulk INSERT/UPDATE + commit
+    rows_parsed = Column(Integer, nullable=True)
+    rows_per_sec = Column(Float, nullable=True)
+    entities_created = Column(Integer, nullable=True)
+    entities_matched = Column(Integer, nullable=True)
+
     started_at = Column(DateTime, default=datetime.utcnow)
     completed_at = Column(DateTime, nullable=True)
 
+    changes = relationship("WatchlistChange", back_populates="ingestion_run", cascade="all, delete-orphan")
+
+
+# =====================================================
+# RESCORE CHUNKS (CHECKPOINTS OF A SUPPLIER_RESCORE RUN)
+# =====================================================
+class RescoreChunk(Base):
+    __tablename__ = "rescore_chunks"
+
+    id = Column(Integer, primary_key=True)
+
+    # The SUPPLIER_RESCORE IngestionRun that owns the chunk; a resumed run
+    # takes over the PENDING chunks of the run it resumes
+    ingestion_run_id = Column(Integer, ForeignKey("ingestion_runs.id"), index=True, nullable=False)
+
+    supplier_ids = Column(JSON, nullable=False)
+    status = Column(String, nullable=False, default="PENDING")  # PENDING | DONE | FAILED
+
+    # Runs that picked the chunk up; FAILED once RESCORE_CHUNK_MAX_ATTEMPTS
+    # of them did not finish it
+    attempts = Column(Integer, nullable=False, default=0)
+
+    assessed = Column(Integer, nullable=True)
+    seconds = Column(Float, nullable=True)
+    completed_at = Column(DateTime, nullable=True)
+
+
+# =====================================================
+# WATCHLIST CHANGE LOG (PER INGESTION RUN)
+# =====================================================
+class WatchlistChange(Base):
+    __tablename__ = "watchlist_changes"
+
+    id = Column(Integer, primary_key=True)
+
+    ingestion_run_id = Column(Integer, ForeignKey("ingestion_runs.id"), index=True, nullable=False)
+
+    list_name = Column(String, nullable=False)  # SANCTIONS | SECTION_889
+    # ADDED | CHANGED | REMOVED, or ALIAS_ADDED | ALIAS_CHANGED | ALIAS_REMOVED
+    change_type = Column(String, nullable=False)
+    list_entry_id = Column(Integer, nullable=False)  # SanctionedEntity.id / CoveredEntity.id
+    entity_id = Column(Integer, ForeignKey("global_entities.id"), nullable=False)
+
+    # Name at the time of the change (kept for REMOVED entries); the alias
+    # itself for ALIAS_* rows
+    name = Column(String, nullable=False)
+
+    # Name before a CHANGED entry (or ALIAS_CHANGED alias) was renamed in place
+    previous_name = Column(String, nullable=True)
+
+    # Suppliers whose name or alias matches this entry (reverse screening)
+    affected_supplier_ids = Column(JSON, nullable=True)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    ingestion_run = relationship("IngestionRun", back_populates="changes")
+
 
 # =====================================================
 # TRUST MODEL CONFIG (VERSIONED)
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, WebSocket, HTTPException, Query
+from fastapi.encoders import jsonable_encoder
 from sqlalchemy.orm import Session
 from typing import List, Optional
 import asyncio
@@ -9,13 +10,21 @@ from app.database import get_db, SessionLocal
 from app.models import (
     Supplier,
     AssessmentHistory,
+    AssessmentJob,
     User,
     SupplierEntityLink,
     GlobalEntity,
     SanctionedEntity,
 )
-from app.schemas import SupplierCreate, SupplierResponse
+from app.schemas import SupplierCreate, SupplierResponse, ScreenBatchRequest
 from app.services.assessment_service import run_assessment
+from app.services.assessment_job_service import (
+    FINISHED_STATUSES,
+    ASSESSMENT_JOB_POLL_SECONDS,
+    job_payload,
+    submit_assessment_job,
+)
+from app.services.batch_screening_service import screen_batch
 from app.services.audit_service import log_action
 from app.core.security import get_current_user
 from app.graph.supplier_graph_service import create_supplier_node
@@ -324,7 +333,10 @@ def get_supplier_profile(
 
         sanctions = (
             db.query(SanctionedEntity)
-            .filter(SanctionedEntity.entity_id == linked_entity.id)
+            .filter(
+                SanctionedEntity.entity_id == linked_entity.id,
+                SanctionedEntity.is_active,
+            )
             .all()
         )
 
@@ -478,6 +490,136 @@ def supplier_assessment(
 
     return result
 # =====================================================
+# ASSESSMENT JOBS (SUBMIT, POLL, SUBSCRIBE)
+# =====================================================
+def visible_job(job_id: str, db: Session, current_user: User):
+    return (
+        db.query(AssessmentJob)
+        .join(Supplier, Supplier.id == AssessmentJob.supplier_id)
+        .filter(
+            AssessmentJob.id == job_id,
+            or_(
+                Supplier.organization_id == current_user.organization_id,
+                Supplier.is_global == True
+            ),
+        )
+        .first()
+    )
+
+
+@router.post("/{supplier_id:int}/assessment-jobs", status_code=202)
+def submit_supplier_assessment(
+    supplier_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    supplier = (
+        db.query(Supplier)
+        .filter(
+            Supplier.id == supplier_id,
+            or_(
+                Supplier.organization_id == current_user.organization_id,
+                Supplier.is_global == True
+            ),
+        )
+        .first()
+    )
+
+    if not supplier:
+        raise HTTPException(status_code=404, detail="Supplier not found")
+
+    job, deduplicated = submit_assessment_job(supplier_id, db, user_id=current_user.id)
+
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        # True when an identical job was already queued or running
+        "deduplicated": deduplicated,
+    }
+
+
+@router.get("/assessment-jobs/{job_id}")
+def assessment_job_status(
+    job_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    job = visible_job(job_id, db, current_user)
+
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    return job_payload(job)
+
+
+@router.websocket("/assessment-jobs/{job_id}/subscribe")
+async def subscribe_assessment_job(websocket: WebSocket, job_id: str):
+    await websocket.accept()
+
+    # Sends the job once it finishes, then closes
+    while True:
+        db = SessionLocal()
+        job = db.get(AssessmentJob, job_id)
+        payload = job_payload(job) if job else None
+        db.close()
+
+        if payload is None:
+            await websocket.send_json({"job_id": job_id, "error": "Job not found"})
+            break
+
+        if payload["status"] in FINISHED_STATUSES:
+            await websocket.send_json(jsonable_encoder(payload))
+            break
+
+        await asyncio.sleep(ASSESSMENT_JOB_POLL_SECONDS)
+
+    await websocket.close()
+
+
+# =====================================================
+# BATCH SCREENING (SANCTIONS + SECTION 889)
+# =====================================================
+@router.post("/screen-batch")
+def screen_supplier_batch(
+    payload: ScreenBatchRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    allowed_ids = [
+        row[0]
+        for row in db.query(Supplier.id)
+        .filter(
+            Supplier.id.in_(payload.supplier_ids),
+            or_(
+                Supplier.organization_id == current_user.organization_id,
+                Supplier.is_global == True
+            ),
+        )
+        .all()
+    ]
+
+    results = screen_batch(allowed_ids, db)
+
+    log_action(
+        db=db,
+        user_id=current_user.id,
+        action="SCREEN_BATCH",
+        resource_type="Supplier",
+        details={"supplier_count": len(results)},
+    )
+
+    return {
+        "results": [
+            {
+                "supplier_id": supplier_id,
+                "sanctions": result["sanctions"],
+                "section_889": result["section_889"],
+            }
+            for supplier_id, result in results.items()
+        ],
+        "not_found": sorted(set(payload.supplier_ids) - set(results)),
+    }
+# =====================================================
 # SUPPLIER HISTORY
 # =====================================================
 @router.get("/{supplier_id:int}/history")
@@ -1,7 +1,7 @@
 from pydantic import BaseModel
 from typing import Optional
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 
 
@@ -11,6 +11,10 @@ class SupplierCreate(BaseModel):
     industry: Optional[str] = None
 
 
+class ScreenBatchRequest(BaseModel):
+    supplier_ids: List[int]
+
+
 class SupplierResponse(BaseModel):
     id: int
     name: str
@@ -0,0 +1,266 @@
+import os
+import threading
+import uuid
+from datetime import datetime, timedelta
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models import AssessmentJob
+from app.services.assessment_service import run_assessment
+from app.services.audit_service import log_action
+
+
+# Worker threads executing queued assessment jobs in each app process
+ASSESSMENT_JOB_WORKERS = int(os.getenv("ASSESSMENT_JOB_WORKERS", "4"))
+
+# Idle workers re-check the queue this often (picks up jobs submitted to
+# other processes sharing the database)
+ASSESSMENT_JOB_POLL_SECONDS = float(os.getenv("ASSESSMENT_JOB_POLL_SECONDS", "1"))
+
+# Running jobs refresh a heartbeat this often; one not refreshed for
+# ASSESSMENT_JOB_STALE_SECONDS lost its worker. Requeue it until it has
+# been claimed ASSESSMENT_JOB_MAX_ATTEMPTS times, then fail it
+ASSESSMENT_JOB_HEARTBEAT_SECONDS = float(os.getenv("ASSESSMENT_JOB_HEARTBEAT_SECONDS", "10"))
+ASSESSMENT_JOB_STALE_SECONDS = float(os.getenv("ASSESSMENT_JOB_STALE_SECONDS", "60"))
+ASSESSMENT_JOB_MAX_ATTEMPTS = int(os.getenv("ASSESSMENT_JOB_MAX_ATTEMPTS", "3"))
+
+FINISHED_STATUSES = ("SUCCEEDED", "FAILED")
+
+_wakeup = threading.Event()
+_stopping = threading.Event()
+_workers: list[threading.Thread] = []
+
+
+def job_payload(job: AssessmentJob) -> dict:
+    return {
+        "job_id": job.id,
+        "supplier_id": job.supplier_id,
+        "status": job.status,
+        "result": job.result,
+        "error": job.error_message,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "completed_at": job.completed_at,
+    }
+
+
+def in_flight_job(supplier_id: int, db: Session):
+    return (
+        db.query(AssessmentJob)
+        .filter(AssessmentJob.in_flight_supplier_id == supplier_id)
+        .first()
+    )
+
+
+def submit_assessment_job(supplier_id: int, db: Session, user_id: int | None = None):
+    """
+    Queues an assessment of the supplier, or joins the job already queued
+    or running for it. Returns (job, deduplicated).
+    """
+    existing = in_flight_job(supplier_id, db)
+
+    if existing is not None:
+        return existing, True
+
+    job = AssessmentJob(
+        id=uuid.uuid4().hex,
+        supplier_id=supplier_id,
+        requested_by_user_id=user_id,
+        status="QUEUED",
+        in_flight_supplier_id=supplier_id,
+        created_at=datetime.utcnow(),
+    )
+    db.add(job)
+
+    try:
+        db.commit()
+    except IntegrityError:
+        # Another request queued this supplier between the check and the insert
+        db.rollback()
+        return in_flight_job(supplier_id, db), True
+
+    _wakeup.set()
+
+    return job, False
+
+
+def requeue_stale_jobs(db: Session) -> int:
+    cutoff = datetime.utcnow() - timedelta(seconds=ASSESSMENT_JOB_STALE_SECONDS)
+
+    stale = (AssessmentJob.status == "RUNNING", AssessmentJob.heartbeat_at < cutoff)
+
+    db.execute(
+        update(AssessmentJob)
+        .where(*stale, AssessmentJob.attempts >= ASSESSMENT_JOB_MAX_ATTEMPTS)
+        .values(
+            status="FAILED",
+            error_message="Worker lost; attempts exhausted",
+            in_flight_supplier_id=None,
+            completed_at=datetime.utcnow(),
+        )
+    )
+    requeued = db.execute(
+        update(AssessmentJob)
+        .where(*stale)
+        .values(status="QUEUED", worker=None)
+    ).rowcount
+    db.commit()
+
+    return requeued
+
+
+def claim_next_job(db: Session, worker: str):
+    """
+    Moves the oldest QUEUED job to RUNNING for this worker. The conditional
+    UPDATE is the lock: when workers race for a job, one row count is 1.
+    """
+    while True:
+        job_id = (
+            db.query(AssessmentJob.id)
+            .filter(AssessmentJob.status == "QUEUED")
+            .order_by(AssessmentJob.created_at)
+            .limit(1)
+            .scalar()
+        )
+
+        if job_id is None:
+            return None
+
+        claimed = db.execute(
+            update(AssessmentJob)
+            .where(AssessmentJob.id == job_id, AssessmentJob.status == "QUEUED")
+            .values(
+                status="RUNNING",
+                worker=worker,
+                started_at=datetime.utcnow(),
+                heartbeat_at=datetime.utcnow(),
+                attempts=AssessmentJob.attempts + 1,
+            )
+        ).rowcount
+        db.commit()
+
+        if claimed:
+            return db.get(AssessmentJob, job_id)
+
+
+def heartbeat(job_id: str, worker: str, stop: threading.Event):
+    """Refreshes heartbeat_at on its own session until stop is set."""
+    while not stop.wait(ASSESSMENT_JOB_HEARTBEAT_SECONDS):
+        db = SessionLocal()
+
+        try:
+            db.execute(
+                update(AssessmentJob)
+                .where(AssessmentJob.id == job_id, AssessmentJob.worker == worker)
+                .values(heartbeat_at=datetime.utcnow())
+            )
+            db.commit()
+
+        except Exception as e:
+            print(f"Warning: assessment job {job_id} heartbeat failed: {e}")
+
+        finally:
+            db.close()
+
+
+def execute_job(job: AssessmentJob, db: Session):
+    job_id, worker = job.id, job.worker
+
+    stop = threading.Event()
+    beating = threading.Thread(target=heartbeat, args=(job_id, worker, stop), daemon=True)
+    beating.start()
+
+    values = {}
+
+    try:
+        result = run_assessment(job.supplier_id, db, user_id=job.requested_by_user_id)
+
+        if "error" in result:
+            values = {"status": "FAILED", "error_message": result["error"]}
+        else:
+            values = {"status": "SUCCEEDED", "result": result}
+
+    except Exception as e:
+        db.rollback()
+        values = {"status": "FAILED", "error_message": str(e)}
+
+    finally:
+        stop.set()
+        beating.join()
+
+    # Only while this worker still holds the claim: a job requeued after a
+    # missed heartbeat belongs to whichever worker claimed it next
+    finished = db.execute(
+        update(AssessmentJob)
+        .where(AssessmentJob.id == job_id, AssessmentJob.worker == worker)
+        .values(in_flight_supplier_id=None, completed_at=datetime.utcnow(), **values)
+    ).rowcount
+    db.commit()
+
+    if not finished:
+        print(f"Warning: assessment job {job_id} was requeued while worker {worker} ran it; result dropped")
+        return
+
+    if values["status"] == "SUCCEEDED":
+        log_action(
+            db=db,
+            user_id=job.requested_by_user_id,
+            action="RUN_ASSESSMENT",
+            resource_type="Supplier",
+            resource_id=job.supplier_id,
+            details={"result": values["result"].get("overall_status"), "job_id": job_id},
+        )
+
+
+def job_worker_loop(worker: str):
+    while not _stopping.is_set():
+        db = SessionLocal()
+
+        try:
+            job = claim_next_job(db, worker)
+
+            if job is not None:
+                execute_job(job, db)
+                continue
+
+            requeue_stale_jobs(db)
+
+        except Exception as e:
+            print(f"Warning: assessment job worker {worker} error: {e}")
+
+        finally:
+            db.close()
+
+        # Idle: sleep until a local submit or the next poll
+        _wakeup.wait(ASSESSMENT_JOB_POLL_SECONDS)
+        _wakeup.clear()
+
+
+def start_job_workers():
+    if _workers:
+        return
+
+    _stopping.clear()
+
+    for number in range(ASSESSMENT_JOB_WORKERS):
+        worker = f"{os.getpid()}-{number}"
+        thread = threading.Thread(
+            target=job_worker_loop,
+            args=(worker,),
+            name=f"assessment-job-{number}",
+            daemon=True,
+        )
+        thread.start()
+        _workers.append(thread)
+
+
+def stop_job_workers():
+    _stopping.set()
+    _wakeup.set()
+
+    for thread in _workers:
+        thread.join()
+
+    _workers.clear()
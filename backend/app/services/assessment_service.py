@@ -1,9 +1,79 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
 from sqlalchemy.orm import Session
 from app.models import AssessmentHistory, ScoringConfig, Supplier
-from app.services.sanctions_service import check_sanctions
-from app.services.section889_service import evaluate_section_889
+from app.services.screening_engine import screen_supplier
+from app.services.batch_screening_service import screen_batch
+from app.services.screening_index import get_watchlist_index
 from app.services.external_intelligence_service import news_risk_signal
-from app.graph.risk_propagation import propagate_risk
+from app.services.input_fingerprint_service import input_fingerprint
+from app.graph.risk_propagation import neighborhoods, risk_from_neighborhood
+
+
+# Per-module deadlines; a module that misses it scores its fallback (0)
+NEWS_TIMEOUT_SECONDS = float(os.getenv("ASSESSMENT_NEWS_TIMEOUT", "3"))
+GRAPH_TIMEOUT_SECONDS = float(os.getenv("ASSESSMENT_GRAPH_TIMEOUT", "2"))
+
+# Deadline for the single UNWIND graph query of a batch assessment
+GRAPH_BATCH_TIMEOUT_SECONDS = float(os.getenv("ASSESSMENT_GRAPH_BATCH_TIMEOUT", "60"))
+
+# AssessmentHistory rows written per transaction by batch assessments
+ASSESSMENT_INSERT_CHUNK_SIZE = int(os.getenv("ASSESSMENT_INSERT_CHUNK_SIZE", "1000"))
+
+# Threads for the I/O-bound modules. A timed-out call keeps its thread
+# until its own client timeout fires, so size this for that backlog.
+ASSESSMENT_MODULE_WORKERS = int(os.getenv("ASSESSMENT_MODULE_WORKERS", "16"))
+
+module_pool = ThreadPoolExecutor(
+    max_workers=ASSESSMENT_MODULE_WORKERS,
+    thread_name_prefix="assessment-module",
+)
+
+
+def _timed_call(function, *args):
+    started = time.perf_counter()
+
+    try:
+        value, error = function(*args), None
+    except Exception as e:
+        value, error = None, e
+
+    return value, (time.perf_counter() - started) * 1000, error
+
+
+def start_module(function, *args):
+    return time.perf_counter(), module_pool.submit(_timed_call, function, *args)
+
+
+def collect_module(
+    name: str,
+    module,
+    timeout: float,
+    fallback,
+    timings: dict,
+    failures: dict,
+):
+    """
+    Waits for a started module until its deadline (counted from its
+    start), recording its run time and, on timeout or error, the failure;
+    returns the module's value or the fallback.
+    """
+    started, future = module
+
+    try:
+        value, elapsed_ms, error = future.result(timeout=max(timeout - (time.perf_counter() - started), 0))
+    except FutureTimeout:
+        failures[name] = f"timed out after {timeout:g}s"
+        value, elapsed_ms, error = fallback, timeout * 1000, None
+
+    if error is not None:
+        failures[name] = f"{type(error).__name__}: {error}"
+        value = fallback
+
+    timings[name] = round(elapsed_ms, 1)
+
+    return value
 
 
 def generate_executive_brief(overall_status: str):
@@ -41,28 +111,24 @@ def calculate_overall_status(risk_score: int):
         return "PASS"
 
 
-def run_assessment(supplier_id: int, db: Session, user_id: int | None = None):
-
-    # ------------------------------------------------------------------
-    # Fetch Supplier
-    # ------------------------------------------------------------------
-    supplier = db.query(Supplier).filter_by(id=supplier_id).first()
-
-    if not supplier:
-        return {"error": "Supplier not found"}
+def build_assessment(
+    supplier: Supplier,
+    config: ScoringConfig,
+    sanctions_result: dict,
+    section889_result: dict,
+    news_score,
+    graph_risk,
+    timings: dict,
+    failures: dict,
+    fingerprint: dict,
+    user_id: int | None = None,
+):
+    """
+    Aggregates module results into a risk score.
 
-    supplier_name = supplier.name
-
-    # ------------------------------------------------------------------
-    # Load Scoring Configuration
-    # ------------------------------------------------------------------
-    config = get_active_scoring_config(db)
-
-    # ------------------------------------------------------------------
-    # Run Individual Risk Modules
-    # ------------------------------------------------------------------
-    sanctions_result = check_sanctions(supplier_id, db)
-    section889_result = evaluate_section_889(supplier_id, db)
+    Returns (history_values, response): the AssessmentHistory column
+    values and the assessment payload, shared by the single and batch paths.
+    """
 
     # ------------------------------------------------------------------
     # Risk Aggregation
@@ -87,15 +153,11 @@ def run_assessment(supplier_id: int, db: Session, user_id: int | None = None):
         reasons.append(section889_result.get("reason"))
 
     # ------------------ External Intelligence (News) ------------------
-    news_score = news_risk_signal(supplier_name)
-
     if news_score and news_score > 0:
         risk_score += news_score
         reasons.append("Negative media signal detected")
 
     # ------------------ Graph Propagation Risk ------------------
-    graph_risk = propagate_risk(supplier_name)
-
     if graph_risk and graph_risk > 0:
         risk_score += graph_risk
         reasons.append("Graph-based relationship risk detected")
@@ -109,40 +171,34 @@ def run_assessment(supplier_id: int, db: Session, user_id: int | None = None):
 
     executive_brief = generate_executive_brief(overall_status)
 
-# ------------------------------------------------------------------
-# Persist Assessment History (FULL SNAPSHOT)
-# ------------------------------------------------------------------
-    history = AssessmentHistory(
-        supplier_id=supplier_id,
-        initiated_by_user_id=user_id,
-        risk_score=risk_score,
-        overall_status=overall_status,
-        sanctions_flag=(
+    history_values = {
+        "supplier_id": supplier.id,
+        "initiated_by_user_id": user_id,
+        "risk_score": risk_score,
+        "overall_status": overall_status,
+        "sanctions_flag": (
             sanctions_result.get("overall_status") == "FAIL"
             if sanctions_result else False
         ),
-        section889_status=section_status,
-        news_signal_score=news_score or 0,
-        graph_risk_score=graph_risk or 0,
-        scoring_version=config.version,
-        snapshot={
+        "section889_status": section_status,
+        "news_signal_score": news_score or 0,
+        "graph_risk_score": graph_risk or 0,
+        "scoring_version": config.version,
+        "snapshot": {
             "sanctions": sanctions_result,
             "section_889": section889_result,
             "news_signal_score": news_score,
             "graph_risk_score": graph_risk,
             "reasons": reasons,
             "config_version": config.version,
-        }
-    )
-
-    db.add(history)
-    db.commit()
+            "module_timings_ms": timings,
+            "module_failures": failures,
+        },
+        "input_fingerprint": fingerprint,
+    }
 
-    # ------------------------------------------------------------------
-    # Response Payload
-    # ------------------------------------------------------------------
-    return {
-        "supplier": supplier_name,
+    response = {
+        "supplier": supplier.name,
         "overall_status": overall_status,
         "risk_score": risk_score,
         "sanctions": sanctions_result,
@@ -151,10 +207,199 @@ def run_assessment(supplier_id: int, db: Session, user_id: int | None = None):
         "graph_risk_score": graph_risk,
         "explanations": reasons,
         "executive_brief": executive_brief,
+        # Modules that timed out or failed scored their fallback (0)
+        "module_timings_ms": timings,
+        "module_failures": failures,
         "breakdown": {
             "sanctions": config.sanctions_weight if sanctions_result and sanctions_result.get("overall_status") == "FAIL" else 0,
             "section_889": config.section889_fail_weight if section_status == "FAIL" else (config.section889_conditional_weight if section_status == "CONDITIONAL" else 0),
             "news": news_score or 0,
             "graph": graph_risk or 0,
         }
-    }
\ No newline at end of file
+    }
+
+    return history_values, response
+
+
+def run_assessment(
+    supplier_id: int,
+    db: Session,
+    user_id: int | None = None,
+    screening: tuple | None = None,
+):
+
+    # ------------------------------------------------------------------
+    # Fetch Supplier
+    # ------------------------------------------------------------------
+    supplier = db.query(Supplier).filter_by(id=supplier_id).first()
+
+    if not supplier:
+        return {"error": "Supplier not found"}
+
+    supplier_name = supplier.name
+
+    # ------------------------------------------------------------------
+    # Load Scoring Configuration
+    # ------------------------------------------------------------------
+    config = get_active_scoring_config(db)
+
+    # ------------------------------------------------------------------
+    # Run Individual Risk Modules
+    # ------------------------------------------------------------------
+    # News and graph lookups are independent network round trips: start
+    # both, screen on this thread (it needs the session), then collect
+    # each within its deadline. Latency is the slowest module, not the sum.
+    timings = {}
+    failures = {}
+
+    news_module = start_module(news_risk_signal, supplier_name)
+    graph_module = start_module(neighborhoods, [supplier_name])
+
+    # Bulk callers pass (sanctions_result, section889_result) from screen_batch
+    if screening is None:
+        started = time.perf_counter()
+        screening = screen_supplier(supplier, db)
+        timings["screening"] = round((time.perf_counter() - started) * 1000, 1)
+
+    sanctions_result, section889_result = screening
+
+    news_score = collect_module("news", news_module, NEWS_TIMEOUT_SECONDS, 0, timings, failures)
+    related = collect_module("graph", graph_module, GRAPH_TIMEOUT_SECONDS, None, timings, failures)
+    if related is not None:
+        related = related.get(supplier_name, [])
+
+    graph_risk = risk_from_neighborhood(related) if related is not None else 0
+
+    history_values, response = build_assessment(
+        supplier,
+        config,
+        sanctions_result,
+        section889_result,
+        news_score,
+        graph_risk,
+        timings,
+        failures,
+        input_fingerprint(supplier, config, get_watchlist_index(db).version, related),
+        user_id,
+    )
+
+# ------------------------------------------------------------------
+# Persist Assessment History (FULL SNAPSHOT)
+# ------------------------------------------------------------------
+    db.add(AssessmentHistory(**history_values))
+    db.commit()
+
+    return response
+
+
+def news_signals(names: list[str]):
+    """
+    Runs the news module for each distinct name, a pool's width at a
+    time so every call gets its full deadline.
+
+    Returns {name: (score, elapsed_ms, failure or None)}.
+    """
+    signals = {}
+
+    for offset in range(0, len(names), ASSESSMENT_MODULE_WORKERS):
+        wave = [
+            (name, start_module(news_risk_signal, name))
+            for name in names[offset:offset + ASSESSMENT_MODULE_WORKERS]
+        ]
+
+        for name, module in wave:
+            timings = {}
+            failures = {}
+            score = collect_module("news", module, NEWS_TIMEOUT_SECONDS, 0, timings, failures)
+            signals[name] = (score, timings["news"], failures.get("news"))
+
+    return signals
+
+
+def run_assessment_batch(
+    supplier_ids: list[int],
+    db: Session,
+    user_id: int | None = None,
+    commit: bool = True,
+):
+    """
+    Assesses many suppliers with shared work: one supplier query, one
+    scoring config, one screen_batch pass, one UNWIND graph query and news
+    calls per distinct name, then AssessmentHistory rows bulk-inserted in
+    ASSESSMENT_INSERT_CHUNK_SIZE transactions.
+
+    Returns {supplier_id: payload} with the same payload as run_assessment
+    fed the screen_batch results; suppliers that do not exist are omitted.
+    With commit=False the rows are left for the caller to commit (together
+    with its own checkpoint).
+    """
+    suppliers = (
+        db.query(Supplier)
+        .filter(Supplier.id.in_(supplier_ids))
+        .order_by(Supplier.id)
+        .all()
+    )
+
+    if not suppliers:
+        return {}
+
+    config = get_active_scoring_config(db)
+
+    names = sorted({supplier.name for supplier in suppliers})
+
+    # The graph query runs while the portfolio is screened and news fetched
+    graph_failures = {}
+    batch_timings = {}
+    graph_module = start_module(neighborhoods, names)
+
+    started = time.perf_counter()
+    screenings = screen_batch([supplier.id for supplier in suppliers], db)
+    batch_timings["screening"] = round((time.perf_counter() - started) * 1000, 1)
+
+    signals = news_signals(names)
+
+    graph = collect_module(
+        "graph", graph_module, GRAPH_BATCH_TIMEOUT_SECONDS, None, batch_timings, graph_failures
+    )
+
+    list_version = get_watchlist_index(db).version
+
+    results = {}
+    rows = []
+
+    for supplier in suppliers:
+        news_score, news_ms, news_failure = signals[supplier.name]
+
+        timings = dict(batch_timings, news=news_ms)
+        failures = dict(graph_failures)
+        if news_failure:
+            failures["news"] = news_failure
+
+        screening = screenings[supplier.id]
+        related = graph.get(supplier.name, []) if graph is not None else None
+
+        history_values, results[supplier.id] = build_assessment(
+            supplier,
+            config,
+            screening["sanctions"],
+            screening["section_889"],
+            news_score,
+            risk_from_neighborhood(related) if related is not None else 0,
+            timings,
+            failures,
+            input_fingerprint(supplier, config, list_version, related),
+            user_id,
+        )
+        rows.append(history_values)
+
+    # Core executemany: one round trip per chunk instead of a unit of work per row
+    for offset in range(0, len(rows), ASSESSMENT_INSERT_CHUNK_SIZE):
+        db.execute(
+            AssessmentHistory.__table__.insert(),
+            rows[offset:offset + ASSESSMENT_INSERT_CHUNK_SIZE],
+        )
+
+        if commit:
+            db.commit()
+
+    return results
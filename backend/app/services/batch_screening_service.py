@@ -0,0 +1,87 @@
+import os
+from sqlalchemy.orm import Session
+
+from app.models import Supplier
+from app.services.screening_index import (
+    normalize,
+    get_watchlist_index,
+    WatchlistIndex,
+)
+from app.services.screening_engine import LIST_THRESHOLDS, SCAN_CUTOFF, build_screening_results
+from app.services.screening_executor import score_names, screening_executor
+
+
+# rapidfuzz worker threads when no process pool is configured (-1 = all cores)
+BATCH_WORKERS = int(os.getenv("SCREENING_BATCH_WORKERS", "-1"))
+
+
+def score_matrix_hits(queries: list[str], index: WatchlistIndex, score_cutoff: float):
+    """
+    Returns, per query, the (entry, score) pairs at or above score_cutoff,
+    scoring against the full list either on the screening process pool
+    (SCREENING_PROCESSES > 0) or with in-process cdist threads.
+    """
+    if screening_executor is not None:
+        scored = screening_executor.score(queries, index.names, score_cutoff)
+    else:
+        scored = score_names(queries, index.names, score_cutoff, workers=BATCH_WORKERS)
+
+    results = []
+
+    for query_hits in scored:
+        hits = [
+            (index.entry(position), score)
+            for position, score in query_hits
+            if index.active_array[position]
+        ]
+        hits.sort(key=lambda hit: hit[1], reverse=True)
+        results.append(hits)
+
+    return results
+
+
+def screen_batch(supplier_ids: list[int], db: Session):
+    """
+    Screens many suppliers against every watchlist in one pass.
+
+    Returns {supplier_id: {"sanctions": ..., "section_889": ...}} where each
+    value has the same shape as check_sanctions / evaluate_section_889.
+    """
+    suppliers = (
+        db.query(Supplier)
+        .filter(Supplier.id.in_(supplier_ids))
+        .order_by(Supplier.id)
+        .all()
+    )
+
+    index = get_watchlist_index(db)
+
+    # Suppliers registered by several tenants share a normalized name;
+    # score each distinct name once.
+    names = sorted({normalize(supplier.name) for supplier in suppliers})
+    hits_by_name = dict(zip(names, score_matrix_hits(names, index, SCAN_CUTOFF)))
+
+    # Per list, as check_sanctions / evaluate_section_889 report them. The
+    # matrix scores every entry, so nothing is pruned; per-call timings
+    # and tiers do not apply to a batch and are left out
+    list_stats = {
+        list_name: {
+            "list_size": index.list_sizes[list_name],
+            "candidates_scored": index.list_sizes[list_name],
+            "pruning_ratio": 0.0,
+        }
+        for list_name in LIST_THRESHOLDS
+    }
+
+    results = {}
+
+    for supplier in suppliers:
+        sanctions_result, section889_result = build_screening_results(
+            supplier, hits_by_name[normalize(supplier.name)], {}, list_stats
+        )
+        results[supplier.id] = {
+            "sanctions": sanctions_result,
+            "section_889": section889_result,
+        }
+
+    return results
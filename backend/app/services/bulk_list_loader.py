@@ -0,0 +1,191 @@
+import csv
+import io
+import time
+from datetime import datetime
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session
+
+from app.models import IngestionRun, WatchlistChange
+from app.services.external_intelligence_service import (
+    normalize,
+    load_entity_map,
+    resolve_entities,
+)
+from app.services.screening_index import apply_watchlist_changes, get_watchlist_index
+
+
+# Rows resolved and written per round trip
+LOAD_CHUNK_SIZE = 50000
+
+
+def read_list_csv(filepath: str):
+    with open(filepath, newline="", encoding="utf-8") as csvfile:
+        yield from csv.DictReader(csvfile)
+
+
+def chunked(rows, size: int = LOAD_CHUNK_SIZE):
+    chunk = []
+
+    for row in rows:
+        chunk.append(row)
+
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+def copy_rows(db: Session, table, rows: list[dict]):
+    """Streams rows into a Postgres table with COPY ... FROM STDIN."""
+    columns = list(rows[0])
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow(row[column] for column in columns)
+    buffer.seek(0)
+
+    cursor = db.connection().connection.cursor()
+    cursor.copy_expert(
+        f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+        buffer,
+    )
+
+
+def insert_rows(db: Session, list_model, rows: list[dict]):
+    if not rows:
+        return
+
+    if db.get_bind().dialect.name == "postgresql":
+        copy_rows(db, list_model.__table__, rows)
+    else:
+        # Core executemany: the ORM bulk path splits batches on NULL columns
+        db.execute(list_model.__table__.insert(), rows)
+
+
+def bulk_load_list(db: Session, list_model, list_name: str, rows) -> int:
+    """
+    Loads (name, values) pairs into a watchlist table in one transaction,
+    recorded as a "<list_name>_CSV" IngestionRun.
+
+    Names resolve to GlobalEntity through an in-memory normalized-name map
+    (unknown names are bulk-created), entries already listed for the same
+    (source, entity) are skipped, tombstoned ones are relisted in place,
+    and new rows are written with COPY on Postgres or executemany
+    elsewhere. Every listed entry is mirrored as an ADDED WatchlistChange
+    row and the live index is patched with the run's diff.
+
+    Returns the number of list entries listed.
+    """
+    started = time.perf_counter()
+
+    ingestion = IngestionRun(
+        feed_name=f"{list_name}_CSV",
+        status="RUNNING",
+        started_at=datetime.utcnow(),
+    )
+    db.add(ingestion)
+    db.commit()
+
+    # Load the index before writing, so the list version the load starts
+    # from is known when its changes are applied
+    get_watchlist_index(db)
+
+    try:
+        entities = load_entity_map(db)
+
+        # (source, entity_id) -> (list entry id, is_active); an active row
+        # wins over tombstones of the same key
+        listed = {}
+        for entry_id, source, entity_id, is_active in (
+            db.query(list_model.id, list_model.source, list_model.entity_id, list_model.is_active)
+            .order_by(list_model.is_active, list_model.id)
+        ):
+            listed[(source, entity_id)] = (entry_id, is_active)
+
+        # Before the load, so inserted rows can be read back for their ids
+        # (COPY returns none)
+        last_id = db.query(func.max(list_model.id)).scalar() or 0
+
+        inserted = {}
+        changes = []
+        rows_parsed = 0
+
+        for chunk in chunked(rows):
+            rows_parsed += len(chunk)
+            resolve_entities(db, entities, {normalize(name): name for name, _ in chunk})
+
+            new_rows = []
+            relisted = []
+
+            for name, values in chunk:
+                entity_id, canonical_name = entities[normalize(name)]
+                key = (values["source"], entity_id)
+                known = listed.get(key)
+
+                if known is not None and known[1]:
+                    continue
+
+                listed[key] = (known[0] if known else None, True)
+
+                if known is not None:
+                    relisted.append(dict(values, id=known[0], is_active=True, delisted_at=None))
+                    changes.append(change_row(known[0], entity_id, canonical_name))
+                else:
+                    new_rows.append(dict(values, entity_id=entity_id, is_active=True))
+                    inserted[key] = canonical_name
+
+            insert_rows(db, list_model, new_rows)
+
+            if relisted:
+                db.execute(update(list_model), relisted)
+
+        for entry_id, source, entity_id in (
+            db.query(list_model.id, list_model.source, list_model.entity_id)
+            .filter(list_model.id > last_id)
+        ):
+            if (source, entity_id) in inserted:
+                changes.append(change_row(entry_id, entity_id, inserted[(source, entity_id)]))
+
+        for chunk in chunked(changes):
+            db.execute(
+                WatchlistChange.__table__.insert(),
+                [dict(change, ingestion_run_id=ingestion.id, list_name=list_name) for change in chunk],
+            )
+
+        seconds = time.perf_counter() - started
+
+        ingestion.status = "SUCCESS"
+        ingestion.record_count = len(changes)
+        ingestion.rows_parsed = rows_parsed
+        ingestion.rows_per_sec = rows_parsed / seconds if seconds > 0 else None
+        ingestion.completed_at = datetime.utcnow()
+        db.commit()
+
+    except Exception as e:
+        # Discard the partial load; the run record was committed above
+        db.rollback()
+
+        ingestion.status = "FAILED"
+        ingestion.error_message = str(e)
+        ingestion.completed_at = datetime.utcnow()
+        db.commit()
+        raise
+
+    # Patch the in-memory matcher with this run's diff
+    if changes:
+        apply_watchlist_changes(db, ingestion.id)
+
+    return len(changes)
+
+
+def change_row(list_entry_id: int, entity_id: int, name: str) -> dict:
+    return {
+        "list_entry_id": list_entry_id,
+        "change_type": "ADDED",
+        "entity_id": entity_id,
+        "name": name,
+        "previous_name": None,
+    }
@@ -1,15 +1,27 @@
-import csv
+from datetime import datetime
 from sqlalchemy.orm import Session
 from app.models import CoveredEntity
+from app.services.bulk_list_loader import read_list_csv, bulk_load_list
+
+
+DEFAULT_DESIGNATION = "Section 889(a)(1)(B)"
 
 
 def load_covered_entities(db: Session, filepath: str):
-    with open(filepath, newline='', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            existing = db.query(CoveredEntity).filter_by(name=row["name"]).first()
-            if not existing:
-                entity = CoveredEntity(name=row["name"])
-                db.add(entity)
-
-        db.commit()
+    """CSV columns: name, optional designation and source."""
+    loaded_at = datetime.utcnow()
+
+    rows = (
+        (
+            row["name"].strip(),
+            {
+                "designation": (row.get("designation") or "").strip() or DEFAULT_DESIGNATION,
+                "source": (row.get("source") or "").strip() or "Section 889",
+                "created_at": loaded_at,
+            },
+        )
+        for row in read_list_csv(filepath)
+        if row.get("name", "").strip()
+    )
+
+    return bulk_load_list(db, CoveredEntity, "SECTION_889", rows)
@@ -0,0 +1,61 @@
+from sqlalchemy.orm import Session
+
+from app.models import WatchlistChange
+from app.services.batch_screening_service import screen_batch
+from app.services.reverse_screening_service import annotate_affected_suppliers
+from app.services.supplier_comparison_service import get_latest_assessment
+from app.services.assessment_service import run_assessment
+
+
+def screening_flipped(screening: dict, latest_assessment) -> bool:
+    if latest_assessment is None:
+        return True
+
+    sanctions_flag = screening["sanctions"].get("overall_status") == "FAIL"
+    section_status = screening["section_889"].get("section_889_status")
+
+    return (
+        sanctions_flag != latest_assessment.sanctions_flag
+        or section_status != latest_assessment.section889_status
+    )
+
+
+def rescreen_watchlist_delta(ingestion_run_id: int, db: Session):
+    """
+    Re-assesses only suppliers whose screening outcome changed because of
+    the list entries added, changed or removed by one ingestion run.
+    """
+    changes = (
+        db.query(WatchlistChange)
+        .filter(WatchlistChange.ingestion_run_id == ingestion_run_id)
+        .all()
+    )
+
+    if not changes:
+        return {
+            "changed_entries": 0,
+            "suppliers_touched": 0,
+            "suppliers_reassessed": 0,
+        }
+
+    if any(change.affected_supplier_ids is None for change in changes):
+        touched = annotate_affected_suppliers(ingestion_run_id, db)
+    else:
+        touched = {
+            supplier_id
+            for change in changes
+            for supplier_id in change.affected_supplier_ids
+        }
+
+    reassessed = 0
+
+    for supplier_id, screening in screen_batch(sorted(touched), db).items():
+        if screening_flipped(screening, get_latest_assessment(supplier_id, db)):
+            run_assessment(supplier_id, db)
+            reassessed += 1
+
+    return {
+        "changed_entries": len(changes),
+        "suppliers_touched": len(touched),
+        "suppliers_reassessed": reassessed,
+    }
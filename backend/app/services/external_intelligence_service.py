@@ -1,109 +1,1139 @@
+import asyncio
+import csv
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+import httpx
 import requests
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.orm import Session
 from datetime import datetime
 from rapidfuzz import fuzz
 
-from app.models import GlobalEntity, SanctionedEntity, CoveredEntity
+from app.models import (
+    GlobalEntity,
+    GlobalEntityAlias,
+    SanctionedEntity,
+    CoveredEntity,
+    IngestionRun,
+    WatchlistChange,
+)
 
 
-OFAC_SDN_URL = "https://www.treasury.gov/ofac/downloads/sdn.csv"
-BIS_ENTITY_LIST_URL = "https://www.bis.doc.gov/index.php/documents/consolidated-entity-list/1072-el-entity-list-csv/file"
+# Overridable so ingestion can run against a local feed stand-in
+OFAC_SDN_URL = os.getenv("OFAC_SDN_URL", "https://www.treasury.gov/ofac/downloads/sdn.csv")
+OFAC_ALT_URL = os.getenv("OFAC_ALT_URL", "https://www.treasury.gov/ofac/downloads/alt.csv")
+BIS_ENTITY_LIST_URL = os.getenv(
+    "BIS_ENTITY_LIST_URL",
+    "https://www.bis.doc.gov/index.php/documents/consolidated-entity-list/1072-el-entity-list-csv/file",
+)
 
 
 MATCH_THRESHOLD = 88
 
+# Rows normalized and written per bulk INSERT
+INGEST_BATCH_SIZE = 5000
+
+# Feed downloads: shared connection pool, retries with exponential backoff
+FEED_MAX_CONNECTIONS = 10
+FEED_MAX_RETRIES = int(os.getenv("FEED_MAX_RETRIES", "3"))
+FEED_BACKOFF_SECONDS = float(os.getenv("FEED_BACKOFF_SECONDS", "2"))
+FEED_RETRY_STATUSES = {429, 500, 502, 503, 504}
+
 
 def normalize(text: str) -> str:
     return text.lower().replace(",", "").replace(".", "").strip()
 
 
+@contextmanager
+def timed(timings: dict, stage: str):
+    """Adds the block's wall time, in ms, to timings[stage]."""
+    started = time.perf_counter()
+
+    try:
+        yield
+    finally:
+        timings[stage] = timings.get(stage, 0.0) + (time.perf_counter() - started) * 1000
+
+
+class FeedUnchanged(Exception):
+    """
+    Raised before parsing when a feed matches the last processed download
+    (HTTP 304 or identical content hash).
+    """
+
+
 # =====================================================
-# OFAC LIVE INGESTION
+# CONDITIONAL FEED FETCH (POOLED ASYNC HTTP)
 # =====================================================
-def refresh_ofac_data(db: Session):
-    response = requests.get(OFAC_SDN_URL, timeout=30)
-    response.raise_for_status()
+def last_feed_run(db: Session, feed_name: str):
+    """
+    Most recent run of a feed whose download was fully processed; its
+    validators drive the next conditional request.
+    """
+    return (
+        db.query(IngestionRun)
+        .filter(
+            IngestionRun.feed_name == feed_name,
+            IngestionRun.status.in_(["SUCCESS", "NO_CHANGE"]),
+            IngestionRun.content_hash.isnot(None),
+        )
+        .order_by(IngestionRun.id.desc())
+        .first()
+    )
+
+
+def feed_validators(db: Session, feed_name: str) -> dict | None:
+    previous = last_feed_run(db, feed_name)
+
+    if previous is None:
+        return None
+
+    return {
+        "etag": previous.etag,
+        "last_modified": previous.last_modified,
+        "content_hash": previous.content_hash,
+    }
+
+
+def feed_client() -> httpx.AsyncClient:
+    """One pooled client shared by every feed fetched in a run."""
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(30.0),
+        limits=httpx.Limits(max_connections=FEED_MAX_CONNECTIONS),
+        follow_redirects=True,
+    )
+
+
+async def _download(client: httpx.AsyncClient, url: str, headers: dict) -> dict:
+    async with client.stream("GET", url, headers=headers) as response:
+        if response.status_code == 304:
+            return {
+                "not_modified": True,
+                "bytes": response.num_bytes_downloaded,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
+
+        response.raise_for_status()
+
+        # Spooled to disk so parser processes can read it by path
+        body = tempfile.NamedTemporaryFile(suffix=".csv", delete=False)
+        digest = hashlib.sha256()
+
+        try:
+            async for chunk in response.aiter_bytes(1 << 16):
+                digest.update(chunk)
+                body.write(chunk)
+        except BaseException:
+            body.close()
+            os.unlink(body.name)
+            raise
+
+        body.close()
+
+        return {
+            "not_modified": False,
+            "path": body.name,
+            "bytes": response.num_bytes_downloaded,
+            "encoding": response.encoding or "utf-8",
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "content_hash": digest.hexdigest(),
+        }
+
+
+async def download_feed(
+    client: httpx.AsyncClient,
+    url: str,
+    previous: dict | None,
+    timeout: float,
+) -> dict:
+    """
+    Conditionally downloads a feed with a per-attempt timeout, retrying
+    transport errors, timeouts and 429/5xx responses with exponential
+    backoff.
+    """
+    headers = {}
+    if previous:
+        if previous["etag"]:
+            headers["If-None-Match"] = previous["etag"]
+        if previous["last_modified"]:
+            headers["If-Modified-Since"] = previous["last_modified"]
+
+    started = time.perf_counter()
+
+    for attempt in range(FEED_MAX_RETRIES + 1):
+        try:
+            download = await asyncio.wait_for(_download(client, url, headers), timeout)
+
+            # Includes retries and backoff, i.e. what the feed cost us
+            download["download_ms"] = (time.perf_counter() - started) * 1000
+            return download
+
+        except (httpx.TransportError, httpx.HTTPStatusError, asyncio.TimeoutError) as e:
+            retryable = (
+                not isinstance(e, httpx.HTTPStatusError)
+                or e.response.status_code in FEED_RETRY_STATUSES
+            )
+
+            if not retryable or attempt == FEED_MAX_RETRIES:
+                if isinstance(e, asyncio.TimeoutError):
+                    raise TimeoutError(
+                        f"{url} timed out after {timeout}s ({attempt + 1} attempts)"
+                    ) from e
+                raise
+
+            await asyncio.sleep(FEED_BACKOFF_SECONDS * 2 ** attempt)
+
+
+def feed_unchanged(download: dict, previous: dict | None) -> bool:
+    if download["not_modified"]:
+        return True
+
+    return previous is not None and previous["content_hash"] == download["content_hash"]
+
+
+# =====================================================
+# STREAMING CSV INGESTION
+# =====================================================
+def read_csv_rows(body, encoding: str, start_offset: int = 0):
+    """
+    Yields (row, end_offset) for a downloaded feed opened in binary mode,
+    without loading it into memory; a real CSV parser keeps quoted names
+    with commas or line breaks intact.
+
+    end_offset is the byte position just past the row, so a later run can
+    seek straight to it and resume.
+    """
+    body.seek(start_offset)
+    position = start_offset
+
+    def lines():
+        nonlocal position
+
+        for line in body:
+            position += len(line)
+            yield line.decode(encoding, errors="replace")
+
+    # csv.reader pulls lines only until the current record is complete
+    for row in csv.reader(lines()):
+        yield row, position
+
+
+def batched(rows, size: int = INGEST_BATCH_SIZE):
+    batch = []
+
+    for row in rows:
+        batch.append(row)
+
+        if len(batch) >= size:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
+
+
+def feed_row_hash(row: list[str]) -> str:
+    return hashlib.sha1("\x1f".join(cell.strip() for cell in row).encode()).hexdigest()
+
+
+def load_entity_map(db: Session) -> dict:
+    """
+    normalized_name -> (entity_id, canonical_name); lowest id wins, as the
+    per-row lookup used to return the first match.
+    """
+    entities = {}
+
+    for entity_id, canonical_name, normalized_name in (
+        db.query(GlobalEntity.id, GlobalEntity.canonical_name, GlobalEntity.normalized_name)
+        .order_by(GlobalEntity.id)
+    ):
+        entities.setdefault(normalized_name, (entity_id, canonical_name))
+
+    return entities
+
+
+def resolve_entities(db: Session, entities: dict, names: dict) -> int:
+    """
+    Bulk-inserts GlobalEntity rows for normalized names not yet known and
+    returns how many were created.
+    """
+    new_entities = [
+        {
+            "canonical_name": name,
+            "normalized_name": normalized,
+            "entity_type": "COMPANY",
+        }
+        for normalized, name in names.items()
+        if normalized not in entities
+    ]
 
-    lines = response.text.splitlines()
-    headers = lines[0].split(",")
+    if not new_entities:
+        return 0
+
+    created = db.execute(
+        insert(GlobalEntity).returning(
+            GlobalEntity.id,
+            GlobalEntity.canonical_name,
+            GlobalEntity.normalized_name,
+            sort_by_parameter_order=True,
+        ),
+        new_entities,
+    )
+
+    for entity_id, canonical_name, normalized_name in created:
+        entities[normalized_name] = (entity_id, canonical_name)
+
+    return len(new_entities)
+
+
+def entity_names(db: Session, entity_ids) -> dict:
+    return dict(
+        db.query(GlobalEntity.id, GlobalEntity.canonical_name)
+        .filter(GlobalEntity.id.in_(set(entity_ids)))
+        .all()
+    )
+
+
+def reconcile_watchlist(
+    db: Session,
+    ingestion: IngestionRun,
+    records,
+    list_model,
+    list_name: str,
+    source: str,
+    list_fields: dict | None = None,
+    seen: set | None = None,
+    checkpoint=None,
+):
+    """
+    Applies one full feed snapshot to a list table.
 
-    added_count = 0
+    Records ({source_key, name, row_hash, fields}) are matched to the
+    previous snapshot by source_key and compared by row_hash, so only the
+    diff is written: new keys are bulk-inserted, changed or relisted rows
+    are updated in place, and active keys missing from the feed are
+    tombstoned (is_active=False) rather than deleted. Every write is
+    mirrored as a WatchlistChange row, except adopting a pre-reconciliation
+    row whose fields the feed leaves unchanged (only its key is claimed).
 
-    for line in lines[1:]:
-        cols = line.split(",")
-        name = cols[1] if len(cols) > 1 else None
+    Records are written in INGEST_BATCH_SIZE chunks; after each chunk
+    checkpoint(offset) is called with the byte offset past its last row
+    (the caller commits there). seen holds keys of rows already applied
+    by an earlier, interrupted run.
+
+    Resolve vs write time and entities created vs matched are recorded on
+    the run. Returns the number of list entries changed.
+    """
+    started = time.perf_counter()
+    timings = {"write": 0.0}
+    entities_created = 0
+    entities_matched = 0
+
+    list_fields = list_fields or {}
+    entities = load_entity_map(db)
+
+    # source_key -> (list entry id, row_hash, entity_id, is_active)
+    previous = {
+        source_key: (entry_id, row_hash, entity_id, is_active)
+        for entry_id, source_key, row_hash, entity_id, is_active in (
+            db.query(
+                list_model.id,
+                list_model.source_key,
+                list_model.row_hash,
+                list_model.entity_id,
+                list_model.is_active,
+            )
+            .filter(list_model.source == source, list_model.source_key.isnot(None))
+        )
+    }
+
+    # Rows loaded before reconciliation existed are adopted by entity;
+    # entity_id -> their row, to tell whether adoption changes a field
+    unkeyed = {
+        row["entity_id"]: row
+        for row in db.execute(
+            select(list_model.__table__).where(
+                list_model.source == source,
+                list_model.source_key.is_(None),
+                list_model.is_active,
+            )
+        ).mappings()
+    }
 
-        if not name:
+    seen = set(seen or ())
+    change_count = 0
+
+    for batch in batched(records):
+        # ------------------------------------------------------------------
+        # Keep only new, changed or relisted rows
+        # ------------------------------------------------------------------
+        fresh = []
+
+        for record in batch:
+            source_key = record["source_key"]
+
+            if source_key in seen:
+                continue
+
+            seen.add(source_key)
+            known = previous.get(source_key)
+
+            if known is None or known[1] != record["row_hash"] or not known[3]:
+                fresh.append(record)
+
+        if not fresh:
+            if checkpoint:
+                checkpoint(batch[-1]["offset"])
             continue
 
-        normalized = normalize(name)
+        fresh_names = {normalize(record["name"]): record["name"] for record in fresh}
+        entities_matched += sum(1 for normalized in fresh_names if normalized in entities)
+
+        with timed(timings, "write"):
+            entities_created += resolve_entities(db, entities, fresh_names)
 
-        entity = db.query(GlobalEntity).filter_by(normalized_name=normalized).first()
+        renamed_from = entity_names(
+            db,
+            [
+                previous[record["source_key"]][2]
+                for record in fresh
+                if record["source_key"] in previous
+            ],
+        )
+
+        inserts = []
+        updates = []
+        changes = []
 
-        if not entity:
-            entity = GlobalEntity(
-                canonical_name=name,
-                normalized_name=normalized,
-                entity_type="COMPANY",
+        for record in fresh:
+            entity_id, canonical_name = entities[normalize(record["name"])]
+            values = dict(
+                list_fields,
+                **record["fields"],
+                source=source,
+                source_key=record["source_key"],
+                row_hash=record["row_hash"],
+                entity_id=entity_id,
+                is_active=True,
+                delisted_at=None,
             )
-            db.add(entity)
-            db.commit()
-            db.refresh(entity)
+            known = previous.get(record["source_key"])
+
+            if known is None:
+                adopted = unkeyed.pop(entity_id, None)
+
+                if adopted is None:
+                    inserts.append((values, canonical_name))
+                    continue
+
+                # Already listed under this entity; claim the key, and
+                # record a change if the feed row differs from the old load
+                updates.append(dict(values, id=adopted["id"]))
+
+                if any(adopted[field] != value for field, value in {**list_fields, **record["fields"]}.items()):
+                    changes.append(
+                        {
+                            "list_entry_id": adopted["id"],
+                            "change_type": "CHANGED",
+                            "entity_id": entity_id,
+                            "name": canonical_name,
+                            "previous_name": None,
+                        }
+                    )
 
-        existing = db.query(SanctionedEntity).filter_by(name=name).first()
+                continue
 
-        if not existing:
-            sanction = SanctionedEntity(
-                name=name,
-                source="OFAC",
-                entity_id=entity.id,
+            entry_id, _, previous_entity_id, is_active = known
+            updates.append(dict(values, id=entry_id))
+
+            changes.append(
+                {
+                    "list_entry_id": entry_id,
+                    "change_type": "CHANGED" if is_active else "ADDED",
+                    "entity_id": entity_id,
+                    "name": canonical_name,
+                    "previous_name": (
+                        renamed_from.get(previous_entity_id)
+                        if is_active and previous_entity_id != entity_id
+                        else None
+                    ),
+                }
             )
-            db.add(sanction)
-            added_count += 1
 
-    db.commit()
-    return added_count
+        with timed(timings, "write"):
+            if inserts:
+                # Core insert: the ORM bulk path splits batches wherever a
+                # column flips between NULL and a value, then re-splices the
+                # RETURNING rows per split, which is quadratic on big loads
+                table = list_model.__table__
+                list_ids = db.execute(
+                    table.insert().returning(table.c.id, sort_by_parameter_order=True),
+                    [values for values, _ in inserts],
+                ).scalars().all()
+
+                changes.extend(
+                    {
+                        "list_entry_id": list_entry_id,
+                        "change_type": "ADDED",
+                        "entity_id": values["entity_id"],
+                        "name": canonical_name,
+                        "previous_name": None,
+                    }
+                    for list_entry_id, (values, canonical_name) in zip(list_ids, inserts)
+                )
+
+            if updates:
+                db.execute(update(list_model), updates)
+
+            if changes:
+                db.execute(
+                    WatchlistChange.__table__.insert(),
+                    [
+                        dict(change, ingestion_run_id=ingestion.id, list_name=list_name)
+                        for change in changes
+                    ],
+                )
+
+        change_count += len(changes)
+
+        if checkpoint:
+            with timed(timings, "write"):
+                checkpoint(batch[-1]["offset"])
+
+    # ------------------------------------------------------------------
+    # Tombstone keys that dropped off the feed
+    # ------------------------------------------------------------------
+    if not seen:
+        raise ValueError(f"{source} feed returned no entries; refusing to delist the whole list")
+
+    delisted = [
+        (entry_id, entity_id)
+        for source_key, (entry_id, _, entity_id, is_active) in previous.items()
+        if is_active and source_key not in seen
+    ]
+
+    delisted_at = datetime.utcnow()
+
+    for batch in batched(delisted):
+        names = entity_names(db, [entity_id for _, entity_id in batch])
+
+        with timed(timings, "write"):
+            db.execute(
+                update(list_model),
+                [
+                    {"id": entry_id, "is_active": False, "delisted_at": delisted_at}
+                    for entry_id, _ in batch
+                ],
+            )
+            db.execute(
+                WatchlistChange.__table__.insert(),
+                [
+                    {
+                        "ingestion_run_id": ingestion.id,
+                        "list_name": list_name,
+                        "change_type": "REMOVED",
+                        "list_entry_id": entry_id,
+                        "entity_id": entity_id,
+                        "name": names[entity_id],
+                        "previous_name": None,
+                    }
+                    for entry_id, entity_id in batch
+                ],
+            )
+
+        change_count += len(batch)
+
+    ingestion.db_write_ms = timings["write"]
+    ingestion.resolve_ms = (time.perf_counter() - started) * 1000 - timings["write"]
+    ingestion.entities_created = entities_created
+    ingestion.entities_matched = entities_matched
+
+    return change_count
+
+
+def list_entries_by_entity(db: Session, entity_ids) -> dict:
+    """entity_id -> [(list_name, list entry id)] for the entities' active entries."""
+    entries = defaultdict(list)
+    entity_ids = set(entity_ids)
+
+    for list_name, list_model in (("SANCTIONS", SanctionedEntity), ("SECTION_889", CoveredEntity)):
+        for entry_id, entity_id in (
+            db.query(list_model.id, list_model.entity_id)
+            .filter(list_model.entity_id.in_(entity_ids), list_model.is_active)
+        ):
+            entries[entity_id].append((list_name, entry_id))
+
+    return entries
+
+
+def record_alias_changes(db: Session, ingestion: IngestionRun, changed: list[tuple]):
+    """
+    Mirrors alias writes ((change_type, entity_id, alias, previous_alias))
+    as WatchlistChange rows on every active list entry of the entity.
+    """
+    if not changed:
+        return
+
+    entries = list_entries_by_entity(db, [entity_id for _, entity_id, _, _ in changed])
+
+    rows = [
+        {
+            "ingestion_run_id": ingestion.id,
+            "list_name": list_name,
+            "change_type": change_type,
+            "list_entry_id": entry_id,
+            "entity_id": entity_id,
+            "name": alias,
+            "previous_name": previous_alias,
+        }
+        for change_type, entity_id, alias, previous_alias in changed
+        for list_name, entry_id in entries.get(entity_id, ())
+    ]
+
+    if rows:
+        db.execute(WatchlistChange.__table__.insert(), rows)
+
+
+def reconcile_aliases(
+    db: Session,
+    ingestion: IngestionRun,
+    records,
+    list_model,
+    source: str,
+    seen: set | None = None,
+    checkpoint=None,
+):
+    """
+    Applies one full alias-file snapshot to GlobalEntityAlias.
 
+    Records ({source_key, parent_key, name}) attach to the entity of the
+    list entry whose source_key is parent_key. normalized_alias is
+    computed here, once, and aliases are deduplicated per entity on it
+    (against the primary name, earlier rows of the file and aliases that
+    entity resolution recorded). The rest is diffed by source_key: new
+    aliases are bulk-inserted, renamed ones updated in place, and feed
+    aliases missing from the file deleted.
+
+    Every alias write is mirrored as an ALIAS_* WatchlistChange row on each
+    active list entry of the entity, so apply_watchlist_changes re-indexes
+    only those entries. Batching, checkpoints and telemetry work as in
+    reconcile_watchlist. Returns the number of aliases changed.
+    """
+    started = time.perf_counter()
+    timings = {"write": 0.0}
+    entities_matched = 0
+    unresolved = 0
+    received = 0
+    now = datetime.utcnow()
+
+    # parent source_key -> (entity_id, normalized primary name)
+    parents = {
+        source_key: (entity_id, normalized_name)
+        for source_key, entity_id, normalized_name in (
+            db.query(list_model.source_key, list_model.entity_id, GlobalEntity.normalized_name)
+            .join(GlobalEntity, list_model.entity_id == GlobalEntity.id)
+            .filter(list_model.source == source, list_model.source_key.isnot(None))
+        )
+    }
+
+    # source_key -> (alias id, entity_id, alias, normalized_alias)
+    previous = {
+        source_key: (alias_id, entity_id, alias, normalized_alias)
+        for alias_id, source_key, entity_id, alias, normalized_alias in (
+            db.query(
+                GlobalEntityAlias.id,
+                GlobalEntityAlias.source_key,
+                GlobalEntityAlias.entity_id,
+                GlobalEntityAlias.alias,
+                GlobalEntityAlias.normalized_alias,
+            )
+            .filter(GlobalEntityAlias.source == source)
+        )
+    }
+
+    # (entity_id, normalized_alias) pairs an incoming alias must not repeat
+    taken = set(
+        db.query(GlobalEntityAlias.entity_id, GlobalEntityAlias.normalized_alias)
+        .filter(GlobalEntityAlias.source.is_(None))
+        .all()
+    )
+
+    seen = set(seen or ())
+    taken.update(
+        (known[1], known[3]) for source_key, known in previous.items() if source_key in seen
+    )
+
+    change_count = 0
+
+    for batch in batched(records):
+        received += len(batch)
+
+        inserts = []
+        updates = []
+        changed = []
+
+        for record in batch:
+            source_key = record["source_key"]
+
+            if source_key in seen:
+                continue
+
+            parent = parents.get(record["parent_key"])
+
+            if parent is None:
+                unresolved += 1
+                continue
+
+            entity_id, primary_name = parent
+            normalized_alias = normalize(record["name"])
+
+            if normalized_alias == primary_name or (entity_id, normalized_alias) in taken:
+                continue
+
+            seen.add(source_key)
+            taken.add((entity_id, normalized_alias))
+            entities_matched += 1
+
+            values = {
+                "entity_id": entity_id,
+                "alias": record["name"],
+                "normalized_alias": normalized_alias,
+                "source": source,
+                "source_key": source_key,
+                "updated_at": now,
+            }
+            known = previous.get(source_key)
+
+            if known is None:
+                inserts.append(values)
+                changed.append(("ALIAS_ADDED", entity_id, record["name"], None))
+
+            elif known[1] != entity_id:
+                updates.append(dict(values, id=known[0]))
+                changed.append(("ALIAS_REMOVED", known[1], known[2], None))
+                changed.append(("ALIAS_ADDED", entity_id, record["name"], None))
+
+            elif known[2] != record["name"]:
+                updates.append(dict(values, id=known[0]))
+                changed.append(("ALIAS_CHANGED", entity_id, record["name"], known[2]))
+
+        with timed(timings, "write"):
+            if inserts:
+                db.execute(GlobalEntityAlias.__table__.insert(), inserts)
+
+            if updates:
+                db.execute(update(GlobalEntityAlias), updates)
+
+            record_alias_changes(db, ingestion, changed)
+
+            if checkpoint:
+                checkpoint(batch[-1]["offset"])
+
+        change_count += len(inserts) + len(updates)
+
+    # ------------------------------------------------------------------
+    # Delete feed aliases that dropped off the file
+    # ------------------------------------------------------------------
+    if not received and not seen:
+        raise ValueError(f"{source} alias feed returned no entries; refusing to drop every alias")
+
+    dropped = [
+        (alias_id, entity_id, alias)
+        for source_key, (alias_id, entity_id, alias, _) in previous.items()
+        if source_key not in seen
+    ]
+
+    for batch in batched(dropped):
+        with timed(timings, "write"):
+            db.execute(
+                delete(GlobalEntityAlias).where(
+                    GlobalEntityAlias.id.in_([alias_id for alias_id, _, _ in batch])
+                )
+            )
+            record_alias_changes(
+                db,
+                ingestion,
+                [("ALIAS_REMOVED", entity_id, alias, None) for _, entity_id, alias in batch],
+            )
+
+        change_count += len(batch)
+
+    if unresolved:
+        print(f"Warning: {unresolved} {source} aliases reference list entries that are not loaded")
+
+    ingestion.db_write_ms = timings["write"]
+    ingestion.resolve_ms = (time.perf_counter() - started) * 1000 - timings["write"]
+    ingestion.entities_created = 0
+    ingestion.entities_matched = entities_matched
+
+    return change_count
+
+
+# =====================================================
+# OFAC LIVE INGESTION
+# =====================================================
+def ofac_record(row: list[str]) -> dict | None:
+    # sdn.csv has no header; every record starts with a numeric ent_num
+    # (the stable key), which also skips the trailing end-of-file marker.
+    if len(row) < 2 or not row[0].strip().isdigit():
+        return None
+
+    name = row[1].strip()
+
+    if not name or name == "-0-":
+        return None
+
+    program = row[3].strip() if len(row) > 3 else ""
+
+    return {
+        "source_key": row[0].strip(),
+        "name": name,
+        "row_hash": feed_row_hash(row),
+        "fields": {"program": None if program in ("", "-0-") else program},
+    }
+
+
+def refresh_ofac_data(db: Session, ingestion: IngestionRun):
+    return refresh_feed(db, ingestion, "OFAC")
+
+
+def ofac_alias_record(row: list[str]) -> dict | None:
+    # alt.csv: ent_num, alt_num, alt_type (aka / fka / nka), alt_name, remarks
+    if len(row) < 4 or not row[0].strip().isdigit() or not row[1].strip().isdigit():
+        return None
+
+    name = row[3].strip()
+
+    if not name or name == "-0-":
+        return None
+
+    return {
+        "source_key": row[1].strip(),
+        "parent_key": row[0].strip(),
+        "name": name,
+    }
+
+
+def refresh_ofac_aliases(db: Session, ingestion: IngestionRun):
+    return refresh_feed(db, ingestion, "OFAC_ALT")
 
 
 # =====================================================
 # BIS ENTITY LIST INGESTION
 # =====================================================
-def refresh_bis_entity_list(db: Session):
-    response = requests.get(BIS_ENTITY_LIST_URL, timeout=30)
-    response.raise_for_status()
+def bis_record(row: list[str]) -> dict | None:
+    name = row[0].strip() if row else None
 
-    lines = response.text.splitlines()
-    headers = lines[0].split(",")
+    if not name:
+        return None
 
-    for line in lines[1:]:
-        cols = line.split(",")
-        name = cols[0] if len(cols) > 0 else None
+    # The Entity List has no row id; the normalized name is the key
+    return {
+        "source_key": normalize(name),
+        "name": name,
+        "row_hash": feed_row_hash(row),
+        "fields": {},
+    }
 
-        if not name:
-            continue
 
-        normalized = normalize(name)
+def refresh_bis_entity_list(db: Session, ingestion: IngestionRun):
+    return refresh_feed(db, ingestion, "BIS")
 
-        entity = db.query(GlobalEntity).filter_by(normalized_name=normalized).first()
 
-        if not entity:
-            entity = GlobalEntity(
-                canonical_name=name,
-                normalized_name=normalized,
-                entity_type="COMPANY",
+# =====================================================
+# WATCHLIST FEED REGISTRY
+# =====================================================
+WATCHLIST_FEEDS = {
+    "OFAC": {
+        "url": OFAC_SDN_URL,
+        "timeout": 120,
+        "parser": ofac_record,
+        "header": False,
+        "list_model": SanctionedEntity,
+        "list_name": "SANCTIONS",
+        "source": "OFAC",
+        "list_fields": {},
+    },
+    # Alias feeds carry no list rows of their own; they attach to entries
+    # of the aliases_of feed and are applied after it
+    "OFAC_ALT": {
+        "url": OFAC_ALT_URL,
+        "timeout": 120,
+        "parser": ofac_alias_record,
+        "header": False,
+        "aliases_of": "OFAC",
+    },
+    "BIS": {
+        "url": BIS_ENTITY_LIST_URL,
+        "timeout": 60,
+        "parser": bis_record,
+        "header": True,
+        "list_model": CoveredEntity,
+        "list_name": "SECTION_889",
+        "source": "BIS",
+        "list_fields": {"designation": "BIS Entity List"},
+    },
+}
+
+
+def parse_feed(feed_name: str, path: str, encoding: str, start_offset: int = 0) -> dict:
+    """
+    CPU-bound CSV parsing; runs in a worker process for concurrent runs.
+
+    Records are spilled to a temporary file in INGEST_BATCH_SIZE batches
+    as they are parsed, so neither the worker nor the process applying the
+    feed (see parsed_records) ever holds the whole feed, and only the spill
+    path crosses the process boundary.
+
+    Parsing starts at start_offset when resuming a checkpointed run; rows
+    in the skipped prefix are read only for their source keys, which the
+    delisting pass still needs, and are never resolved or written again.
+
+    Returns {"path", "rows", "prefix_keys", "start_offset", "parse_ms"};
+    each record carries the byte offset just past its row.
+    """
+    started = time.perf_counter()
+    feed = WATCHLIST_FEEDS[feed_name]
+
+    rows_parsed = 0
+    prefix_keys = []
+
+    spill = tempfile.NamedTemporaryFile(suffix=".parsed", delete=False)
+
+    try:
+        with spill, open(path, "rb") as body:
+            rows = read_csv_rows(body, encoding)
+
+            if feed["header"]:
+                next(rows, None)
+
+            if start_offset:
+                for row, offset in rows:
+                    record = feed["parser"](row)
+
+                    if record:
+                        prefix_keys.append(record["source_key"])
+
+                    if offset >= start_offset:
+                        break
+
+            def records():
+                for row, offset in rows:
+                    record = feed["parser"](row)
+
+                    if record:
+                        record["offset"] = offset
+                        yield record
+
+            for batch in batched(records()):
+                pickle.dump(batch, spill, protocol=pickle.HIGHEST_PROTOCOL)
+                rows_parsed += len(batch)
+
+    except BaseException:
+        os.unlink(spill.name)
+        raise
+
+    return {
+        "path": spill.name,
+        "rows": rows_parsed,
+        "prefix_keys": prefix_keys,
+        "start_offset": start_offset,
+        "parse_ms": (time.perf_counter() - started) * 1000,
+    }
+
+
+def parsed_records(path: str):
+    """Yields the records parse_feed spilled to path, one batch in memory at a time."""
+    with open(path, "rb") as spill:
+        while True:
+            try:
+                batch = pickle.load(spill)
+            except EOFError:
+                return
+
+            yield from batch
+
+
+def resumable_run(db: Session, feed_name: str, content_hash: str):
+    """
+    Latest failed run of the feed that checkpointed part of this exact
+    download; a new run picks up from its offset.
+    """
+    return (
+        db.query(IngestionRun)
+        .filter(
+            IngestionRun.feed_name == feed_name,
+            IngestionRun.status == "FAILED",
+            IngestionRun.content_hash == content_hash,
+            IngestionRun.checkpoint_offset > 0,
+        )
+        .order_by(IngestionRun.id.desc())
+        .first()
+    )
+
+
+def apply_feed(
+    db: Session,
+    ingestion: IngestionRun,
+    feed_name: str,
+    download,
+    parsed: dict | None = None,
+    force: bool = False,
+):
+    """
+    Records one downloaded feed on its IngestionRun and reconciles it into
+    the list tables. download is the download_feed result, or the exception
+    it raised; the feed is parsed here when parse_feed output is not
+    supplied (its spill file is removed either way). Stage timings and volumes are stored on the run. Alias feeds
+    are reconciled into GlobalEntityAlias instead; force re-applies a
+    download whose content matches the last run (an alias file re-read
+    because its parent feed changed).
+
+    Writes are committed chunk by chunk with a checkpoint (content hash +
+    byte offset) on the run; if a failed run checkpointed this same
+    download, reconciliation resumes after its offset and takes over the
+    changes it already committed.
+    """
+    if isinstance(download, BaseException):
+        raise download
+
+    feed = WATCHLIST_FEEDS[feed_name]
+    previous = feed_validators(db, feed_name)
+
+    ingestion.bytes_downloaded = download["bytes"]
+    ingestion.download_ms = download["download_ms"]
+
+    try:
+        if download["not_modified"]:
+            if previous is None:
+                raise ValueError(f"{feed_name} answered 304 to an unconditional request")
+
+            ingestion.etag = download["etag"] or previous["etag"]
+            ingestion.last_modified = download["last_modified"] or previous["last_modified"]
+            ingestion.content_hash = previous["content_hash"]
+            raise FeedUnchanged(f"{feed_name} not modified")
+
+        ingestion.etag = download["etag"]
+        ingestion.last_modified = download["last_modified"]
+        ingestion.content_hash = download["content_hash"]
+
+        if not force and feed_unchanged(download, previous):
+            raise FeedUnchanged(f"{feed_name} content unchanged")
+
+        resumed = resumable_run(db, feed_name, download["content_hash"])
+        start_offset = resumed.checkpoint_offset if resumed else 0
+
+        if parsed is None or parsed["start_offset"] != start_offset:
+            if parsed is not None:
+                os.unlink(parsed["path"])
+
+            # Cleared first so a failed parse leaves nothing to remove
+            parsed = None
+            parsed = parse_feed(feed_name, download["path"], download["encoding"], start_offset)
+
+        ingestion.parse_ms = parsed["parse_ms"]
+        ingestion.rows_parsed = parsed["rows"]
+        ingestion.checkpoint_offset = start_offset
+
+        adopted_changes = 0
+
+        if resumed:
+            ingestion.resumed_from_run_id = resumed.id
+            resumed.checkpoint_offset = None
+
+            adopted_changes = (
+                db.query(WatchlistChange)
+                .filter(WatchlistChange.ingestion_run_id == resumed.id)
+                .update({"ingestion_run_id": ingestion.id}, synchronize_session=False)
             )
-            db.add(entity)
+
+        def checkpoint(offset: int):
+            ingestion.checkpoint_offset = offset
             db.commit()
-            db.refresh(entity)
 
-        existing = db.query(CoveredEntity).filter_by(name=name).first()
+        if "aliases_of" in feed:
+            parent = WATCHLIST_FEEDS[feed["aliases_of"]]
 
-        if not existing:
-            covered = CoveredEntity(name=name)
-            db.add(covered)
+            change_count = adopted_changes + reconcile_aliases(
+                db,
+                ingestion,
+                parsed_records(parsed["path"]),
+                parent["list_model"],
+                parent["source"],
+                seen=set(parsed["prefix_keys"]),
+                checkpoint=checkpoint,
+            )
+        else:
+            change_count = adopted_changes + reconcile_watchlist(
+                db,
+                ingestion,
+                parsed_records(parsed["path"]),
+                feed["list_model"],
+                feed["list_name"],
+                feed["source"],
+                feed["list_fields"],
+                seen=set(parsed["prefix_keys"]),
+                checkpoint=checkpoint,
+            )
+
+    finally:
+        if not download["not_modified"]:
+            os.unlink(download["path"])
+
+        if parsed is not None:
+            os.unlink(parsed["path"])
 
+    commit_started = time.perf_counter()
     db.commit()
+    ingestion.db_write_ms += (time.perf_counter() - commit_started) * 1000
+
+    pipeline_ms = (
+        ingestion.download_ms + ingestion.parse_ms + ingestion.resolve_ms + ingestion.db_write_ms
+    )
+    ingestion.rows_per_sec = (
+        ingestion.rows_parsed / (pipeline_ms / 1000) if pipeline_ms else None
+    )
+
+    return change_count
+
+
+async def download_feeds(feeds: dict) -> dict:
+    """
+    Fetches several feeds concurrently over one pooled client.
+
+    feeds maps feed_name -> previous validators; returns feed_name ->
+    download result or the exception that ended its retries.
+    """
+    async with feed_client() as client:
+        results = await asyncio.gather(
+            *(
+                download_feed(
+                    client,
+                    WATCHLIST_FEEDS[feed_name]["url"],
+                    previous,
+                    WATCHLIST_FEEDS[feed_name]["timeout"],
+                )
+                for feed_name, previous in feeds.items()
+            ),
+            return_exceptions=True,
+        )
+
+    return dict(zip(feeds, results))
+
+
+def refresh_feed(db: Session, ingestion: IngestionRun, feed_name: str):
+    """Single-feed refresh: download, parse in-process and reconcile."""
+    feeds = {feed_name: feed_validators(db, feed_name)}
+
+    return apply_feed(db, ingestion, feed_name, asyncio.run(download_feeds(feeds))[feed_name])
 
 
 # =====================================================
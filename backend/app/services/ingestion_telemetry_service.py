@@ -0,0 +1,133 @@
+import os
+from statistics import median
+from sqlalchemy.orm import Session
+
+from app.models import IngestionRun
+
+
+# Successful runs of the same feed a run is compared against
+REGRESSION_WINDOW = int(os.getenv("INGESTION_REGRESSION_WINDOW", "10"))
+
+# A metric regresses when it is this much worse than the window median
+REGRESSION_TOLERANCE = float(os.getenv("INGESTION_REGRESSION_TOLERANCE", "0.5"))
+
+# Fewer successful runs than this and no comparison is made
+MIN_HISTORY = 3
+
+
+def run_telemetry(run: IngestionRun) -> dict:
+    return {
+        "id": run.id,
+        "feed_name": run.feed_name,
+        "status": run.status,
+        "record_count": run.record_count,
+        "started_at": run.started_at,
+        "completed_at": run.completed_at,
+        "bytes_downloaded": run.bytes_downloaded,
+        "download_ms": run.download_ms,
+        "parse_ms": run.parse_ms,
+        "resolve_ms": run.resolve_ms,
+        "db_write_ms": run.db_write_ms,
+        "rows_parsed": run.rows_parsed,
+        "rows_per_sec": run.rows_per_sec,
+        "entities_created": run.entities_created,
+        "entities_matched": run.entities_matched,
+    }
+
+
+def stage_rates(run: IngestionRun) -> dict:
+    """
+    Size-normalized stage costs, so a feed that grew is not reported as a
+    regression: download throughput separates a slow feed from a slow
+    database, whose cost shows up in resolve / write time per 1k rows.
+    """
+    rates = {}
+
+    if run.bytes_downloaded and run.download_ms:
+        rates["download_bytes_per_sec"] = run.bytes_downloaded / (run.download_ms / 1000)
+
+    if run.rows_parsed:
+        for stage in ("parse_ms", "resolve_ms", "db_write_ms"):
+            value = getattr(run, stage)
+            if value is not None:
+                rates[f"{stage}_per_1k_rows"] = value / run.rows_parsed * 1000
+
+    if run.rows_per_sec:
+        rates["rows_per_sec"] = run.rows_per_sec
+
+    return rates
+
+
+def higher_is_better(metric: str) -> bool:
+    return metric in ("download_bytes_per_sec", "rows_per_sec")
+
+
+def compare_to_history(run: IngestionRun, db: Session, window: int = REGRESSION_WINDOW) -> dict:
+    """
+    Compares a run's stage rates with the median of the feed's previous
+    successful runs and flags the stages that got worse than tolerated.
+    """
+    history = (
+        db.query(IngestionRun)
+        .filter(
+            IngestionRun.feed_name == run.feed_name,
+            IngestionRun.status == "SUCCESS",
+            IngestionRun.id < run.id,
+        )
+        .order_by(IngestionRun.id.desc())
+        .limit(window)
+        .all()
+    )
+
+    history_rates = [stage_rates(previous) for previous in history]
+
+    metrics = {}
+    regressions = []
+
+    for metric, value in stage_rates(run).items():
+        values = [rates[metric] for rates in history_rates if metric in rates]
+
+        if len(values) < MIN_HISTORY:
+            continue
+
+        baseline = median(values)
+
+        if not baseline:
+            continue
+
+        ratio = value / baseline
+
+        if higher_is_better(metric):
+            regressed = ratio < 1 / (1 + REGRESSION_TOLERANCE)
+        else:
+            regressed = ratio > 1 + REGRESSION_TOLERANCE
+
+        metrics[metric] = {
+            "value": round(value, 3),
+            "baseline": round(baseline, 3),
+            "ratio": round(ratio, 3),
+            "regressed": regressed,
+        }
+
+        if regressed:
+            regressions.append(metric)
+
+    return {
+        "window": len(history),
+        "metrics": metrics,
+        "regressions": regressions,
+    }
+
+
+def ingestion_report(db: Session, feed_name: str | None = None, limit: int = 20) -> list[dict]:
+    query = db.query(IngestionRun)
+
+    if feed_name:
+        query = query.filter(IngestionRun.feed_name == feed_name)
+
+    runs = query.order_by(IngestionRun.id.desc()).limit(limit).all()
+
+    return [
+        dict(run_telemetry(run), comparison=compare_to_history(run, db))
+        for run in runs
+    ]
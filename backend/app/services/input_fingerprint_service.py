@@ -0,0 +1,226 @@
+import hashlib
+import json
+from collections import Counter
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session
+
+from app.models import AssessmentHistory, IngestionRun, ScoringConfig, Supplier, WatchlistChange
+from app.graph.risk_propagation import neighborhoods
+from app.services.screening_index import get_watchlist_index
+from app.services.reverse_screening_service import annotate_affected_suppliers
+
+
+# Supplier columns an assessment depends on (everything but the key and
+# the creation time)
+SUPPLIER_VERSION_COLUMNS = [
+    column.name
+    for column in Supplier.__table__.columns
+    if column.name not in ("id", "created_at")
+]
+
+# Assessments re-stamped per query by advance_list_version
+ADVANCE_CHUNK_SIZE = 5000
+
+
+def digest(value) -> str:
+    encoded = json.dumps(value, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=8).hexdigest()
+
+
+def supplier_version(supplier) -> str:
+    return digest([getattr(supplier, column) for column in SUPPLIER_VERSION_COLUMNS])
+
+
+def config_version(config: ScoringConfig) -> str:
+    # Weights are included so an edit that keeps the version label still counts
+    return digest([
+        config.version,
+        config.sanctions_weight,
+        config.section889_fail_weight,
+        config.section889_conditional_weight,
+    ])
+
+
+def input_fingerprint(supplier, config: ScoringConfig, list_version: str, related: list | None) -> dict:
+    """
+    Versions of everything an assessment read. graph_version is None when
+    the graph module failed and the assessment scored its fallback.
+    """
+    return {
+        "list_version": list_version,
+        "config_version": config_version(config),
+        "graph_version": digest(related) if related is not None else None,
+        "supplier_version": supplier_version(supplier),
+    }
+
+
+def graph_versions(names: list[str]) -> dict | None:
+    try:
+        return {name: digest(related) for name, related in neighborhoods(names).items()}
+    except Exception as e:
+        print(f"Warning: graph neighborhoods unavailable, ignoring graph versions: {e}")
+        return None
+
+
+def suppliers_touched(db: Session, stale: dict, list_version: str) -> set[int] | None:
+    """
+    Of the suppliers in stale ({supplier_id: list_version assessed
+    against}), those a list change since that version may affect: matched
+    (via reverse screening) by a WatchlistChange of a later ingestion run,
+    or assessed against a version no run recorded.
+
+    Returns None when the change to the current version cannot be
+    attributed: no run recorded it, or a run started from a version the
+    one before it did not end at (the list changed outside any run).
+    """
+    runs = (
+        db.query(IngestionRun.id, IngestionRun.previous_list_version, IngestionRun.list_version)
+        .filter(IngestionRun.list_version.isnot(None))
+        .order_by(IngestionRun.id)
+        .all()
+    )
+
+    if not runs or runs[-1].list_version != list_version:
+        return None
+
+    # Latest run that ended at each version, and the latest run whose
+    # starting version breaks the chain
+    ended_at = {}
+    unattributed_before = 0
+
+    for previous, run in zip([None] + runs, runs):
+        if previous is not None and run.previous_list_version != previous.list_version:
+            unattributed_before = run.id
+
+        ended_at[run.list_version] = run.id
+
+    since = {supplier_id: ended_at.get(version, 0) for supplier_id, version in stale.items()}
+
+    touched = {
+        supplier_id
+        for supplier_id, run_id in since.items()
+        if run_id < unattributed_before or run_id == 0
+    }
+
+    changes = (
+        db.query(WatchlistChange)
+        .filter(WatchlistChange.ingestion_run_id > min(since.values()))
+        .all()
+    )
+
+    for ingestion_run_id in {change.ingestion_run_id for change in changes if change.affected_supplier_ids is None}:
+        annotate_affected_suppliers(ingestion_run_id, db)
+
+    touched.update(
+        supplier_id
+        for change in changes
+        for supplier_id in change.affected_supplier_ids
+        if supplier_id in since and change.ingestion_run_id > since[supplier_id]
+    )
+
+    return touched
+
+
+def advance_list_version(db: Session, history_ids: list[int], list_version: str):
+    """
+    Re-stamps assessments no list change since their version affected with
+    the current list version, so the next plan looks back from it.
+    """
+    for start in range(0, len(history_ids), ADVANCE_CHUNK_SIZE):
+        rows = (
+            db.query(AssessmentHistory.id, AssessmentHistory.input_fingerprint)
+            .filter(AssessmentHistory.id.in_(history_ids[start:start + ADVANCE_CHUNK_SIZE]))
+            .all()
+        )
+
+        db.execute(
+            update(AssessmentHistory),
+            [
+                {"id": history_id, "input_fingerprint": dict(fingerprint, list_version=list_version)}
+                for history_id, fingerprint in rows
+            ],
+        )
+
+
+def plan_rescore(db: Session, config: ScoringConfig) -> dict:
+    """
+    Compares every supplier's current inputs with the fingerprint of its
+    latest assessment.
+
+    Returns {"due": [supplier_id, ...], "skipped": n, "reasons": {input: n},
+    "list_version": current list version, "list_unaffected": [history id,
+    ...]}. A newer list version only makes a supplier due if a list change
+    since the version it was assessed against matched it; the latest
+    assessments of those it did not are listed in list_unaffected (see
+    advance_list_version). An unreachable graph is not compared.
+    """
+    suppliers = db.query(*Supplier.__table__.columns).order_by(Supplier.id).all()
+
+    latest = (
+        db.query(func.max(AssessmentHistory.id))
+        .group_by(AssessmentHistory.supplier_id)
+        .scalar_subquery()
+    )
+    assessments = {
+        supplier_id: (fingerprint, history_id)
+        for supplier_id, fingerprint, history_id in db.query(
+            AssessmentHistory.supplier_id,
+            AssessmentHistory.input_fingerprint,
+            AssessmentHistory.id,
+        ).filter(AssessmentHistory.id.in_(latest))
+    }
+
+    list_version = get_watchlist_index(db).version
+    current_config = config_version(config)
+    graph = graph_versions(sorted({supplier.name for supplier in suppliers}))
+
+    due = []
+    reasons = Counter()
+    list_stale = {}
+    list_unaffected = []
+
+    for supplier in suppliers:
+        stored, history_id = assessments.get(supplier.id, (None, None))
+
+        if not stored:
+            due.append(supplier.id)
+            reasons["no_fingerprint"] += 1
+            continue
+
+        changed = [
+            key
+            for key, value in (
+                ("config_version", current_config),
+                ("supplier_version", supplier_version(supplier)),
+                ("graph_version", graph.get(supplier.name, digest([])) if graph is not None else None),
+            )
+            if value is not None and stored.get(key) != value
+        ]
+
+        if changed:
+            due.append(supplier.id)
+            reasons.update(changed)
+        elif stored.get("list_version") != list_version:
+            list_stale[supplier.id] = (stored.get("list_version"), history_id)
+
+    if list_stale:
+        touched = suppliers_touched(
+            db,
+            {supplier_id: version for supplier_id, (version, _) in list_stale.items()},
+            list_version,
+        )
+
+        for supplier_id, (_, history_id) in list_stale.items():
+            if touched is None or supplier_id in touched:
+                due.append(supplier_id)
+                reasons["list_version"] += 1
+            else:
+                list_unaffected.append(history_id)
+
+    return {
+        "due": sorted(due),
+        "skipped": len(suppliers) - len(due),
+        "reasons": dict(reasons),
+        "list_version": list_version,
+        "list_unaffected": list_unaffected,
+    }
@@ -0,0 +1,158 @@
+import threading
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models import Supplier, GlobalEntityAlias, SupplierEntityLink, WatchlistChange
+from app.services.screening_index import WatchlistIndex, normalize
+from app.services.screening_engine import LIST_THRESHOLDS
+
+
+# =====================================================
+# SUPPLIER CATALOG INDEX
+# =====================================================
+def supplier_entries(db: Session, supplier_ids: list[int] | None = None) -> list[dict]:
+    suppliers = db.query(Supplier.id, Supplier.name)
+    aliases = (
+        db.query(
+            SupplierEntityLink.supplier_id,
+            GlobalEntityAlias.alias,
+            GlobalEntityAlias.normalized_alias,
+        )
+        .join(GlobalEntityAlias, GlobalEntityAlias.entity_id == SupplierEntityLink.entity_id)
+    )
+
+    if supplier_ids is not None:
+        suppliers = suppliers.filter(Supplier.id.in_(supplier_ids))
+        aliases = aliases.filter(SupplierEntityLink.supplier_id.in_(supplier_ids))
+
+    # Names are normalized as forward screening normalizes them, not taken
+    # from Supplier.normalized_name (normalized differently at creation)
+    entries = [
+        {
+            "supplier_id": supplier_id,
+            "name": name,
+            "normalized_name": normalize(name),
+            "matched_via": "SUPPLIER",
+        }
+        for supplier_id, name in suppliers.order_by(Supplier.id).all()
+    ]
+
+    entries.extend(
+        {
+            "supplier_id": supplier_id,
+            "name": alias,
+            "normalized_name": normalized_alias,
+            "matched_via": "ALIAS",
+        }
+        for supplier_id, alias, normalized_alias in aliases.all()
+    )
+
+    return entries
+
+
+def supplier_index_marker(db: Session) -> tuple:
+    """
+    Cheap version marker for everything supplier_entries reads. Row counts
+    and max ids catch inserts and deletes from any process; updated_at
+    catches in-place renames.
+    """
+    suppliers = db.query(
+        func.count(Supplier.id), func.max(Supplier.id), func.max(Supplier.updated_at)
+    ).one()
+    links = db.query(func.count(SupplierEntityLink.id), func.max(SupplierEntityLink.id)).one()
+    aliases = db.query(
+        func.count(GlobalEntityAlias.id),
+        func.max(GlobalEntityAlias.id),
+        func.max(GlobalEntityAlias.updated_at),
+    ).one()
+
+    return tuple(suppliers) + tuple(links) + tuple(aliases)
+
+
+_supplier_index: WatchlistIndex | None = None
+_supplier_index_marker: tuple | None = None
+_supplier_index_lock = threading.Lock()
+
+
+def get_supplier_index(db: Session) -> WatchlistIndex:
+    """
+    Returns the process-local supplier index, rebuilt whenever the
+    supplier, link or alias tables changed since it was built (by this
+    worker, another worker or a script).
+    """
+    global _supplier_index, _supplier_index_marker
+
+    marker = supplier_index_marker(db)
+
+    if _supplier_index is None or _supplier_index_marker != marker:
+        with _supplier_index_lock:
+            if _supplier_index is None or _supplier_index_marker != marker:
+                _supplier_index = WatchlistIndex(supplier_entries(db))
+                _supplier_index_marker = marker
+
+    return _supplier_index
+
+
+# =====================================================
+# REVERSE SCREENING
+# =====================================================
+def match_list_entry(
+    name: str,
+    list_name: str,
+    db: Session,
+    index: WatchlistIndex | None = None,
+) -> list[dict]:
+    """
+    Answers "which of our suppliers look like this list entry?" using the
+    blocked supplier index instead of scanning the portfolio.
+    """
+    if index is None:
+        index = get_supplier_index(db)
+
+    hits, _ = index.search(normalize(name), LIST_THRESHOLDS[list_name])
+
+    best = {}
+
+    for entry, score in hits:
+        supplier_id = entry["supplier_id"]
+
+        if supplier_id not in best or score > best[supplier_id]["match_score"]:
+            best[supplier_id] = {
+                "supplier_id": supplier_id,
+                "matched_name": entry["name"],
+                "matched_via": entry["matched_via"],
+                "match_score": score,
+            }
+
+    return sorted(best.values(), key=lambda match: match["supplier_id"])
+
+
+def annotate_affected_suppliers(ingestion_run_id: int, db: Session) -> set[int]:
+    """
+    Runs a reverse query for every list entry changed by an ingestion run
+    and stores the matching supplier IDs on each WatchlistChange row.
+    """
+    changes = (
+        db.query(WatchlistChange)
+        .filter(WatchlistChange.ingestion_run_id == ingestion_run_id)
+        .all()
+    )
+
+    affected = set()
+    index = get_supplier_index(db)
+
+    for change in changes:
+        # A renamed entry can clear suppliers matching its old name too
+        names = [change.name] + ([change.previous_name] if change.previous_name else [])
+
+        supplier_ids = sorted({
+            match["supplier_id"]
+            for name in names
+            for match in match_list_entry(name, change.list_name, db, index)
+        })
+        change.affected_supplier_ids = supplier_ids
+        affected.update(supplier_ids)
+
+    db.commit()
+
+    return affected
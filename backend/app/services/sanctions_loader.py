@@ -1,18 +1,20 @@
-import csv
 from sqlalchemy.orm import Session
 from app.models import SanctionedEntity
+from app.services.bulk_list_loader import read_list_csv, bulk_load_list
 
 
 def load_sanctions(db: Session, filepath: str):
-    with open(filepath, newline='', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            existing = db.query(SanctionedEntity).filter_by(name=row["name"]).first()
-            if not existing:
-                entity = SanctionedEntity(
-                    name=row["name"],
-                    source=row["source"]
-                )
-                db.add(entity)
+    """CSV columns: name, source, optional program."""
+    rows = (
+        (
+            row["name"].strip(),
+            {
+                "source": row["source"].strip(),
+                "program": (row.get("program") or "").strip() or None,
+            },
+        )
+        for row in read_list_csv(filepath)
+        if row.get("name", "").strip()
+    )
 
-        db.commit()
+    return bulk_load_list(db, SanctionedEntity, "SANCTIONS", rows)
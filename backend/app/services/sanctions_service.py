@@ -1,42 +1,42 @@
 from sqlalchemy.orm import Session
-from rapidfuzz import fuzz
-from app.models import Supplier, SanctionedEntity
+from app.models import Supplier
+from app.services.screening_index import normalize, get_watchlist_index, rollup_aliases
 
 
 MATCH_THRESHOLD = 85
 
 
-def normalize(text: str):
-    return text.lower().replace(",", "").replace(".", "").strip()
-
-
 def check_sanctions(supplier_id: int, db: Session):
     supplier = db.query(Supplier).filter_by(id=supplier_id).first()
 
     if not supplier:
         return {"error": "Supplier not found"}
 
-    matches = []
-    sanctions = db.query(SanctionedEntity).all()
+    index = get_watchlist_index(db)
 
-    supplier_name = normalize(supplier.name)
+    hits, screening_stats = index.search(
+        normalize(supplier.name),
+        MATCH_THRESHOLD,
+        list_name="SANCTIONS",
+    )
 
-    highest_score = 0
+    return build_sanctions_result(supplier, hits, screening_stats)
 
-    for entity in sanctions:
-        score = fuzz.token_set_ratio(
-            supplier_name,
-            normalize(entity.name)
-        )
 
-        if score >= MATCH_THRESHOLD:
-            matches.append({
-                "sanctioned_name": entity.name,
-                "source": entity.source,
-                "match_score": score
-            })
+def build_sanctions_result(supplier: Supplier, hits: list, screening_stats: dict):
+    matches = []
+
+    highest_score = 0
+
+    for entity, score in rollup_aliases(hits):
+        matches.append({
+            "sanctioned_name": entity["name"],
+            "matched_alias": entity["matched_alias"],
+            "source": entity["source"],
+            "match_score": score
+        })
 
-            highest_score = max(highest_score, score)
+        highest_score = max(highest_score, score)
 
     if matches:
         return {
@@ -44,7 +44,8 @@ def check_sanctions(supplier_id: int, db: Session):
             "overall_status": "FAIL",
             "risk_score": 100,
             "reason": "High confidence sanctions match",
-            "matches": matches
+            "matches": matches,
+            "screening_stats": screening_stats,
         }
 
     return {
@@ -52,5 +53,6 @@ def check_sanctions(supplier_id: int, db: Session):
         "overall_status": "PASS",
         "risk_score": 0,
         "reason": "No sanctions match found",
-        "matches": []
+        "matches": [],
+        "screening_stats": screening_stats,
     }
@@ -1,18 +1,56 @@
-from datetime import datetime
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from multiprocessing import get_context
 from apscheduler.schedulers.background import BackgroundScheduler
+from sqlalchemy import or_, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.database import SessionLocal
-from app.models import IngestionRun, Supplier
+from app.models import IngestionRun, RescoreChunk
 from app.services.external_intelligence_service import (
-    refresh_ofac_data,
-    refresh_bis_entity_list,
+    WATCHLIST_FEEDS,
+    FeedUnchanged,
+    apply_feed,
+    download_feeds,
+    feed_unchanged,
+    feed_validators,
+    parse_feed,
+    resumable_run,
 )
-from app.services.assessment_service import run_assessment
+from app.services.assessment_service import get_active_scoring_config, run_assessment_batch
+from app.services.input_fingerprint_service import advance_list_version, plan_rescore
+from app.services.screening_index import apply_watchlist_changes, get_watchlist_index
+from app.services.delta_screening_service import rescreen_watchlist_delta
+from app.services.reverse_screening_service import annotate_affected_suppliers
+from app.services.ingestion_telemetry_service import compare_to_history
 
 
 scheduler = BackgroundScheduler()
 
+# Suppliers per rescore chunk: one run_assessment_batch and checkpoint each
+RESCORE_CHUNK_SIZE = int(os.getenv("RESCORE_CHUNK_SIZE", "1000"))
+
+# Worker processes for the rescore job (0 = run chunks in this process).
+# Each worker screens with its own watchlist index unless
+# SCREENING_INDEX_DIR lets them map a shared one.
+RESCORE_PROCESSES = int(os.getenv("RESCORE_PROCESSES", "0"))
+
+# A chunk that failed in this many runs is marked FAILED and no longer resumed
+RESCORE_CHUNK_MAX_ATTEMPTS = int(os.getenv("RESCORE_CHUNK_MAX_ATTEMPTS", "3"))
+
+# IngestionRun.feed_name of rescore runs
+RESCORE_RUN_NAME = "SUPPLIER_RESCORE"
+
+# The running rescore refreshes a heartbeat this often; one not refreshed
+# for RESCORE_STALE_SECONDS lost its process and is resumed by the next run
+RESCORE_HEARTBEAT_SECONDS = float(os.getenv("RESCORE_HEARTBEAT_SECONDS", "30"))
+RESCORE_STALE_SECONDS = float(os.getenv("RESCORE_STALE_SECONDS", "300"))
+
 
 # =====================================================
 # FEED WRAPPER WITH LOGGING
@@ -30,34 +68,441 @@ def run_feed_with_tracking(feed_name: str, feed_function):
     db.commit()
     db.refresh(ingestion)
 
+    # Load the index before the feed writes, so the list version the run
+    # starts from is known when its changes are applied
+    get_watchlist_index(db)
+
     try:
-        record_count = feed_function(db)
+        record_count = feed_function(db, ingestion)
 
         ingestion.status = "SUCCESS"
         ingestion.record_count = record_count if record_count else 0
         ingestion.completed_at = datetime.utcnow()
 
+    except FeedUnchanged:
+        # Nothing parsed or written; keep the validators for the next fetch
+        ingestion.status = "NO_CHANGE"
+        ingestion.record_count = 0
+        ingestion.completed_at = datetime.utcnow()
+
     except Exception as e:
+        # Discard the feed's partial writes; the run record was committed above
+        db.rollback()
+
         ingestion.status = "FAILED"
         ingestion.error_message = str(e)
         ingestion.completed_at = datetime.utcnow()
 
     db.commit()
+
+    # Patch the in-memory matcher with this run's diff
+    if ingestion.status == "SUCCESS":
+        apply_watchlist_changes(db, ingestion.id)
+
+        regressions = compare_to_history(ingestion, db)["regressions"]
+        if regressions:
+            print(f"Warning: {feed_name} ingestion run {ingestion.id} regressed on {', '.join(regressions)}")
+
+        # Follow-up: re-assess only suppliers the delta can affect
+        if ingestion.changes:
+            annotate_affected_suppliers(ingestion.id, db)
+
+            scheduler.add_job(
+                run_delta_rescreen,
+                args=[ingestion.id],
+                id=f"delta_rescreen_{ingestion.id}",
+                replace_existing=True,
+            )
+
+    db.close()
+
+
+# =====================================================
+# CONCURRENT WATCHLIST FEED RUN
+# =====================================================
+def run_watchlist_feeds(feed_names: list[str] | None = None):
+    """
+    Refreshes every configured watchlist feed at once: downloads run
+    concurrently over one pooled async client, CSV parsing runs in a
+    process pool, and each feed is reconciled and recorded through
+    run_feed_with_tracking as soon as it is parsed.
+    """
+    feed_names = feed_names or list(WATCHLIST_FEEDS)
+
+    db: Session = SessionLocal()
+    previous = {feed_name: feed_validators(db, feed_name) for feed_name in feed_names}
+    db.close()
+
+    downloads = asyncio.run(download_feeds(previous))
+
+    to_parse = [
+        feed_name
+        for feed_name, download in downloads.items()
+        if not isinstance(download, BaseException)
+        and not feed_unchanged(download, previous[feed_name])
+    ]
+
+    # Aliases only attach to entries their parent feed has written, so an
+    # unchanged alias file is re-applied when its parent changed; a 304 is
+    # fetched again without validators to get the body
+    forced = [
+        feed_name
+        for feed_name in feed_names
+        if WATCHLIST_FEEDS[feed_name].get("aliases_of") in to_parse
+        and feed_name not in to_parse
+        and not isinstance(downloads[feed_name], BaseException)
+    ]
+
+    refetch = [feed_name for feed_name in forced if downloads[feed_name]["not_modified"]]
+    if refetch:
+        downloads.update(asyncio.run(download_feeds({feed_name: None for feed_name in refetch})))
+
+    to_parse.extend(
+        feed_name for feed_name in forced if not isinstance(downloads[feed_name], BaseException)
+    )
+
+    def record(feed_name, parsed=None):
+        run_feed_with_tracking(
+            feed_name,
+            lambda db, ingestion: apply_feed(
+                db, ingestion, feed_name, downloads[feed_name], parsed, force=feed_name in forced
+            ),
+        )
+
+    # Failed and unchanged feeds have nothing to parse
+    for feed_name in feed_names:
+        if feed_name not in to_parse:
+            record(feed_name)
+
+    if not to_parse:
+        return
+
+    # Feeds whose previous run failed on this same download resume from its checkpoint
+    db = SessionLocal()
+    start_offsets = {}
+    for feed_name in to_parse:
+        resumed = resumable_run(db, feed_name, downloads[feed_name]["content_hash"])
+        start_offsets[feed_name] = resumed.checkpoint_offset if resumed else 0
     db.close()
 
+    # Spawned like the rescore pool: a forked parser would inherit this
+    # process's scheduler threads, DB connections and the graph driver
+    with ProcessPoolExecutor(
+        max_workers=min(len(to_parse), os.cpu_count() or 1),
+        mp_context=get_context("spawn"),
+    ) as pool:
+        futures = {
+            pool.submit(
+                parse_feed,
+                feed_name,
+                downloads[feed_name]["path"],
+                downloads[feed_name]["encoding"],
+                start_offsets[feed_name],
+            ): feed_name
+            for feed_name in to_parse
+        }
+
+        deferred = []
+
+        # Database writes stay serialized; parsing of the others overlaps them
+        for future in as_completed(futures):
+            feed_name = futures[future]
+
+            try:
+                parsed = future.result()
+            except Exception as e:
+                os.unlink(downloads[feed_name]["path"])
+                parsed = None
+                downloads[feed_name] = e
+
+            # Alias feeds go after the parent feed they attach to
+            if WATCHLIST_FEEDS[feed_name].get("aliases_of") in to_parse:
+                deferred.append((feed_name, parsed))
+            else:
+                record(feed_name, parsed)
+
+        for feed_name, parsed in deferred:
+            record(feed_name, parsed)
+
+
+# =====================================================
+# DELTA RE-SCREENING JOB
+# =====================================================
+def run_delta_rescreen(ingestion_run_id: int):
+    db: Session = SessionLocal()
+
+    try:
+        summary = rescreen_watchlist_delta(ingestion_run_id, db)
+        print(f"Delta re-screen for ingestion run {ingestion_run_id}: {summary}")
+
+    except Exception as e:
+        # Discard partial writes; the next rescore picks the suppliers up
+        db.rollback()
+        print(f"Warning: delta re-screen for ingestion run {ingestion_run_id} failed: {e}")
+
+    finally:
+        db.close()
+
 
 # =====================================================
 # SUPPLIER RESCORING JOB
 # =====================================================
+def rescore_chunk(chunk_id: int, run_id: int) -> int:
+    """
+    Assesses one chunk on its own session; the history rows and the DONE
+    checkpoint commit in one transaction. Returns suppliers assessed.
+
+    The attempt is counted before the chunk runs, so a worker that crashes
+    mid-chunk still uses one up; a chunk that fails on its last attempt is
+    marked FAILED instead of being left PENDING. The counting UPDATE is
+    also the claim: a chunk another run has taken over is skipped.
+    """
+    db: Session = SessionLocal()
+
+    try:
+        claimed = db.execute(
+            update(RescoreChunk)
+            .where(
+                RescoreChunk.id == chunk_id,
+                RescoreChunk.ingestion_run_id == run_id,
+                RescoreChunk.status == "PENDING",
+            )
+            .values(attempts=RescoreChunk.attempts + 1)
+        ).rowcount
+        db.commit()
+
+        if not claimed:
+            print(f"Warning: rescore chunk {chunk_id} no longer belongs to run {run_id}; skipped")
+            return 0
+
+        chunk = db.get(RescoreChunk, chunk_id)
+        started = time.perf_counter()
+
+        try:
+            results = run_assessment_batch(chunk.supplier_ids, db, commit=False)
+        except Exception:
+            db.rollback()
+
+            if chunk.attempts >= RESCORE_CHUNK_MAX_ATTEMPTS:
+                chunk.status = "FAILED"
+                chunk.completed_at = datetime.utcnow()
+                db.commit()
+
+            raise
+
+        chunk.status = "DONE"
+        chunk.assessed = len(results)
+        chunk.seconds = time.perf_counter() - started
+        chunk.completed_at = datetime.utcnow()
+        db.commit()
+
+        return chunk.assessed
+
+    finally:
+        db.close()
+
+
+def release_stale_rescore(db: Session) -> int:
+    """
+    Fails RUNNING rescore runs whose heartbeat went stale, releasing their
+    lease; their PENDING chunks are resumed by the next run.
+    """
+    cutoff = datetime.utcnow() - timedelta(seconds=RESCORE_STALE_SECONDS)
+
+    released = db.execute(
+        update(IngestionRun)
+        .where(
+            IngestionRun.feed_name == RESCORE_RUN_NAME,
+            IngestionRun.status == "RUNNING",
+            or_(IngestionRun.heartbeat_at.is_(None), IngestionRun.heartbeat_at < cutoff),
+        )
+        .values(
+            status="FAILED",
+            error_message="Interrupted; heartbeat lost",
+            running_feed_name=None,
+            completed_at=datetime.utcnow(),
+        )
+    ).rowcount
+    db.commit()
+
+    return released
+
+
+def interrupted_rescore(db: Session):
+    """Latest failed rescore run with chunks left to do."""
+    return (
+        db.query(IngestionRun)
+        .filter(
+            IngestionRun.feed_name == RESCORE_RUN_NAME,
+            IngestionRun.status == "FAILED",
+            IngestionRun.id.in_(
+                db.query(RescoreChunk.ingestion_run_id).filter(RescoreChunk.status == "PENDING")
+            ),
+        )
+        .order_by(IngestionRun.id.desc())
+        .first()
+    )
+
+
+def rescore_heartbeat(run_id: int, stop: threading.Event):
+    """Refreshes the run's heartbeat_at on its own session until stop is set."""
+    while not stop.wait(RESCORE_HEARTBEAT_SECONDS):
+        db = SessionLocal()
+
+        try:
+            db.execute(
+                update(IngestionRun)
+                .where(IngestionRun.id == run_id, IngestionRun.running_feed_name == RESCORE_RUN_NAME)
+                .values(heartbeat_at=datetime.utcnow())
+            )
+            db.commit()
+
+        except Exception as e:
+            print(f"Warning: rescore run {run_id} heartbeat failed: {e}")
+
+        finally:
+            db.close()
+
+
 def rescore_all_suppliers():
+    """
+    Every app process schedules this job; the running_feed_name lease lets
+    one of them run it at a time. The others skip while its heartbeat is
+    fresh, and the first to start after it went stale resumes its chunks.
+    """
     db: Session = SessionLocal()
 
-    suppliers = db.query(Supplier).all()
+    try:
+        release_stale_rescore(db)
+        previous = interrupted_rescore(db)
 
-    for supplier in suppliers:
-        run_assessment(supplier.id, db)
+        now = datetime.utcnow()
+        run = IngestionRun(
+            feed_name=RESCORE_RUN_NAME,
+            status="RUNNING",
+            running_feed_name=RESCORE_RUN_NAME,
+            started_at=now,
+            heartbeat_at=now,
+            resumed_from_run_id=previous.id if previous else None,
+        )
+        db.add(run)
 
-    db.close()
+        try:
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            print("Supplier rescore skipped: another process is running it")
+            return
+
+        stop = threading.Event()
+        threading.Thread(target=rescore_heartbeat, args=(run.id, stop), daemon=True).start()
+
+        try:
+            rescore_run(db, run, previous)
+        finally:
+            stop.set()
+
+    finally:
+        db.close()
+
+
+def rescore_run(db: Session, run: IngestionRun, previous: IngestionRun | None):
+    chunks = []
+
+    if previous is not None:
+        # Resume: take over the chunks the interrupted run never checkpointed
+        chunks = (
+            db.query(RescoreChunk)
+            .filter(RescoreChunk.ingestion_run_id == previous.id, RescoreChunk.status == "PENDING")
+            .order_by(RescoreChunk.id)
+            .all()
+        )
+        for chunk in chunks:
+            chunk.ingestion_run_id = run.id
+
+    # Only suppliers whose list, config, graph or row inputs changed; a
+    # resumed run still plans the rest of the portfolio
+    plan = plan_rescore(db, get_active_scoring_config(db))
+    advance_list_version(db, plan["list_unaffected"], plan["list_version"])
+
+    resumed = {supplier_id for chunk in chunks for supplier_id in chunk.supplier_ids}
+    remaining = [supplier_id for supplier_id in plan["due"] if supplier_id not in resumed]
+    skipped = plan["skipped"] - len(resumed.difference(plan["due"]))
+
+    planned = [
+        RescoreChunk(
+            ingestion_run_id=run.id,
+            supplier_ids=remaining[offset:offset + RESCORE_CHUNK_SIZE],
+            status="PENDING",
+            attempts=0,
+        )
+        for offset in range(0, len(remaining), RESCORE_CHUNK_SIZE)
+    ]
+    db.add_all(planned)
+    chunks += planned
+
+    db.commit()
+
+    run_id = run.id
+    chunk_ids = [chunk.id for chunk in chunks]
+    due = sum(len(chunk.supplier_ids) for chunk in chunks)
+
+    started = time.perf_counter()
+    assessed = 0
+    errors = []
+
+    if RESCORE_PROCESSES > 0 and len(chunk_ids) > 1:
+        # Spawned, not forked: a fork would inherit the assessment module
+        # thread pool (its threads dead), DB connections and the graph driver
+        with ProcessPoolExecutor(
+            max_workers=min(RESCORE_PROCESSES, len(chunk_ids)),
+            mp_context=get_context("spawn"),
+        ) as pool:
+            futures = [pool.submit(rescore_chunk, chunk_id, run_id) for chunk_id in chunk_ids]
+
+            for future in as_completed(futures):
+                try:
+                    assessed += future.result()
+                except Exception as e:
+                    errors.append(str(e))
+    else:
+        for chunk_id in chunk_ids:
+            try:
+                assessed += rescore_chunk(chunk_id, run_id)
+            except Exception as e:
+                errors.append(str(e))
+
+    seconds = time.perf_counter() - started
+    rows_per_sec = assessed / seconds if seconds > 0 else None
+
+    # Failed chunks stay PENDING for the next run to resume, until their
+    # attempts run out (rescore_chunk marks those FAILED). Finishing is
+    # conditional on still holding the lease: a run declared stale was
+    # already failed and resumed by another one
+    finished = db.execute(
+        update(IngestionRun)
+        .where(IngestionRun.id == run_id, IngestionRun.running_feed_name == RESCORE_RUN_NAME)
+        .values(
+            status="FAILED" if errors else "SUCCESS",
+            error_message=f"{len(errors)} chunk(s) failed: {errors[0]}" if errors else None,
+            running_feed_name=None,
+            rows_parsed=due,
+            record_count=assessed,
+            rows_per_sec=rows_per_sec,
+            completed_at=datetime.utcnow(),
+        )
+    ).rowcount
+    db.commit()
+
+    if not finished:
+        print(f"Warning: rescore run {run_id} lost its lease; its result was not recorded")
+
+    print(
+        f"Supplier rescore run {run_id}: {assessed}/{due} re-assessed in {len(chunk_ids)} chunk(s), "
+        f"{skipped} skipped (inputs unchanged), {rows_per_sec or 0:,.0f} suppliers/sec"
+        + (f", resumed run {previous.id}" if previous else "")
+        + (f", {len(errors)} chunk(s) failed" if errors else "")
+    )
 
 
 # =====================================================
@@ -65,21 +510,12 @@ def rescore_all_suppliers():
 # =====================================================
 def start_scheduler():
 
-    # OFAC Daily Refresh
-    scheduler.add_job(
-        lambda: run_feed_with_tracking("OFAC", refresh_ofac_data),
-        trigger="interval",
-        hours=24,
-        id="ofac_refresh",
-        replace_existing=True,
-    )
-
-    # BIS Daily Refresh
+    # Daily Watchlist Refresh (OFAC, BIS, ... fetched concurrently)
     scheduler.add_job(
-        lambda: run_feed_with_tracking("BIS", refresh_bis_entity_list),
+        run_watchlist_feeds,
         trigger="interval",
         hours=24,
-        id="bis_refresh",
+        id="watchlist_refresh",
         replace_existing=True,
     )
 
@@ -0,0 +1,64 @@
+import os
+import threading
+from collections import OrderedDict
+
+
+SCREENING_CACHE_SIZE = int(os.getenv("SCREENING_CACHE_SIZE", "10000"))
+
+
+class ScreeningCache:
+    """
+    Bounded LRU of watchlist hits keyed by
+    (normalized supplier name, watchlist version hash).
+
+    Only name-dependent matching is cached; supplier-specific rules such as
+    the Section 889 country check are applied on every call.
+    """
+
+    def __init__(self, maxsize: int = SCREENING_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+
+            if value is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+screening_cache = ScreeningCache()
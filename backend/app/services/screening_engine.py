@@ -0,0 +1,82 @@
+from sqlalchemy.orm import Session
+
+from app.models import Supplier
+from app.services.screening_index import normalize, get_watchlist_index
+from app.services.screening_cache import screening_cache
+from app.services.sanctions_service import (
+    MATCH_THRESHOLD as SANCTIONS_THRESHOLD,
+    build_sanctions_result,
+)
+from app.services.section889_service import (
+    MATCH_THRESHOLD as SECTION_889_THRESHOLD,
+    build_section889_result,
+)
+
+
+LIST_THRESHOLDS = {
+    "SANCTIONS": SANCTIONS_THRESHOLD,
+    "SECTION_889": SECTION_889_THRESHOLD,
+}
+
+# One scan at the loosest threshold serves every list; per-list
+# thresholds are applied afterwards.
+SCAN_CUTOFF = min(LIST_THRESHOLDS.values())
+
+
+def split_hits(hits: list) -> dict:
+    by_list = {list_name: [] for list_name in LIST_THRESHOLDS}
+
+    for entry, score in hits:
+        list_name = entry["list_name"]
+
+        if score >= LIST_THRESHOLDS[list_name]:
+            by_list[list_name].append((entry, score))
+
+    return by_list
+
+
+def build_screening_results(
+    supplier: Supplier,
+    hits: list,
+    screening_stats: dict,
+    list_stats: dict | None = None,
+):
+    """
+    list_stats (list_name -> stats) replaces screening_stats on the result
+    of each list it covers.
+    """
+    by_list = split_hits(hits)
+    list_stats = list_stats or {}
+
+    return (
+        build_sanctions_result(
+            supplier, by_list["SANCTIONS"], list_stats.get("SANCTIONS", screening_stats)
+        ),
+        build_section889_result(
+            supplier, by_list["SECTION_889"], list_stats.get("SECTION_889", screening_stats)
+        ),
+    )
+
+
+def screen_supplier(supplier: Supplier, db: Session):
+    """
+    Screens an already-fetched supplier against every watchlist in a
+    single pass over the unified index.
+
+    Returns (sanctions_result, section889_result) in the shapes produced
+    by check_sanctions and evaluate_section_889.
+    """
+    index = get_watchlist_index(db)
+    supplier_name = normalize(supplier.name)
+
+    cache_key = (supplier_name, index.version)
+    cached = screening_cache.get(cache_key)
+
+    if cached is not None:
+        hits, screening_stats = cached
+        screening_stats = dict(screening_stats, cache_hit=True)
+    else:
+        hits, screening_stats = index.search(supplier_name, SCAN_CUTOFF)
+        screening_cache.put(cache_key, (hits, screening_stats))
+
+    return build_screening_results(supplier, hits, screening_stats)
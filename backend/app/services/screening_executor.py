@@ -0,0 +1,120 @@
+import math
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+import numpy as np
+from rapidfuzz import fuzz, process
+
+
+# Opt-in: number of worker processes for bulk screening (0 = score in-process)
+SCREENING_PROCESSES = int(os.getenv("SCREENING_PROCESSES", "0"))
+
+# Queries scored per cdist call; bounds the score matrix to
+# CHUNK_SIZE x list_size bytes.
+CHUNK_SIZE = 1000
+
+
+def score_names(
+    queries: list[str],
+    names: list[str],
+    score_cutoff: float,
+    workers: int = 1,
+    offset: int = 0,
+):
+    """
+    Returns, per query, the (offset + position, score) pairs at or above
+    score_cutoff, using chunked rapidfuzz cdist over every name.
+
+    Kept free of app imports so it can run inside pool worker processes.
+    """
+    results = [[] for _ in queries]
+
+    if not queries or not names:
+        return results
+
+    for start in range(0, len(queries), CHUNK_SIZE):
+        chunk = queries[start:start + CHUNK_SIZE]
+
+        # uint8 keeps the matrix small; exact float scores are recomputed
+        # below for the few surviving pairs.
+        matrix = process.cdist(
+            chunk,
+            names,
+            scorer=fuzz.token_set_ratio,
+            score_cutoff=score_cutoff,
+            dtype=np.uint8,
+            workers=workers,
+        )
+
+        for row, column in zip(*np.nonzero(matrix)):
+            score = fuzz.token_set_ratio(chunk[row], names[column])
+
+            if score >= score_cutoff:
+                results[start + row].append((offset + int(column), score))
+
+    return results
+
+
+class ScreeningExecutor:
+    """
+    Process pool that shards a watchlist across cores for bulk screening,
+    keeping CPU-bound fuzzy scoring off the GIL of the serving process.
+    """
+
+    def __init__(self, processes: int):
+        self.processes = processes
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                # Spawned, not forked: the pool starts lazily inside a
+                # threaded app process, whose locks a fork could copy held
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.processes,
+                    mp_context=get_context("spawn"),
+                )
+
+            return self._pool
+
+    def score(self, queries: list[str], names: list[str], score_cutoff: float):
+        results = [[] for _ in queries]
+
+        if not queries or not names:
+            return results
+
+        pool = self._get_pool()
+        shard_size = math.ceil(len(names) / self.processes)
+
+        futures = [
+            pool.submit(
+                score_names,
+                queries,
+                names[start:start + shard_size],
+                score_cutoff,
+                1,
+                start,
+            )
+            for start in range(0, len(names), shard_size)
+        ]
+
+        # Merge each shard's matches back onto their query
+        for future in futures:
+            for query_hits, shard_hits in zip(results, future.result()):
+                query_hits.extend(shard_hits)
+
+        return results
+
+    def shutdown(self):
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+
+
+screening_executor = (
+    ScreeningExecutor(SCREENING_PROCESSES) if SCREENING_PROCESSES > 0 else None
+)
@@ -0,0 +1,1158 @@
+import hashlib
+import json
+import math
+import mmap
+import os
+import tempfile
+import threading
+import time
+from collections import Counter, defaultdict
+import numpy as np
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from rapidfuzz import fuzz, process
+
+from app.models import (
+    GlobalEntity,
+    GlobalEntityAlias,
+    SanctionedEntity,
+    CoveredEntity,
+    IngestionRun,
+    WatchlistChange,
+)
+from app.services.screening_cache import screening_cache
+
+
+# Character n-gram size used to block entries that share no whole token
+# with the query
+GRAM_SIZE = 3
+
+# Per-call screening budget; calls over it are flagged in screening_stats.
+LATENCY_BUDGET_MS = float(os.getenv("SCREENING_LATENCY_BUDGET_MS", "50"))
+
+# Patched indexes are rebuilt from scratch once this share of their
+# positions are removed entries.
+COMPACT_RATIO = 0.25
+
+# List entry ids loaded per query when patching the live index
+ENTRY_LOAD_CHUNK = 5000
+
+# Aliases written outside the feed pipeline (entity resolution, scripts)
+# emit no WatchlistChange; the live index checks the alias table this often
+# and rebuilds when it changed
+ALIAS_CHECK_SECONDS = float(os.getenv("SCREENING_ALIAS_CHECK_SECONDS", "60"))
+
+# Opt-in: directory of versioned index files that every worker process
+# memory-maps (empty = each process builds its own in-memory index)
+SCREENING_INDEX_DIR = os.getenv("SCREENING_INDEX_DIR", "")
+
+
+def normalize(text: str):
+    return text.lower().replace(",", "").replace(".", "").strip()
+
+
+def name_grams(tokens: list[str]) -> set[str]:
+    grams = set()
+
+    for token in tokens:
+        padded = f" {token} "
+        for i in range(max(len(padded) - GRAM_SIZE + 1, 1)):
+            grams.add(padded[i:i + GRAM_SIZE])
+
+    return grams
+
+
+def token_set_upper_bound(query_count, query_chars, entry_count, entry_chars, shared_count, shared_chars):
+    """
+    Vectorized upper bound on fuzz.token_set_ratio from token-set sizes
+    alone, following rapidfuzz's intersection / difference decomposition.
+
+    Counts are distinct whitespace tokens, chars are their summed lengths.
+    Joined lengths are exact; only the indel distance between the two
+    difference strings is bounded (by their length gap), so the result is
+    never below the real score.
+    """
+    has_sect = shared_count > 0
+    ab_count = query_count - shared_count
+    ba_count = entry_count - shared_count
+
+    sect_len = np.where(has_sect, shared_chars + shared_count - 1, 0)
+    ab_len = np.where(ab_count > 0, query_chars - shared_chars + ab_count - 1, 0)
+    ba_len = np.where(ba_count > 0, entry_chars - shared_chars + ba_count - 1, 0)
+
+    sect_ab_len = sect_len + has_sect + ab_len
+    sect_ba_len = sect_len + has_sect + ba_len
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bound = 100 * (1 - np.abs(ab_len - ba_len) / (sect_ab_len + sect_ba_len))
+        sect_ab_ratio = 100 * (1 - (1 + ab_len) / (sect_len + sect_ab_len))
+        sect_ba_ratio = 100 * (1 - (1 + ba_len) / (sect_len + sect_ba_len))
+
+    bound = np.where(
+        has_sect,
+        np.maximum(bound, np.maximum(sect_ab_ratio, sect_ba_ratio)),
+        bound,
+    )
+
+    # A shared token with nothing left over on one side scores 100
+    return np.where(has_sect & ((ab_count == 0) | (ba_count == 0)), 100.0, bound)
+
+
+# Index versions are sums of per-entry hashes modulo 2**64: order-free, so a
+# patched index and a rebuild of the same rows carry the same version
+VERSION_MODULUS = 2 ** 64
+
+
+# Every entry field a search hit (and so a cached screening result) exposes
+VERSION_FIELDS = (
+    "list_name",
+    "entry_id",
+    "entity_id",
+    "name",
+    "normalized_name",
+    "matched_alias",
+    "source",
+    "program",
+    "designation",
+)
+
+
+def entry_version(entry: dict) -> int:
+    key = "\x1f".join(str(entry.get(field)) for field in VERSION_FIELDS)
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+
+# =====================================================
+# WATCHLIST MATCHER INDEX
+# =====================================================
+class WatchlistIndex:
+    """
+    Pre-normalized view of one or more watchlists. Each entry carries a
+    list_name tag so a single scan can serve several screeners. Entries
+    are appended; removed list entries are masked out of every tier until
+    the index is rebuilt.
+
+    Matching is a cascade:
+      1. exact hit on the normalized name (score 100, no scoring),
+      2. lossless blocking through an inverted index (whole tokens plus a
+         character trigram count derived from the cutoff), then a
+         token-length upper bound that proves a candidate cannot reach
+         the cutoff,
+      3. rapidfuzz token_set_ratio on the few survivors.
+
+    Posting lists and per-entry token sizes are mirrored as numpy arrays
+    so tiers 1-2 stay vectorized on 100k+ name lists.
+    """
+
+    def __init__(self, entries: list[dict]):
+        self.entries = []
+        self.names = []
+        self.list_sizes = Counter()
+
+        self.exact_positions = defaultdict(list)
+        self.tier_counters = Counter()
+
+        self._list_names = []
+        self._token_counts = []
+        self._token_chars = []
+        self._active = []
+
+        # (list_name, entry_id) -> positions of the entry and its aliases
+        self.entry_positions = defaultdict(list)
+        self.removed = 0
+
+        self.token_postings = defaultdict(list)
+        self.gram_postings = defaultdict(list)
+        self._compiled = {}
+
+        self._version_sum = 0
+
+        self.add_entries(entries)
+
+    @property
+    def version(self) -> str:
+        """Content hash of the active entries; changes whenever any does."""
+        return f"{self._version_sum:016x}"
+
+    def copy(self) -> "WatchlistIndex":
+        """
+        Independent copy to patch while searches keep using this one: every
+        container add_entries / remove_entries mutates is duplicated, the
+        entry dicts and compiled arrays (replaced, never mutated) are shared.
+        """
+        index = WatchlistIndex.__new__(WatchlistIndex)
+
+        index.entries = list(self.entries)
+        index.names = list(self.names)
+        index.list_sizes = Counter(self.list_sizes)
+
+        index.exact_positions = defaultdict(list, {key: list(value) for key, value in self.exact_positions.items()})
+        index.tier_counters = Counter()
+
+        index._list_names = list(self._list_names)
+        index._token_counts = list(self._token_counts)
+        index._token_chars = list(self._token_chars)
+        index._active = list(self._active)
+
+        index.entry_positions = defaultdict(list, {key: list(value) for key, value in self.entry_positions.items()})
+        index.removed = self.removed
+
+        index.token_postings = defaultdict(list, {key: list(value) for key, value in self.token_postings.items()})
+        index.gram_postings = defaultdict(list, {key: list(value) for key, value in self.gram_postings.items()})
+        index._compiled = dict(self._compiled)
+
+        index._version_sum = self._version_sum
+
+        index.list_name_array = self.list_name_array
+        index.token_count_array = self.token_count_array
+        index.token_char_array = self.token_char_array
+        index.active_array = self.active_array
+
+        return index
+
+    def add_entries(self, entries: list[dict]):
+        dirty = set()
+
+        for entry in entries:
+            position = len(self.entries)
+            name = entry["normalized_name"]
+            tokens = set(name.split())
+
+            self.entries.append(entry)
+            self.names.append(name)
+            self.list_sizes[entry.get("list_name")] += 1
+            self.exact_positions[name].append(position)
+
+            if "entry_id" in entry:
+                self.entry_positions[(entry["list_name"], entry["entry_id"])].append(position)
+
+            self._list_names.append(entry.get("list_name"))
+            self._token_counts.append(len(tokens))
+            self._token_chars.append(sum(len(token) for token in tokens))
+            self._active.append(True)
+
+            for token in tokens:
+                self.token_postings[token].append(position)
+                dirty.add(("token", token))
+
+            for gram in name_grams(tokens):
+                self.gram_postings[gram].append(position)
+                dirty.add(("gram", gram))
+
+        self._version_sum = (self._version_sum + sum(entry_version(entry) for entry in entries)) % VERSION_MODULUS
+        self._compile(dirty)
+
+    def remove_entries(self, keys):
+        """Masks out every position of the given (list_name, entry_id) keys."""
+        for key in keys:
+            for position in self.entry_positions.pop(key, ()):
+                self._active[position] = False
+                self.list_sizes[self._list_names[position]] -= 1
+                self.exact_positions[self.names[position]].remove(position)
+                self.removed += 1
+                self._version_sum = (self._version_sum - entry_version(self.entries[position])) % VERSION_MODULUS
+
+        self.active_array = np.asarray(self._active, dtype=bool)
+
+    def _compile(self, keys: set):
+        # numpy copies of the posting lists touched by this batch
+        for kind, key in keys:
+            source = self.token_postings if kind == "token" else self.gram_postings
+            self._compiled[(kind, key)] = np.asarray(source[key], dtype=np.int32)
+
+        self.list_name_array = np.asarray(self._list_names, dtype=object)
+        self.token_count_array = np.asarray(self._token_counts, dtype=np.int32)
+        self.token_char_array = np.asarray(self._token_chars, dtype=np.int32)
+        self.active_array = np.asarray(self._active, dtype=bool)
+
+    def __len__(self):
+        return len(self.entries) - self.removed
+
+    # Position accessors; the memory-mapped index overrides these
+    def entry(self, position: int) -> dict:
+        return self.entries[position]
+
+    def _name(self, position: int) -> str:
+        return self.names[position]
+
+    def _names_at(self, positions: list[int]) -> list[str]:
+        return [self.names[position] for position in positions]
+
+    def _list_name(self, position: int):
+        return self._list_names[position]
+
+    def _in_list(self, positions, list_name: str):
+        return self.list_name_array[positions] == list_name
+
+    def _exact(self, name: str):
+        return self.exact_positions.get(name, ())
+
+    def _postings(self, kind: str, keys) -> dict:
+        """key -> numpy posting list, for the keys present in the index."""
+        return {
+            key: self._compiled[(kind, key)]
+            for key in keys
+            if (kind, key) in self._compiled
+        }
+
+    def candidates(self, tokens: set[str], score_cutoff: float):
+        """
+        Returns (positions, shared_count, shared_chars): the blocked
+        candidate positions plus, for every list position, how many query
+        tokens it shares and their total length.
+
+        Blocking is lossless. An entry sharing a whole token is always kept.
+        Without one, token_set_ratio is the plain ratio of the two joined
+        token strings, so reaching the cutoff allows at most
+        (la + lb) * (1 - cutoff / 100) single-character inserts or deletes.
+        Each deletion destroys at most GRAM_SIZE of the query's grams and
+        each insertion one fewer (the q-gram count filter), so an entry
+        sharing fewer grams than the query keeps through that many edits
+        cannot match. Short names may need no shared gram at all; those are
+        left to the length bound.
+        """
+        grams = name_grams(tokens)
+        size = len(self.token_count_array)
+
+        query_len = sum(len(token) for token in tokens) + len(tokens) - 1
+        entry_len = self.token_char_array + self.token_count_array - 1
+        total_len = query_len + entry_len
+        max_indel = np.floor(total_len * (100 - score_cutoff) / 100 + 1e-9)
+        # Indel distance has the parity of the summed lengths
+        max_indel -= (max_indel - total_len) % 2
+        # Deletions from the query outnumber insertions by the length gap;
+        # a deletion destroys GRAM_SIZE grams, an insertion one fewer
+        destroyed = np.floor((GRAM_SIZE - 0.5) * max_indel + (query_len - entry_len) / 2)
+        needed = len(grams) - destroyed
+
+        gram_postings = self._postings("gram", grams)
+
+        if gram_postings:
+            counts = np.bincount(np.concatenate(list(gram_postings.values())), minlength=size)
+        else:
+            counts = np.zeros(size, dtype=np.int64)
+
+        selected = counts >= needed
+
+        shared_count = np.zeros(size, dtype=np.int32)
+        shared_chars = np.zeros(size, dtype=np.int32)
+
+        # Any shared token can lift token_set_ratio to 100, so never prune those
+        for token, postings in self._postings("token", tokens).items():
+            selected[postings] = True
+            shared_count[postings] += 1
+            shared_chars[postings] += len(token)
+
+        if self.removed:
+            selected &= self.active_array
+
+        return np.flatnonzero(selected), shared_count, shared_chars
+
+    def search(self, query: str, score_cutoff: float, list_name: str | None = None):
+        started = time.perf_counter()
+
+        tokens = set(query.split())
+        list_size = len(self) if list_name is None else self.list_sizes[list_name]
+
+        if len(self.token_count_array) and tokens:
+            positions, shared_count, shared_chars = self.candidates(tokens, score_cutoff)
+        else:
+            positions = np.zeros(0, dtype=np.int64)
+
+        if list_name is not None and len(positions):
+            positions = positions[self._in_list(positions, list_name)]
+
+        blocking_candidates = len(positions)
+
+        # Tier 1: identical normalized names always score 100
+        exact = [
+            position
+            for position in (self._exact(query) if tokens else ())
+            if list_name is None or self._list_name(position) == list_name
+        ]
+
+        # Tier 2: drop candidates whose best possible score is below the cutoff
+        if len(positions):
+            bounds = token_set_upper_bound(
+                len(tokens),
+                sum(len(token) for token in tokens),
+                self.token_count_array[positions],
+                self.token_char_array[positions],
+                shared_count[positions],
+                shared_chars[positions],
+            )
+            reachable = positions[bounds >= score_cutoff - 1e-6]
+        else:
+            reachable = positions
+
+        survivors = np.setdiff1d(reachable, exact, assume_unique=True).tolist() if exact else reachable.tolist()
+
+        # Tier 3: full rapidfuzz scorer
+        hits = process.extract(
+            query,
+            self._names_at(survivors),
+            scorer=fuzz.token_set_ratio,
+            score_cutoff=score_cutoff,
+            limit=None,
+        ) if survivors else []
+
+        results = [(self.entry(position), 100.0) for position in exact]
+        results.extend(
+            (self.entry(survivors[choice]), score)
+            for _, score, choice in hits
+        )
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        tiers = {
+            "exact_hits": len(exact),
+            "blocking_pruned": list_size - blocking_candidates,
+            "bound_pruned": blocking_candidates - len(reachable),
+            "fuzzy_scored": len(survivors),
+        }
+        self.tier_counters.update(tiers)
+
+        stats = {
+            "list_size": list_size,
+            "candidates_scored": len(survivors),
+            "pruning_ratio": round(1 - blocking_candidates / list_size, 4) if list_size else 0.0,
+            "tiers": tiers,
+            "elapsed_ms": round(elapsed_ms, 3),
+            "over_budget": elapsed_ms > LATENCY_BUDGET_MS,
+        }
+
+        return results, stats
+
+
+def rollup_aliases(hits: list) -> list:
+    """
+    Collapses alias hits onto their list entry, keeping the best-scoring
+    name per entry. Input order (score descending) is preserved.
+    """
+    best = {}
+
+    for entry, score in hits:
+        key = (entry["list_name"], entry["entry_id"])
+
+        if key not in best or score > best[key][1]:
+            best[key] = (entry, score)
+
+    return list(best.values())
+
+
+def load_alias_map(db: Session, entity_ids) -> dict:
+    """entity_id -> [(alias, normalized_alias)], normalized at ingestion."""
+    aliases = defaultdict(list)
+
+    rows = (
+        db.query(
+            GlobalEntityAlias.entity_id,
+            GlobalEntityAlias.alias,
+            GlobalEntityAlias.normalized_alias,
+        )
+        .filter(GlobalEntityAlias.entity_id.in_(entity_ids))
+        .order_by(GlobalEntityAlias.id)
+        .all()
+    )
+
+    for entity_id, alias, normalized_alias in rows:
+        aliases[entity_id].append((alias, normalized_alias))
+
+    return aliases
+
+
+def with_alias_entries(entries: list[dict], alias_map: dict) -> list[dict]:
+    """Adds one index entry per alias, pointing back to the canonical entry."""
+    expanded = []
+
+    for entry in entries:
+        expanded.append(entry)
+
+        for alias, normalized_alias in alias_map.get(entry["entity_id"], ()):
+            if normalized_alias != entry["normalized_name"]:
+                expanded.append(
+                    dict(entry, normalized_name=normalized_alias, matched_alias=alias)
+                )
+
+    return expanded
+
+
+def load_sanctions_entries(db: Session, sanction_ids=None) -> list[dict]:
+    query = (
+        db.query(
+            SanctionedEntity.id,
+            SanctionedEntity.source,
+            SanctionedEntity.program,
+            GlobalEntity.id,
+            GlobalEntity.canonical_name,
+        )
+        .join(GlobalEntity, SanctionedEntity.entity_id == GlobalEntity.id)
+        .filter(SanctionedEntity.is_active)
+    )
+
+    if sanction_ids is not None:
+        query = query.filter(SanctionedEntity.id.in_(sanction_ids))
+
+    rows = query.order_by(SanctionedEntity.id).all()
+
+    entries = [
+        {
+            "list_name": "SANCTIONS",
+            "entry_id": sanction_id,
+            "sanction_id": sanction_id,
+            "entity_id": entity_id,
+            "name": canonical_name,
+            "normalized_name": normalize(canonical_name),
+            "matched_alias": None,
+            "source": source,
+            "program": program,
+        }
+        for sanction_id, source, program, entity_id, canonical_name in rows
+    ]
+
+    if sanction_ids is None:
+        entity_ids = db.query(SanctionedEntity.entity_id).filter(SanctionedEntity.is_active)
+    else:
+        entity_ids = {entry["entity_id"] for entry in entries}
+
+    return with_alias_entries(entries, load_alias_map(db, entity_ids))
+
+
+def load_covered_entries(db: Session, covered_ids=None) -> list[dict]:
+    query = (
+        db.query(
+            CoveredEntity.id,
+            CoveredEntity.designation,
+            CoveredEntity.source,
+            GlobalEntity.id,
+            GlobalEntity.canonical_name,
+        )
+        .join(GlobalEntity, CoveredEntity.entity_id == GlobalEntity.id)
+        .filter(CoveredEntity.is_active)
+    )
+
+    if covered_ids is not None:
+        query = query.filter(CoveredEntity.id.in_(covered_ids))
+
+    rows = query.order_by(CoveredEntity.id).all()
+
+    entries = [
+        {
+            "list_name": "SECTION_889",
+            "entry_id": covered_id,
+            "covered_id": covered_id,
+            "entity_id": entity_id,
+            "name": canonical_name,
+            "normalized_name": normalize(canonical_name),
+            "matched_alias": None,
+            "designation": designation,
+            "source": source,
+        }
+        for covered_id, designation, source, entity_id, canonical_name in rows
+    ]
+
+    if covered_ids is None:
+        entity_ids = db.query(CoveredEntity.entity_id).filter(CoveredEntity.is_active)
+    else:
+        entity_ids = {entry["entity_id"] for entry in entries}
+
+    return with_alias_entries(entries, load_alias_map(db, entity_ids))
+
+
+def build_watchlist_index(db: Session) -> WatchlistIndex:
+    """Unified, list-tagged index over every screened watchlist and its aliases."""
+    return WatchlistIndex(load_sanctions_entries(db) + load_covered_entries(db))
+
+
+# =====================================================
+# ON-DISK INDEX (SHARED ACROSS WORKERS)
+# =====================================================
+INDEX_MAGIC = b"WLIX0001"
+
+# Pointer file naming the live index file; replaced atomically
+INDEX_CURRENT = "CURRENT"
+
+# Superseded index files kept on disk (mapped files survive unlinking on
+# POSIX; this only bounds the directory)
+INDEX_KEEP_VERSIONS = 3
+
+ARRAY_ALIGN = 64
+
+# Stored in integer entry columns for None
+INT_NONE = np.iinfo(np.int64).min
+
+
+def name_hash(name: str) -> int:
+    return int.from_bytes(hashlib.blake2b(name.encode(), digest_size=8).digest(), "little")
+
+
+def pack_strings(strings: list[str]):
+    """Returns (offsets, blob): string i is blob[offsets[i]:offsets[i + 1]]."""
+    encoded = [string.encode() for string in strings]
+
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum(np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded)))
+
+    return offsets, np.frombuffer(b"".join(encoded), dtype=np.uint8)
+
+
+def pack_postings(postings: dict):
+    """Returns (keys, offsets, positions): CSR posting lists over sorted byte keys."""
+    encoded = [key.encode() for key in postings]
+    width = max((len(key) for key in encoded), default=1)
+
+    keys = np.array(encoded, dtype=f"S{width}")
+    order = np.argsort(keys, kind="stable")
+    lists = list(postings.values())
+
+    offsets = np.zeros(len(lists) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(lists[i]) for i in order]) if len(lists) else []
+
+    positions = (
+        np.concatenate([np.asarray(lists[i], dtype=np.int32) for i in order])
+        if lists else np.zeros(0, dtype=np.int32)
+    )
+
+    return keys[order], offsets, positions
+
+
+def entry_columns(entries: list[dict]):
+    """
+    Column-encodes entry dicts: integer fields as int64 columns, the rest
+    as references into a deduplicated string table, plus the key layout
+    of each entry so decoded dicts match the originals.
+    """
+    fields = {}
+
+    for entry in entries:
+        for key, value in entry.items():
+            if key == "normalized_name" or value is None:
+                continue
+
+            kind = "int" if isinstance(value, int) and not isinstance(value, bool) else "str"
+            if fields.get(key, kind) != kind:
+                kind = "str"
+            fields[key] = kind
+
+    keysets = {}
+    strings = {}
+    layout = np.zeros(len(entries), dtype=np.int16)
+    columns = {
+        key: np.full(len(entries), INT_NONE if kind == "int" else -1, dtype=np.int64)
+        for key, kind in fields.items()
+    }
+
+    for position, entry in enumerate(entries):
+        layout[position] = keysets.setdefault(tuple(entry), len(keysets))
+
+        for key, value in entry.items():
+            if key == "normalized_name" or value is None:
+                continue
+
+            if fields[key] == "int":
+                columns[key][position] = value
+            else:
+                columns[key][position] = strings.setdefault(str(value), len(strings))
+
+    return fields, list(keysets), layout, columns, list(strings)
+
+
+def index_file_arrays(index: WatchlistIndex) -> tuple[dict, dict]:
+    """Flattens a compact in-memory index into (arrays, metadata)."""
+    if index.removed:
+        raise ValueError("index has removed entries; write a freshly built index")
+
+    name_offsets, name_blob = pack_strings(index.names)
+
+    hashes = np.array([name_hash(name) for name in index.names], dtype=np.uint64)
+    hash_order = np.argsort(hashes, kind="stable").astype(np.int32)
+
+    list_table = list(dict.fromkeys(index._list_names))
+    list_codes = {list_name: code for code, list_name in enumerate(list_table)}
+
+    fields, keysets, layout, columns, strings = entry_columns(index.entries)
+    string_offsets, string_blob = pack_strings(strings)
+
+    arrays = {
+        "name_offsets": name_offsets,
+        "name_blob": name_blob,
+        "name_hashes": hashes[hash_order],
+        "name_hash_order": hash_order,
+        "list_codes": np.array([list_codes[name] for name in index._list_names], dtype=np.int16),
+        "token_counts": index.token_count_array,
+        "token_chars": index.token_char_array,
+        "active": index.active_array,
+        "entry_layout": layout,
+        "string_offsets": string_offsets,
+        "string_blob": string_blob,
+    }
+
+    for kind, postings in (("token", index.token_postings), ("gram", index.gram_postings)):
+        keys, offsets, positions = pack_postings(postings)
+        arrays[f"{kind}_keys"] = keys
+        arrays[f"{kind}_offsets"] = offsets
+        arrays[f"{kind}_positions"] = positions
+
+    for key, column in columns.items():
+        arrays[f"field:{key}"] = column
+
+    metadata = {
+        "version": index.version,
+        "list_names": list_table,
+        "list_sizes": dict(index.list_sizes),
+        "fields": fields,
+        "keysets": keysets,
+    }
+
+    return arrays, metadata
+
+
+def write_index_file(path: str, arrays: dict, metadata: dict):
+    """
+    Layout: magic, header length (u64), JSON header (metadata plus dtype /
+    shape / offset of every array), then the raw arrays, each aligned.
+    Written to a temp file and renamed into place.
+    """
+    layout = {}
+    offset = 0
+
+    for name, array in arrays.items():
+        offset = -(-offset // ARRAY_ALIGN) * ARRAY_ALIGN
+        layout[name] = [array.dtype.str, list(array.shape), offset]
+        offset += array.nbytes
+
+    header = json.dumps(dict(metadata, arrays=layout)).encode()
+    data_start = -(-(len(INDEX_MAGIC) + 8 + len(header)) // ARRAY_ALIGN) * ARRAY_ALIGN
+
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+
+    try:
+        with os.fdopen(fd, "wb") as index_file:
+            index_file.write(INDEX_MAGIC)
+            index_file.write(len(header).to_bytes(8, "little"))
+            index_file.write(header)
+
+            for name, array in arrays.items():
+                index_file.seek(data_start + layout[name][2])
+                np.ascontiguousarray(array).tofile(index_file)
+
+            index_file.flush()
+            os.fsync(index_file.fileno())
+
+        # mkstemp creates 0600; workers may run as another user
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+class MappedWatchlistIndex(WatchlistIndex):
+    """
+    Read-only WatchlistIndex over a memory-mapped index file.
+
+    Every array is a view into the file's pages, which the OS shares
+    between all processes mapping the same version; entries and names are
+    decoded on access. Refreshes publish a new file instead of patching.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+        with open(path, "rb") as index_file:
+            self._mmap = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._mmap[:len(INDEX_MAGIC)] != INDEX_MAGIC:
+            raise ValueError(f"{path} is not a watchlist index file")
+
+        header_start = len(INDEX_MAGIC) + 8
+        header_length = int.from_bytes(self._mmap[len(INDEX_MAGIC):header_start], "little")
+        header = json.loads(self._mmap[header_start:header_start + header_length])
+        data_start = -(-(header_start + header_length) // ARRAY_ALIGN) * ARRAY_ALIGN
+
+        arrays = {}
+        self._starts = {}
+        for name, (dtype, shape, offset) in header["arrays"].items():
+            self._starts[name] = data_start + offset
+            dtype = np.dtype(dtype)
+            count = math.prod(shape)
+            arrays[name] = (
+                np.frombuffer(self._mmap, dtype=dtype, count=count, offset=data_start + offset)
+                if count else np.zeros(0, dtype=dtype)
+            ).reshape(shape)
+
+        self._version = header["version"]
+        self._list_table = header["list_names"]
+        self._list_codes = {list_name: code for code, list_name in enumerate(self._list_table)}
+        self._fields = header["fields"]
+        self._keysets = [tuple(keys) for keys in header["keysets"]]
+
+        self.list_sizes = Counter(header["list_sizes"])
+        self.tier_counters = Counter()
+        self.removed = 0
+
+        self._arrays = arrays
+        self.token_count_array = arrays["token_counts"]
+        self.token_char_array = arrays["token_chars"]
+        self.active_array = arrays["active"]
+        self._names = None
+
+    @property
+    def version(self) -> str:
+        return self._version
+
+    @property
+    def names(self) -> list[str]:
+        # Full-list scans (batch scoring) need a real list; decoded once
+        if self._names is None:
+            self._names = self._names_at(range(len(self)))
+
+        return self._names
+
+    def __len__(self):
+        return len(self.token_count_array)
+
+    def add_entries(self, entries: list[dict]):
+        raise TypeError("memory-mapped index is read-only; publish a new version")
+
+    def remove_entries(self, keys):
+        raise TypeError("memory-mapped index is read-only; publish a new version")
+
+    def _string(self, offsets_name: str, blob_name: str, i: int) -> str:
+        offsets = self._arrays[offsets_name]
+        start = self._starts[blob_name]
+        return self._mmap[start + int(offsets[i]):start + int(offsets[i + 1])].decode()
+
+    def _name(self, position: int) -> str:
+        return self._string("name_offsets", "name_blob", position)
+
+    def _names_at(self, positions: list[int]) -> list[str]:
+        offsets = self._arrays["name_offsets"]
+        start = self._starts["name_blob"]
+        positions = np.asarray(positions, dtype=np.int64)
+
+        return [
+            self._mmap[start + begin:start + end].decode()
+            for begin, end in zip(offsets[positions].tolist(), offsets[positions + 1].tolist())
+        ]
+
+    def entry(self, position: int) -> dict:
+        entry = {}
+
+        for key in self._keysets[self._arrays["entry_layout"][position]]:
+            if key == "normalized_name":
+                entry[key] = self._name(position)
+                continue
+
+            kind = self._fields.get(key)
+            value = int(self._arrays[f"field:{key}"][position]) if kind else None
+
+            if kind == "int":
+                entry[key] = None if value == INT_NONE else value
+            else:
+                entry[key] = None if value is None or value < 0 else self._string(
+                    "string_offsets", "string_blob", value
+                )
+
+        return entry
+
+    def _list_name(self, position: int):
+        return self._list_table[self._arrays["list_codes"][position]]
+
+    def _in_list(self, positions, list_name: str):
+        code = self._list_codes.get(list_name, -1)
+        return self._arrays["list_codes"][positions] == code
+
+    def _exact(self, name: str):
+        hashes = self._arrays["name_hashes"]
+        target = np.uint64(name_hash(name))
+
+        start = np.searchsorted(hashes, target, side="left")
+        end = np.searchsorted(hashes, target, side="right")
+
+        return sorted(
+            int(position)
+            for position in self._arrays["name_hash_order"][start:end]
+            if self._name(position) == name
+        )
+
+    def _postings(self, kind: str, keys) -> dict:
+        table = self._arrays[f"{kind}_keys"]
+        offsets = self._arrays[f"{kind}_offsets"]
+        positions = self._arrays[f"{kind}_positions"]
+
+        # Keys wider than the table cannot be in it (and would be truncated)
+        wanted = [
+            (key, encoded)
+            for key, encoded in ((key, key.encode()) for key in keys)
+            if len(encoded) <= table.dtype.itemsize
+        ]
+
+        if not wanted or not len(table):
+            return {}
+
+        found = np.searchsorted(table, np.array([encoded for _, encoded in wanted], dtype=table.dtype))
+
+        return {
+            key: positions[offsets[i]:offsets[i + 1]]
+            for (key, encoded), i in zip(wanted, found)
+            if i < len(table) and table[i] == encoded
+        }
+
+
+# directory -> ((inode, mtime) of CURRENT, index path it names)
+_current_pointers = {}
+
+
+def current_index_path(directory: str) -> str | None:
+    """Index file CURRENT names; re-read only when CURRENT was replaced."""
+    pointer = os.path.join(directory, INDEX_CURRENT)
+
+    try:
+        stat = os.stat(pointer)
+        key = (stat.st_ino, stat.st_mtime_ns)
+
+        if _current_pointers.get(directory, (None,))[0] != key:
+            with open(pointer) as current:
+                _current_pointers[directory] = (key, os.path.join(directory, current.read().strip()))
+
+    except FileNotFoundError:
+        return None
+
+    return _current_pointers[directory][1]
+
+
+def publish_watchlist_index(db: Session, directory: str = SCREENING_INDEX_DIR) -> str:
+    """
+    Builds the index once from the database, writes it as
+    watchlist-<version>.idx and points CURRENT at it (both renames are
+    atomic, so workers see either the old or the new version). Returns
+    the file path.
+    """
+    os.makedirs(directory, exist_ok=True)
+
+    index = build_watchlist_index(db)
+    path = os.path.join(directory, f"watchlist-{index.version}.idx")
+
+    if not os.path.exists(path):
+        arrays, metadata = index_file_arrays(index)
+        write_index_file(path, arrays, metadata)
+
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "w") as current:
+        current.write(os.path.basename(path))
+    os.chmod(temp_path, 0o644)
+    os.replace(temp_path, os.path.join(directory, INDEX_CURRENT))
+
+    superseded = sorted(
+        (
+            os.path.join(directory, name)
+            for name in os.listdir(directory)
+            if name.startswith("watchlist-") and name.endswith(".idx")
+            and os.path.join(directory, name) != path
+        ),
+        key=os.path.getmtime,
+        reverse=True,
+    )
+
+    for old_path in superseded[INDEX_KEEP_VERSIONS - 1:]:
+        try:
+            os.unlink(old_path)
+        except OSError:
+            pass
+
+    return path
+
+
+# =====================================================
+# PROCESS-WIDE INDEX REGISTRY
+# =====================================================
+_watchlist_index: WatchlistIndex | None = None
+_index_lock = threading.Lock()
+
+
+def mapped_watchlist_index(db: Session) -> MappedWatchlistIndex:
+    """
+    Maps the version CURRENT names, publishing one first if the directory
+    is empty, and swaps to a newer version as soon as CURRENT moves.
+    In-flight searches keep the old mapping until they finish.
+    """
+    global _watchlist_index
+
+    path = current_index_path(SCREENING_INDEX_DIR) or publish_watchlist_index(db)
+    index = _watchlist_index
+
+    if index is not None and getattr(index, "path", None) == path:
+        return index
+
+    with _index_lock:
+        if _watchlist_index is None or getattr(_watchlist_index, "path", None) != path:
+            previous = _watchlist_index
+            _watchlist_index = MappedWatchlistIndex(path)
+
+            if previous is not None and previous.version != _watchlist_index.version:
+                screening_cache.clear()
+
+        return _watchlist_index
+
+
+def alias_marker(db: Session) -> tuple:
+    """Row count, max id and max updated_at of the alias table."""
+    return tuple(
+        db.query(
+            func.count(GlobalEntityAlias.id),
+            func.max(GlobalEntityAlias.id),
+            func.max(GlobalEntityAlias.updated_at),
+        ).one()
+    )
+
+
+_alias_marker: tuple | None = None
+_alias_checked_at = 0.0
+
+
+def aliases_moved(db: Session) -> bool:
+    """
+    True when the alias table changed since the last check. Checked at most
+    every ALIAS_CHECK_SECONDS, so screening calls rarely pay for the query.
+    """
+    global _alias_marker, _alias_checked_at
+
+    if time.monotonic() - _alias_checked_at < ALIAS_CHECK_SECONDS:
+        return False
+
+    _alias_checked_at = time.monotonic()
+    marker = alias_marker(db)
+
+    moved = _alias_marker is not None and marker != _alias_marker
+    _alias_marker = marker
+
+    return moved
+
+
+def get_watchlist_index(db: Session) -> WatchlistIndex:
+    global _watchlist_index
+
+    # Feed alias runs patch the index through their ALIAS_* change rows;
+    # aliases written anywhere else only show up here. Rebuilding after a
+    # feed run is harmless: same rows, same version, cache kept
+    if aliases_moved(db):
+        return rebuild_watchlist_index(db)
+
+    if SCREENING_INDEX_DIR:
+        return mapped_watchlist_index(db)
+
+    if _watchlist_index is None:
+        with _index_lock:
+            if _watchlist_index is None:
+                _watchlist_index = build_watchlist_index(db)
+
+    return _watchlist_index
+
+
+def rebuild_watchlist_index(db: Session) -> WatchlistIndex:
+    global _watchlist_index
+
+    if SCREENING_INDEX_DIR:
+        publish_watchlist_index(db)
+        return mapped_watchlist_index(db)
+
+    index = build_watchlist_index(db)
+
+    with _index_lock:
+        previous = _watchlist_index
+        _watchlist_index = index
+
+    # Cached results are keyed by version, so they could never hit again
+    if previous is None or previous.version != index.version:
+        screening_cache.clear()
+
+    return index
+
+
+def apply_watchlist_changes(db: Session, ingestion_run_id: int) -> WatchlistIndex:
+    """
+    Patches the live index with one ingestion run's WatchlistChange rows
+    and records the index versions before and after on the run, so list
+    version changes can be traced back to the runs that made them.
+    """
+    previous = _watchlist_index
+    index = patch_watchlist_index(db, ingestion_run_id)
+
+    ingestion = db.get(IngestionRun, ingestion_run_id)
+    # None when no index was loaded yet: the run's rows are already in the
+    # one just built, so the version it started from is unknown
+    ingestion.previous_list_version = previous.version if previous is not None else None
+    ingestion.list_version = index.version
+    db.commit()
+
+    return index
+
+
+def patch_watchlist_index(db: Session, ingestion_run_id: int) -> WatchlistIndex:
+    """
+    Every list entry the run touched is masked out, then re-added if still
+    active. Falls back to a full rebuild when the diff is large or removed
+    entries would make up too much of the index.
+    """
+    global _watchlist_index
+
+    changes = (
+        db.query(WatchlistChange.list_name, WatchlistChange.list_entry_id)
+        .filter(WatchlistChange.ingestion_run_id == ingestion_run_id)
+        .all()
+    )
+
+    # A shared index file is immutable: republish it once for all workers
+    if SCREENING_INDEX_DIR:
+        return rebuild_watchlist_index(db) if changes else get_watchlist_index(db)
+
+    index = _watchlist_index
+
+    if index is None:
+        return get_watchlist_index(db)
+
+    if not changes:
+        return index
+
+    if len(changes) > COMPACT_RATIO * max(len(index), 1):
+        return rebuild_watchlist_index(db)
+
+    touched = defaultdict(set)
+    for list_name, list_entry_id in changes:
+        touched[list_name].add(list_entry_id)
+
+    entries = []
+    for list_name, loader in (
+        ("SANCTIONS", load_sanctions_entries),
+        ("SECTION_889", load_covered_entries),
+    ):
+        entry_ids = sorted(touched[list_name])
+
+        for start in range(0, len(entry_ids), ENTRY_LOAD_CHUNK):
+            entries.extend(loader(db, entry_ids[start:start + ENTRY_LOAD_CHUNK]))
+
+    # Searches run without the lock, so patch a copy and swap it in
+    patched = index.copy()
+    patched.remove_entries(
+        (list_name, entry_id)
+        for list_name, entry_ids in touched.items()
+        for entry_id in entry_ids
+    )
+    patched.add_entries(entries)
+
+    if patched.removed > COMPACT_RATIO * len(patched.entries):
+        return rebuild_watchlist_index(db)
+
+    with _index_lock:
+        # A concurrent rebuild already read the newer rows; keep it
+        if _watchlist_index is not index:
+            return _watchlist_index
+
+        _watchlist_index = patched
+
+    if patched.version != index.version:
+        screening_cache.clear()
+
+    return patched
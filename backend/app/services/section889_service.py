@@ -1,10 +1,12 @@
 from sqlalchemy.orm import Session
-from rapidfuzz import fuzz
-from app.models import Supplier, CoveredEntity
+from app.models import Supplier
+from app.services.screening_index import normalize, get_watchlist_index, rollup_aliases
 
 
 HIGH_RISK_COUNTRIES = ["China", "Russia", "Iran", "North Korea"]
 
+MATCH_THRESHOLD = 80
+
 
 def evaluate_section_889(supplier_id: int, db: Session):
     supplier = db.query(Supplier).filter_by(id=supplier_id).first()
@@ -13,31 +15,46 @@ def evaluate_section_889(supplier_id: int, db: Session):
         return {"error": "Supplier not found"}
 
     # Rule 1: Covered Entity Match
-    covered_entities = db.query(CoveredEntity).all()
+    index = get_watchlist_index(db)
+
+    hits, screening_stats = index.search(
+        normalize(supplier.name),
+        MATCH_THRESHOLD,
+        list_name="SECTION_889",
+    )
+
+    return build_section889_result(supplier, hits, screening_stats)
+
 
-    for entity in covered_entities:
-        score = fuzz.token_set_ratio(
-            supplier.name.lower(),
-            entity.name.lower()
-        )
+def build_section889_result(supplier: Supplier, hits: list, screening_stats: dict):
+    # Keep list order so the reported entity matches the old linear scan
+    hits = sorted(
+        (hit for hit in rollup_aliases(hits) if hit[1] > MATCH_THRESHOLD),
+        key=lambda hit: hit[0]["covered_id"],
+    )
 
-        if score > 80:
-            return {
-                "supplier": supplier.name,
-                "section_889_status": "FAIL",
-                "reason": f"Matches covered entity: {entity.name}"
-            }
+    if hits:
+        entity, _ = hits[0]
+        return {
+            "supplier": supplier.name,
+            "section_889_status": "FAIL",
+            "reason": f"Matches covered entity: {entity['name']}",
+            "matched_alias": entity["matched_alias"],
+            "screening_stats": screening_stats,
+        }
 
     # Rule 2: High Risk Country
     if supplier.country in HIGH_RISK_COUNTRIES:
         return {
             "supplier": supplier.name,
             "section_889_status": "CONDITIONAL",
-            "reason": f"Supplier located in high-risk country: {supplier.country}"
+            "reason": f"Supplier located in high-risk country: {supplier.country}",
+            "screening_stats": screening_stats,
         }
 
     return {
         "supplier": supplier.name,
         "section_889_status": "PASS",
-        "reason": "No Section 889 risk indicators found"
+        "reason": "No Section 889 risk indicators found",
+        "screening_stats": screening_stats,
     }
@@ -34,7 +34,7 @@ def get_sanctions_count(supplier_id: int, db: Session) -> int:
         db.query(SanctionedEntity)
         .join(GlobalEntity, SanctionedEntity.entity_id == GlobalEntity.id)
         .join(SupplierEntityLink, SupplierEntityLink.entity_id == GlobalEntity.id)
-        .filter(SupplierEntityLink.supplier_id == supplier_id)
+        .filter(SupplierEntityLink.supplier_id == supplier_id, SanctionedEntity.is_active)
         .distinct()
         .count()
     )
@@ -45,7 +45,7 @@ def get_section_889_status(supplier_id: int, db: Session) -> str:
         db.query(CoveredEntity)
         .join(GlobalEntity, CoveredEntity.entity_id == GlobalEntity.id)
         .join(SupplierEntityLink, SupplierEntityLink.entity_id == GlobalEntity.id)
-        .filter(SupplierEntityLink.supplier_id == supplier_id)
+        .filter(SupplierEntityLink.supplier_id == supplier_id, CoveredEntity.is_active)
         .first()
     )
 
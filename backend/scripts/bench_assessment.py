@@ -0,0 +1,207 @@
+"""
+Portfolio rescoring benchmark: per-supplier run_assessment vs run_assessment_batch.
+
+Seeds a scratch database with synthetic sanctions / covered-entity lists
+and a supplier portfolio (a share of them near-matches of list names),
+then assesses every supplier both ways and checks that the payloads and
+the AssessmentHistory rows agree once module timings are set aside.
+
+The per-supplier side is the previous rescore loop: one screen_batch pass,
+then run_assessment per supplier with the screening passed in.
+
+Usage (from backend/):
+    python -m scripts.bench_assessment --suppliers 10000 --list-size 20000
+    python -m scripts.bench_assessment --suppliers 10000 --news-latency-ms 150
+    python -m scripts.bench_assessment --suppliers 10000 --database-url postgresql://...
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+
+HISTORY_COLUMNS = [
+    "supplier_id",
+    "risk_score",
+    "overall_status",
+    "sanctions_flag",
+    "section889_status",
+    "news_signal_score",
+    "graph_risk_score",
+    "scoring_version",
+    "input_fingerprint",
+]
+
+
+def without_timings(value: dict) -> dict:
+    return {key: item for key, item in value.items() if key != "module_timings_ms"}
+
+
+def seed(db, list_size: int, supplier_count: int, match_share: float, rng: random.Random):
+    from app.models import CoveredEntity, SanctionedEntity, Supplier
+    from app.services.bulk_list_loader import bulk_load_list
+    from app.services.screening_index import normalize
+    from scripts.bench_screening import synthetic_names, with_typo
+
+    names = synthetic_names(list_size + supplier_count, rng)
+    rng.shuffle(names)
+    listed, unlisted = names[:list_size], names[list_size:]
+
+    sanctioned = listed[: list_size // 2]
+    covered = listed[list_size // 2:]
+
+    bulk_load_list(db, SanctionedEntity, "SANCTIONS", ((name, {"source": "OFAC", "program": "SDGT"}) for name in sanctioned))
+    bulk_load_list(db, CoveredEntity, "SECTION_889", ((name, {"designation": "Section 889(a)(1)(B)", "source": "Section 889"}) for name in covered))
+
+    suppliers = []
+
+    for i, name in enumerate(unlisted[:supplier_count]):
+        if rng.random() < match_share:
+            name = with_typo(rng.choice(listed), rng)
+
+        suppliers.append({
+            "name": name.title(),
+            "normalized_name": normalize(name),
+            "country": f"C{i}",
+            "is_global": True,
+        })
+
+    db.execute(Supplier.__table__.insert(), suppliers)
+    db.commit()
+
+
+def history_rows(db, since_id: int) -> dict:
+    from app.models import AssessmentHistory
+
+    rows = (
+        db.query(AssessmentHistory)
+        .filter(AssessmentHistory.id > since_id)
+        .all()
+    )
+
+    return {
+        row.supplier_id: (
+            tuple(getattr(row, column) for column in HISTORY_COLUMNS),
+            without_timings(row.snapshot),
+        )
+        for row in rows
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--suppliers", type=int, default=10000)
+    parser.add_argument("--list-size", type=int, default=20000)
+    parser.add_argument("--match-share", type=float, default=0.05)
+    parser.add_argument(
+        "--news-latency-ms",
+        type=float,
+        default=None,
+        help="replace the news API call with a stand-in of this latency (scores 0)",
+    )
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    # Point --database-url at an empty scratch database; it must be set
+    # before anything imports app.database and creates the engine
+    workdir = tempfile.mkdtemp(prefix="bench_assessment_")
+    os.environ["DATABASE_URL"] = args.database_url or f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+
+    from sqlalchemy import func
+    from app.database import Base, SessionLocal, engine
+    from app.models import AssessmentHistory, Supplier
+    from app.services.assessment_service import run_assessment, run_assessment_batch
+    from app.services.batch_screening_service import screen_batch
+    import app.services.assessment_service as assessment_service
+
+    Base.metadata.create_all(bind=engine)
+
+    if args.news_latency_ms is not None:
+        def news_stand_in(supplier_name: str):
+            time.sleep(args.news_latency_ms / 1000)
+            return 0
+
+        assessment_service.news_risk_signal = news_stand_in
+
+    db = SessionLocal()
+
+    started = time.perf_counter()
+    seed(db, args.list_size, args.suppliers, args.match_share, random.Random(args.seed))
+    print(
+        f"seeded list={args.list_size} suppliers={args.suppliers} "
+        f"seconds={time.perf_counter() - started:.2f}"
+    )
+
+    supplier_ids = [supplier_id for supplier_id, in db.query(Supplier.id).order_by(Supplier.id)]
+
+    # Build the watchlist index outside both timings
+    screen_batch(supplier_ids[:1], db)
+
+    def last_history_id():
+        return db.query(func.max(AssessmentHistory.id)).scalar() or 0
+
+    # ------------------ Per supplier ------------------
+    mark = last_history_id()
+    started = time.perf_counter()
+
+    screenings = screen_batch(supplier_ids, db)
+    single = {}
+    for supplier_id in supplier_ids:
+        screening = screenings[supplier_id]
+        single[supplier_id] = run_assessment(
+            supplier_id,
+            db,
+            screening=(screening["sanctions"], screening["section_889"]),
+        )
+
+    single_seconds = time.perf_counter() - started
+    single_rows = history_rows(db, mark)
+
+    print(
+        f"per-supplier suppliers={len(single)} seconds={single_seconds:.2f} "
+        f"suppliers_per_sec={len(single) / single_seconds:,.0f}"
+    )
+
+    # ------------------ Batch ------------------
+    mark = last_history_id()
+    started = time.perf_counter()
+
+    batch = run_assessment_batch(supplier_ids, db)
+
+    batch_seconds = time.perf_counter() - started
+    batch_rows = history_rows(db, mark)
+
+    print(
+        f"batch        suppliers={len(batch)} seconds={batch_seconds:.2f} "
+        f"suppliers_per_sec={len(batch) / batch_seconds:,.0f} "
+        f"speedup={single_seconds / batch_seconds:.1f}x "
+        f"stage_ms={batch[supplier_ids[0]]['module_timings_ms']}"
+    )
+
+    payload_mismatches = sum(
+        1
+        for supplier_id in supplier_ids
+        if without_timings(single[supplier_id]) != without_timings(batch[supplier_id])
+    )
+    row_mismatches = sum(
+        1
+        for supplier_id in supplier_ids
+        if single_rows.get(supplier_id) != batch_rows.get(supplier_id)
+    )
+    statuses = {}
+    for payload in batch.values():
+        statuses[payload["overall_status"]] = statuses.get(payload["overall_status"], 0) + 1
+
+    print(
+        f"identical={payload_mismatches == 0 and row_mismatches == 0} "
+        f"payload_mismatches={payload_mismatches} history_mismatches={row_mismatches} "
+        f"statuses={statuses}"
+    )
+
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
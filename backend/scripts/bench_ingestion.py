@@ -0,0 +1,133 @@
+"""
+End-to-end ingestion benchmark against the local feed stand-in.
+
+Serves synthetic SDN / Entity List generations from scripts.feed_replay
+and drives run_feed_with_tracking through an initial load, --rounds
+churned refreshes and a final unchanged (304) refresh, reporting status,
+change counts, stage timings, throughput and peak memory for each run.
+
+Usage (from backend/):
+    python -m scripts.bench_ingestion --size 100000 --churn 0.02 --malformed-share 0.001
+    python -m scripts.bench_ingestion --size 1000000 --feeds OFAC --database-url postgresql://...
+"""
+import argparse
+import os
+import random
+import resource
+import tempfile
+import time
+
+
+def reset_peak_rss():
+    # Linux: writing 5 to clear_refs resets VmHWM, so each run reports its own peak
+    try:
+        with open("/proc/self/clear_refs", "w") as clear_refs:
+            clear_refs.write("5")
+    except OSError:
+        pass
+
+
+def peak_rss_mb() -> float:
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+
+    # ru_maxrss is KiB on Linux and never resets
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=100000, help="entries per feed (1k-1M)")
+    parser.add_argument("--churn", type=float, default=0.02)
+    parser.add_argument("--malformed-share", type=float, default=0.001)
+    parser.add_argument("--rounds", type=int, default=2, help="churned refreshes after the initial load")
+    parser.add_argument("--feeds", nargs="+", default=["OFAC", "BIS"], help="OFAC_ALT must follow OFAC")
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    # Point --database-url at an empty scratch database; it must be set
+    # before anything imports app.database and creates the engine
+    workdir = tempfile.mkdtemp(prefix="bench_ingestion_")
+    os.environ["DATABASE_URL"] = args.database_url or f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+
+    from scripts.feed_replay import FeedReplayServer, churned, synthetic_entries
+    from app.database import Base, SessionLocal, engine
+    from app.models import IngestionRun, WatchlistChange
+    from app.services.external_intelligence_service import WATCHLIST_FEEDS, refresh_feed
+    from app.services.scheduler_service import run_feed_with_tracking
+
+    Base.metadata.create_all(bind=engine)
+
+    rng = random.Random(args.seed)
+    replay = FeedReplayServer().start()
+
+    for feed_name in args.feeds:
+        WATCHLIST_FEEDS[feed_name]["url"] = replay.url(feed_name)
+
+    # Alias feeds are generated from their parent feed's entries
+    sources = {
+        feed_name: WATCHLIST_FEEDS[feed_name].get("aliases_of", feed_name)
+        for feed_name in args.feeds
+    }
+    entries = {source: synthetic_entries(args.size, rng) for source in set(sources.values())}
+
+    rounds = ["initial"] + [f"churn {i + 1}" for i in range(args.rounds)] + ["unchanged"]
+
+    print(f"size={args.size} churn={args.churn} malformed_share={args.malformed_share} feeds={','.join(args.feeds)}")
+
+    try:
+        for label in rounds:
+            for feed_name in args.feeds:
+                source = sources[feed_name]
+
+                if label.startswith("churn") and source == feed_name:
+                    entries[source] = churned(entries[source], args.churn, rng)
+
+                if label != "unchanged":
+                    replay.publish_synthetic(feed_name, entries[source], args.malformed_share, rng)
+
+                reset_peak_rss()
+                started = time.perf_counter()
+
+                run_feed_with_tracking(
+                    feed_name,
+                    lambda db, ingestion, feed_name=feed_name: refresh_feed(db, ingestion, feed_name),
+                )
+
+                seconds = time.perf_counter() - started
+
+                db = SessionLocal()
+                run = (
+                    db.query(IngestionRun)
+                    .filter(IngestionRun.feed_name == feed_name)
+                    .order_by(IngestionRun.id.desc())
+                    .first()
+                )
+                changes = db.query(WatchlistChange).filter(WatchlistChange.ingestion_run_id == run.id).count()
+
+                print(
+                    f"{label:<10} {feed_name:<8} status={run.status} rows={run.rows_parsed or 0} "
+                    f"changes={changes} seconds={seconds:.2f} "
+                    f"rows_per_sec={(run.rows_parsed or 0) / seconds:,.0f} "
+                    f"download_ms={run.download_ms or 0:.0f} parse_ms={run.parse_ms or 0:.0f} "
+                    f"resolve_ms={run.resolve_ms or 0:.0f} db_write_ms={run.db_write_ms or 0:.0f} "
+                    f"peak_rss_mb={peak_rss_mb():.0f}"
+                )
+
+                if run.status == "FAILED":
+                    print(f"           error={run.error_message}")
+
+                db.close()
+
+    finally:
+        replay.stop()
+
+
+if __name__ == "__main__":
+    main()
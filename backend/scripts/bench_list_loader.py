@@ -0,0 +1,93 @@
+"""
+Throughput benchmark for the bulk sanctions / covered-entity CSV loaders.
+
+Writes a synthetic list CSV (with a share of duplicate rows), loads it into
+a scratch database with load_sanctions, then loads it again to time the
+all-duplicates path.
+
+Usage (from backend/):
+    python -m scripts.bench_list_loader --rows 1000000
+    python -m scripts.bench_list_loader --rows 1000000 --database-url postgresql://...
+"""
+import argparse
+import csv
+import os
+import random
+import resource
+import string
+import tempfile
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Base, GlobalEntity, SanctionedEntity
+from app.services.sanctions_loader import load_sanctions
+from scripts.bench_screening import WORDS
+
+
+def write_synthetic_csv(path: str, rows: int, duplicate_share: float, rng: random.Random):
+    unique = int(rows * (1 - duplicate_share))
+
+    with open(path, "w", newline="", encoding="utf-8") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(["name", "source", "program"])
+
+        names = []
+        for i in range(rows):
+            if i < unique or not names:
+                prefix = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 9)))
+                name = f"{prefix} {' '.join(rng.sample(WORDS, rng.randint(1, 3)))} {i}".title()
+                names.append(name)
+            else:
+                name = rng.choice(names)
+
+            writer.writerow([name, "OFAC", rng.choice(["SDGT", "IRAN", "RUSSIA-EO14024", ""])])
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--duplicate-share", type=float, default=0.05)
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_list_loader_")
+    csv_path = os.path.join(workdir, "sanctions.csv")
+    database_url = args.database_url or f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+
+    started = time.perf_counter()
+    write_synthetic_csv(csv_path, args.rows, args.duplicate_share, random.Random(args.seed))
+    print(f"generated rows={args.rows} seconds={time.perf_counter() - started:.2f} file={csv_path}")
+
+    # Point --database-url at an empty scratch database
+    engine = create_engine(database_url)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+
+    for label in ("initial load", "reload (all duplicates)"):
+        started = time.perf_counter()
+        loaded = load_sanctions(db, csv_path)
+        seconds = time.perf_counter() - started
+
+        print(
+            f"{label:<24} loaded={loaded} seconds={seconds:.2f} "
+            f"rows_per_sec={args.rows / seconds:,.0f} peak_rss_mb={peak_rss_mb():.0f}"
+        )
+
+    print(
+        f"entities={db.query(GlobalEntity).count()} "
+        f"sanctioned_entities={db.query(SanctionedEntity).count()}"
+    )
+
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
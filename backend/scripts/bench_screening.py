@@ -0,0 +1,198 @@
+"""
+Recall / pruning benchmark for the watchlist matching cascade.
+
+Runs every query against the full list (linear rapidfuzz scan) and
+against WatchlistIndex, then reports missed matches, score differences,
+the average share of the list that blocking skipped, where each tier
+eliminated candidates, and per-call latency against the screening budget.
+
+Usage (from backend/):
+    python -m scripts.bench_screening --synthetic-size 20000 --alias-size 100000
+"""
+import argparse
+import csv
+import random
+import string
+import time
+
+from rapidfuzz import fuzz, process
+
+from app.services.screening_index import WatchlistIndex, normalize, LATENCY_BUDGET_MS
+
+
+SANCTIONS_CSV = "data/sanctions.csv"
+COVERED_CSV = "data/covered_entities.csv"
+SUPPLIER_CSV = "data/supplier_dataset_750.csv"
+
+WORDS = [
+    "global", "eastern", "western", "northern", "pacific", "atlantic",
+    "advanced", "united", "national", "royal", "golden", "silver", "star",
+    "dragon", "phoenix", "vertex", "apex", "summit", "delta", "omega",
+    "tech", "technologies", "industries", "manufacturing", "mining",
+    "telecom", "logistics", "shipping", "trading", "energy", "petroleum",
+    "electronics", "semiconductor", "aerospace", "defense", "holdings",
+    "group", "corp", "corporation", "company", "co", "ltd", "llc", "inc",
+]
+
+
+def read_names(path: str) -> list[str]:
+    with open(path, newline="", encoding="utf-8") as csvfile:
+        return [row["name"] for row in csv.DictReader(csvfile) if row.get("name")]
+
+
+def synthetic_names(size: int, rng: random.Random) -> list[str]:
+    names = set()
+
+    while len(names) < size:
+        words = rng.sample(WORDS, rng.randint(2, 4))
+        if rng.random() < 0.5:
+            words.insert(0, "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 9))))
+        names.add(" ".join(words))
+
+    return sorted(names)
+
+
+def with_typo(name: str, rng: random.Random) -> str:
+    position = rng.randrange(len(name))
+    return name[:position] + rng.choice(string.ascii_lowercase) + name[position + 1:]
+
+
+def alias_variants(name: str, count: int, rng: random.Random) -> list[str]:
+    words = name.split()
+    variants = []
+
+    for _ in range(count):
+        shuffled = words[:]
+        rng.shuffle(shuffled)
+        variant = " ".join(shuffled)
+        variants.append(with_typo(variant, rng) if rng.random() < 0.5 else variant)
+
+    return variants
+
+
+def make_entries(names: list[str]) -> list[dict]:
+    return [
+        {"name": name, "normalized_name": normalize(name)}
+        for name in names
+    ]
+
+
+def percentile(values: list[float], share: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * share), len(ordered) - 1)] if ordered else 0.0
+
+
+def run_case(label: str, names: list[str], queries: list[str], threshold: float):
+    entries = make_entries(names)
+    index = WatchlistIndex(entries)
+    choices = index.names
+
+    missed = 0
+    mismatched = 0
+    expected_total = 0
+    pruning = []
+    latencies = []
+    full_seconds = 0.0
+    blocked_seconds = 0.0
+
+    for raw_query in queries:
+        query = normalize(raw_query)
+
+        started = time.perf_counter()
+        expected = {
+            position: score
+            for _, score, position in process.extract(
+                query,
+                choices,
+                scorer=fuzz.token_set_ratio,
+                score_cutoff=threshold,
+                limit=None,
+            )
+        }
+        full_seconds += time.perf_counter() - started
+
+        started = time.perf_counter()
+        hits, stats = index.search(query, threshold)
+        blocked_seconds += time.perf_counter() - started
+
+        found = {id(entry): score for entry, score in hits}
+        expected_total += len(expected)
+        missed += sum(1 for position in expected if id(entries[position]) not in found)
+        mismatched += sum(
+            1
+            for position, score in expected.items()
+            if id(entries[position]) in found and found[id(entries[position])] != score
+        )
+        pruning.append(stats["pruning_ratio"])
+        latencies.append(stats["elapsed_ms"])
+
+    recall = 1.0 if not expected_total else (expected_total - missed) / expected_total
+
+    print(
+        f"{label:<22} list={len(names):>7} queries={len(queries):>6} "
+        f"matches={expected_total:>6} missed={missed:>4} score_mismatch={mismatched} recall={recall:.4f} "
+        f"avg_pruning={sum(pruning) / max(len(pruning), 1):.4f} "
+        f"full={full_seconds * 1000 / max(len(queries), 1):.2f}ms/q "
+        f"blocked={blocked_seconds * 1000 / max(len(queries), 1):.2f}ms/q "
+        f"p95={percentile(latencies, 0.95):.2f}ms "
+        f"over_budget={sum(1 for ms in latencies if ms > LATENCY_BUDGET_MS)}"
+    )
+    print(f"{'':<22} tiers={dict(index.tier_counters)}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--synthetic-size", type=int, default=20000)
+    parser.add_argument("--alias-size", type=int, default=100000)
+    parser.add_argument("--aliases-per-entity", type=int, default=4)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+
+    suppliers = read_names(SUPPLIER_CSV)
+    sanctions = read_names(SANCTIONS_CSV)
+    covered = read_names(COVERED_CSV)
+
+    run_case(
+        "sanctions.csv",
+        sanctions,
+        suppliers + sanctions + [with_typo(name, rng) for name in sanctions],
+        85,
+    )
+    run_case(
+        "covered_entities.csv",
+        covered,
+        suppliers + covered + [with_typo(name, rng) for name in covered],
+        80,
+    )
+
+    synthetic = synthetic_names(args.synthetic_size, rng)
+    sampled = rng.sample(synthetic, min(args.queries // 2, len(synthetic)))
+    queries = (
+        [with_typo(name, rng) for name in sampled]
+        + rng.sample(suppliers, min(args.queries // 2, len(suppliers)))
+    )
+
+    run_case("synthetic", synthetic, queries, 85)
+
+    # Canonical names plus shuffled / misspelled aliases, as a list with
+    # alias expansion enabled would index them.
+    base = synthetic_names(args.alias_size // (args.aliases_per_entity + 1), rng)
+    aliased = base + [
+        alias
+        for name in base
+        for alias in alias_variants(name, args.aliases_per_entity, rng)
+    ]
+    sampled = rng.sample(base, min(args.queries // 2, len(base)))
+    queries = (
+        [with_typo(name, rng) for name in sampled]
+        + rng.sample(suppliers, min(args.queries // 2, len(suppliers)))
+    )
+
+    run_case("synthetic+aliases", aliased, queries, 85)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Scaling benchmark for the process-pool screening executor.
+
+Scores the same synthetic supplier batch against a synthetic watchlist
+in-process (single thread) and on ScreeningExecutor pools of 1..N worker
+processes, checking that every configuration returns identical matches.
+
+Usage (from backend/):
+    python -m scripts.bench_screening_pool --list-size 20000 --queries 2000 --max-processes 8
+"""
+import argparse
+import os
+import random
+import time
+
+from app.services.screening_executor import ScreeningExecutor, score_names
+from app.services.screening_index import normalize
+from scripts.bench_screening import synthetic_names, with_typo
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--list-size", type=int, default=20000)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--max-processes", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--threshold", type=float, default=80)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+
+    names = [normalize(name) for name in synthetic_names(args.list_size, rng)]
+    queries = [with_typo(name, rng) for name in rng.sample(names, min(args.queries, len(names)))]
+
+    started = time.perf_counter()
+    baseline = score_names(queries, names, args.threshold, workers=1)
+    baseline_seconds = time.perf_counter() - started
+
+    print(
+        f"in-process      list={len(names)} queries={len(queries)} "
+        f"seconds={baseline_seconds:.2f}"
+    )
+
+    processes = 1
+    while processes <= args.max_processes:
+        executor = ScreeningExecutor(processes)
+
+        # Warm the pool so process start-up is not measured: one name per
+        # shard, so every worker process is started
+        executor.score(queries[:1], names[:processes], args.threshold)
+
+        started = time.perf_counter()
+        scored = executor.score(queries, names, args.threshold)
+        seconds = time.perf_counter() - started
+
+        executor.shutdown()
+
+        identical = all(
+            sorted(a) == sorted(b) for a, b in zip(baseline, scored)
+        )
+
+        print(
+            f"processes={processes:<4} seconds={seconds:.2f} "
+            f"speedup={baseline_seconds / seconds:.2f}x identical={identical}"
+        )
+
+        processes *= 2
+
+
+if __name__ == "__main__":
+    main()
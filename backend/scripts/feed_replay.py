@@ -0,0 +1,395 @@
+"""
+Local stand-in for the OFAC SDN / alias and BIS Entity List endpoints.
+
+Serves recorded feed files or synthetic ones (configurable size, churn
+between generations and share of malformed rows) over HTTP, with ETag /
+Last-Modified validators and 304 answers, so ingestion can be exercised
+and benchmarked without reaching treasury.gov or bis.doc.gov.
+
+Usage (from backend/):
+    python -m scripts.feed_replay --size 100000 --malformed-share 0.001
+    python -m scripts.feed_replay --sdn-file recorded/sdn.csv --entity-list-file recorded/entity_list.csv
+
+then point the app at it:
+    OFAC_SDN_URL=http://127.0.0.1:8765/sdn.csv
+    OFAC_ALT_URL=http://127.0.0.1:8765/alt.csv
+    BIS_ENTITY_LIST_URL=http://127.0.0.1:8765/entity_list.csv
+"""
+import argparse
+import csv
+import hashlib
+import os
+import random
+import shutil
+import string
+import tempfile
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from scripts.bench_screening import WORDS
+
+
+# Feed name -> path the stand-in serves it under
+FEED_PATHS = {
+    "OFAC": "/sdn.csv",
+    "OFAC_ALT": "/alt.csv",
+    "BIS": "/entity_list.csv",
+}
+
+SDN_PROGRAMS = ["SDGT", "IRAN", "RUSSIA-EO14024", "CYBER2", "DPRK3", "-0-"]
+
+ENTITY_LIST_HEADER = [
+    "Name", "Address", "Federal Register Notice", "Effective Date", "License Requirement",
+]
+
+
+# =====================================================
+# SYNTHETIC FEED CONTENT
+# =====================================================
+def synthetic_entries(size: int, rng: random.Random, first_key: int = 1, taken: set | None = None) -> list[dict]:
+    """Unique (by name) list entries keyed like SDN ent_nums."""
+    taken = taken if taken is not None else set()
+    entries = []
+
+    while len(entries) < size:
+        words = rng.sample(WORDS, rng.randint(1, 3))
+        prefix = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 9)))
+        name = f"{prefix} {' '.join(words)}".upper()
+
+        if name in taken:
+            continue
+
+        taken.add(name)
+        entries.append({
+            "key": first_key + len(entries),
+            "name": name,
+            "program": rng.choice(SDN_PROGRAMS),
+        })
+
+    return entries
+
+
+def churned(entries: list[dict], churn: float, rng: random.Random) -> list[dict]:
+    """
+    Next generation of a list: a churn share of the entries is split
+    evenly between delistings, amendments (renamed or moved to another
+    program) and as many new listings.
+    """
+    touched = int(len(entries) * churn)
+    chosen = rng.sample(range(len(entries)), touched)
+
+    removed = set(chosen[: touched // 3])
+    amended = set(chosen[touched // 3: 2 * touched // 3])
+
+    taken = {entry["name"] for entry in entries}
+    next_entries = []
+
+    for position, entry in enumerate(entries):
+        if position in removed:
+            continue
+
+        if position in amended:
+            entry = dict(entry)
+
+            if rng.random() < 0.5:
+                entry["name"] = f"{entry['name']} {rng.choice(WORDS).upper()}"
+            else:
+                entry["program"] = rng.choice(SDN_PROGRAMS)
+
+        next_entries.append(entry)
+
+    first_key = max((entry["key"] for entry in entries), default=0) + 1
+    next_entries.extend(synthetic_entries(len(removed), rng, first_key, taken))
+
+    return next_entries
+
+
+def malformed_sdn_row(rng: random.Random) -> list[str]:
+    return rng.choice([
+        ["n/a", "UNKEYED ROW", "entity", "SDGT"],      # non-numeric ent_num
+        [str(rng.randint(10**7, 10**8))],              # truncated row
+        [str(rng.randint(10**7, 10**8)), "-0-", "-0-"],  # null name
+        [str(rng.randint(10**7, 10**8)), "", "entity"],  # empty name
+        [],                                            # blank line
+    ])
+
+
+def sdn_aliases(entry: dict) -> list[str]:
+    # Derived from the entry so aliases only change when the entry does
+    words = entry["name"].split()
+    aliases = []
+
+    if entry["key"] % 3:
+        aliases.append(" ".join(reversed(words)))
+
+    if entry["key"] % 5 == 0:
+        aliases.append(f"{words[0]} {WORDS[entry['key'] % len(WORDS)].upper()}")
+
+    return aliases
+
+
+def malformed_alt_row(rng: random.Random) -> list[str]:
+    return rng.choice([
+        ["n/a", "1", "aka", "UNKEYED ALIAS"],          # non-numeric ent_num
+        [str(rng.randint(10**7, 10**8)), "-0-", "aka", "NO ALT NUM"],
+        [str(rng.randint(10**7, 10**8)), str(rng.randint(10**7, 10**8)), "aka", "-0-"],
+        [],                                            # blank line
+    ])
+
+
+def malformed_entity_list_row(rng: random.Random) -> list[str]:
+    return rng.choice([
+        ["", "Unnamed Address"],                       # empty name
+        [" "],                                         # whitespace name
+        [],                                            # blank line
+    ])
+
+
+def write_sdn(path: str, entries: list[dict], malformed_share: float, rng: random.Random):
+    # sdn.csv layout: no header, 12 columns, "-0-" for empty, SUB end marker
+    with open(path, "w", newline="", encoding="utf-8") as csvfile:
+        writer = csv.writer(csvfile, lineterminator="\r\n")
+
+        for entry in entries:
+            if rng.random() < malformed_share:
+                writer.writerow(malformed_sdn_row(rng))
+
+            writer.writerow(
+                [entry["key"], entry["name"], "-0-", entry["program"]] + ["-0-"] * 8
+            )
+
+        csvfile.write("\x1a")
+
+
+def write_sdn_aliases(path: str, entries: list[dict], malformed_share: float, rng: random.Random):
+    # alt.csv layout: ent_num, alt_num, alt_type, alt_name, alt_remarks
+    with open(path, "w", newline="", encoding="utf-8") as csvfile:
+        writer = csv.writer(csvfile, lineterminator="\r\n")
+
+        for entry in entries:
+            if rng.random() < malformed_share:
+                writer.writerow(malformed_alt_row(rng))
+
+            for i, alias in enumerate(sdn_aliases(entry)):
+                writer.writerow([entry["key"], entry["key"] * 10 + i, "aka", alias, "-0-"])
+
+        csvfile.write("\x1a")
+
+
+def write_entity_list(path: str, entries: list[dict], malformed_share: float, rng: random.Random):
+    with open(path, "w", newline="", encoding="utf-8") as csvfile:
+        writer = csv.writer(csvfile, lineterminator="\r\n")
+        writer.writerow(ENTITY_LIST_HEADER)
+
+        for entry in entries:
+            if rng.random() < malformed_share:
+                writer.writerow(malformed_entity_list_row(rng))
+
+            writer.writerow([
+                entry["name"],
+                # Derived from the entry so unchanged entries keep their row hash
+                f"{entry['key']} {WORDS[entry['key'] % len(WORDS)].title()} Road",
+                f"{60 + entry['key'] % 30} FR {entry['program']}",
+                "2024-01-01",
+                "For all items subject to the EAR.",
+            ])
+
+
+FEED_WRITERS = {
+    "OFAC": write_sdn,
+    "OFAC_ALT": write_sdn_aliases,
+    "BIS": write_entity_list,
+}
+
+
+# =====================================================
+# HTTP STAND-IN
+# =====================================================
+class FeedReplayServer:
+    """
+    Threaded HTTP server answering the feed paths from local files.
+
+    publish() swaps in a new file (generation) for a feed atomically;
+    requests carrying the current ETag or Last-Modified get a 304, like
+    the real endpoints.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, workdir: str | None = None):
+        self.workdir = workdir or tempfile.mkdtemp(prefix="feed_replay_")
+        self.feeds = {}
+        self.requests = 0
+        self.generations = 0
+        self.lock = threading.Lock()
+
+        replay = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                replay.serve(self)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url(self, feed_name: str) -> str:
+        return self.base_url + FEED_PATHS[feed_name]
+
+    def publish(self, feed_name: str, source_path: str) -> str:
+        """Serves source_path as the feed's current version; returns its ETag."""
+        with self.lock:
+            self.generations += 1
+            target = os.path.join(self.workdir, f"{feed_name}.{self.generations}.csv")
+
+        shutil.copyfile(source_path, target)
+
+        content_hash = hashlib.sha1()
+        with open(target, "rb") as body:
+            for block in iter(lambda: body.read(1 << 20), b""):
+                content_hash.update(block)
+
+        current = {
+            "path": target,
+            "size": os.path.getsize(target),
+            "etag": f'"{content_hash.hexdigest()}"',
+            "last_modified": formatdate(time.time(), usegmt=True),
+        }
+
+        with self.lock:
+            previous = self.feeds.get(feed_name)
+            self.feeds[feed_name] = current
+
+        # In-flight responses keep their open file handle; the name can go
+        if previous:
+            os.unlink(previous["path"])
+
+        return current["etag"]
+
+    def publish_synthetic(
+        self,
+        feed_name: str,
+        entries: list[dict],
+        malformed_share: float = 0.0,
+        rng: random.Random | None = None,
+    ) -> str:
+        staging = os.path.join(self.workdir, "staging.csv")
+        FEED_WRITERS[feed_name](staging, entries, malformed_share, rng or random.Random())
+
+        etag = self.publish(feed_name, staging)
+        os.unlink(staging)
+
+        return etag
+
+    def serve(self, request: BaseHTTPRequestHandler):
+        feed_name = next(
+            (name for name, path in FEED_PATHS.items() if request.path.split("?")[0] == path),
+            None,
+        )
+
+        with self.lock:
+            self.requests += 1
+            current = self.feeds.get(feed_name)
+
+        if current is None:
+            request.send_response(404)
+            request.send_header("Content-Length", "0")
+            request.end_headers()
+            return
+
+        # If-None-Match wins when both are sent; Last-Modified has 1s resolution
+        if_none_match = request.headers.get("If-None-Match")
+
+        if (
+            if_none_match == current["etag"]
+            if if_none_match
+            else request.headers.get("If-Modified-Since") == current["last_modified"]
+        ):
+            request.send_response(304)
+            request.send_header("ETag", current["etag"])
+            request.end_headers()
+            return
+
+        with open(current["path"], "rb") as body:
+            request.send_response(200)
+            request.send_header("Content-Type", "text/csv; charset=utf-8")
+            request.send_header("Content-Length", str(current["size"]))
+            request.send_header("ETag", current["etag"])
+            request.send_header("Last-Modified", current["last_modified"])
+            request.end_headers()
+            shutil.copyfileobj(body, request.wfile)
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        shutil.rmtree(self.workdir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--size", type=int, default=10000)
+    parser.add_argument("--malformed-share", type=float, default=0.0)
+    parser.add_argument("--churn", type=float, default=0.0, help="churn applied every --churn-interval seconds")
+    parser.add_argument("--churn-interval", type=float, default=60)
+    parser.add_argument("--sdn-file", default=None, help="recorded sdn.csv to replay instead of synthetic data")
+    parser.add_argument("--alt-file", default=None, help="recorded alt.csv (SDN aliases) to replay")
+    parser.add_argument("--entity-list-file", default=None, help="recorded Entity List CSV to replay")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    replay = FeedReplayServer(args.host, args.port)
+
+    recorded = {"OFAC": args.sdn_file, "OFAC_ALT": args.alt_file, "BIS": args.entity_list_file}
+    synthetic = {}
+
+    for feed_name, path in recorded.items():
+        if path:
+            replay.publish(feed_name, path)
+        elif feed_name == "OFAC_ALT":
+            # Synthetic aliases hang off the synthetic SDN entries
+            if "OFAC" in synthetic:
+                replay.publish_synthetic(feed_name, synthetic["OFAC"], args.malformed_share, rng)
+        else:
+            synthetic[feed_name] = synthetic_entries(args.size, rng)
+            replay.publish_synthetic(feed_name, synthetic[feed_name], args.malformed_share, rng)
+
+        print(f"{feed_name:<8} {replay.url(feed_name)}")
+
+    replay.start()
+
+    try:
+        while True:
+            time.sleep(args.churn_interval)
+
+            if not args.churn:
+                continue
+
+            for feed_name in list(synthetic):
+                synthetic[feed_name] = churned(synthetic[feed_name], args.churn, rng)
+                etag = replay.publish_synthetic(feed_name, synthetic[feed_name], args.malformed_share, rng)
+                print(f"{feed_name:<8} new generation etag={etag} requests={replay.requests}")
+
+                if feed_name == "OFAC" and not args.alt_file:
+                    replay.publish_synthetic("OFAC_ALT", synthetic[feed_name], args.malformed_share, rng)
+
+    except KeyboardInterrupt:
+        replay.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+import os
+import tempfile
+
+# Point the app at a throwaway SQLite database before app.database is imported
+os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/test.db"
+os.environ["SCREENING_INDEX_DIR"] = ""
+
+import pytest
+
+from app import models
+from app.database import Base, SessionLocal, engine
+from app.services import reverse_screening_service, screening_index
+from app.services.screening_cache import screening_cache
+
+
+@pytest.fixture
+def db():
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    # Process-wide indexes would outlive the tables they were built from
+    screening_index._watchlist_index = None
+    screening_index._alias_marker = None
+    reverse_screening_service._supplier_index = None
+    screening_cache.clear()
+
+    session = SessionLocal()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def supplier(db):
+    supplier = models.Supplier(name="Acme Widgets", normalized_name="acme widgets", is_global=True)
+    db.add(supplier)
+    db.commit()
+
+    return supplier
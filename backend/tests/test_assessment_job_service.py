@@ -0,0 +1,112 @@
+import threading
+import time
+from datetime import datetime, timedelta
+
+from app.models import AssessmentJob, AuditLog
+from app.services import assessment_job_service as jobs
+
+
+def test_submit_deduplicates_in_flight_jobs(db, supplier):
+    job, deduplicated = jobs.submit_assessment_job(supplier.id, db)
+    again, deduplicated_again = jobs.submit_assessment_job(supplier.id, db)
+
+    assert not deduplicated
+    assert deduplicated_again
+    assert again.id == job.id
+
+    job.status = "SUCCEEDED"
+    job.in_flight_supplier_id = None
+    db.commit()
+
+    fresh, deduplicated = jobs.submit_assessment_job(supplier.id, db)
+
+    assert not deduplicated
+    assert fresh.id != job.id
+
+
+def test_claim_is_exclusive(db, supplier):
+    job, _ = jobs.submit_assessment_job(supplier.id, db)
+
+    claimed = jobs.claim_next_job(db, "worker-1")
+
+    assert claimed.id == job.id
+    assert (claimed.status, claimed.worker, claimed.attempts) == ("RUNNING", "worker-1", 1)
+    assert claimed.heartbeat_at is not None
+    assert jobs.claim_next_job(db, "worker-2") is None
+
+
+def test_heartbeat_refreshes_only_the_claimed_job(db, supplier, monkeypatch):
+    monkeypatch.setattr(jobs, "ASSESSMENT_JOB_HEARTBEAT_SECONDS", 0.05)
+
+    jobs.submit_assessment_job(supplier.id, db)
+    job = jobs.claim_next_job(db, "worker-1")
+    stale = datetime.utcnow() - timedelta(hours=1)
+    job.heartbeat_at = stale
+    db.commit()
+
+    for worker in ("worker-2", "worker-1"):
+        stop = threading.Event()
+        beating = threading.Thread(target=jobs.heartbeat, args=(job.id, worker, stop))
+        beating.start()
+        time.sleep(0.2)
+        stop.set()
+        beating.join()
+
+        db.refresh(job)
+        assert (job.heartbeat_at > stale) == (worker == "worker-1")
+
+
+def test_stale_jobs_are_requeued_then_failed(db, supplier):
+    jobs.submit_assessment_job(supplier.id, db)
+    job = jobs.claim_next_job(db, "worker-1")
+
+    assert jobs.requeue_stale_jobs(db) == 0
+
+    job.heartbeat_at = datetime.utcnow() - timedelta(hours=1)
+    db.commit()
+
+    assert jobs.requeue_stale_jobs(db) == 1
+    db.refresh(job)
+    assert (job.status, job.worker) == ("QUEUED", None)
+
+    job = jobs.claim_next_job(db, "worker-2")
+    job.attempts = jobs.ASSESSMENT_JOB_MAX_ATTEMPTS
+    job.heartbeat_at = datetime.utcnow() - timedelta(hours=1)
+    db.commit()
+
+    jobs.requeue_stale_jobs(db)
+    db.refresh(job)
+    assert job.status == "FAILED"
+    assert job.in_flight_supplier_id is None
+
+
+def test_execute_job_finishes_under_its_claim(db, supplier, monkeypatch):
+    monkeypatch.setattr(jobs, "run_assessment", lambda supplier_id, db, user_id=None: {"overall_status": "PASS"})
+
+    jobs.submit_assessment_job(supplier.id, db)
+    jobs.execute_job(jobs.claim_next_job(db, "worker-1"), db)
+
+    job = db.query(AssessmentJob).one()
+    assert job.status == "SUCCEEDED"
+    assert job.result == {"overall_status": "PASS"}
+    assert job.in_flight_supplier_id is None
+    assert db.query(AuditLog).count() == 1
+
+
+def test_requeued_job_result_is_dropped(db, supplier, monkeypatch):
+    jobs.submit_assessment_job(supplier.id, db)
+    job = jobs.claim_next_job(db, "worker-1")
+
+    def requeued_while_running(supplier_id, session, user_id=None):
+        # Another worker took the job over after a missed heartbeat
+        job.worker = "worker-2"
+        session.commit()
+        return {"overall_status": "PASS"}
+
+    monkeypatch.setattr(jobs, "run_assessment", requeued_while_running)
+    jobs.execute_job(job, db)
+
+    db.refresh(job)
+    assert (job.status, job.worker) == ("RUNNING", "worker-2")
+    assert job.result is None
+    assert job.in_flight_supplier_id == supplier.id
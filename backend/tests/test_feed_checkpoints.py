@@ -0,0 +1,57 @@
+import random
+
+import pytest
+
+from app.models import IngestionRun, SanctionedEntity, WatchlistChange
+from app.services import external_intelligence_service as feeds
+from app.services import scheduler_service
+from scripts.feed_replay import FeedReplayServer, synthetic_entries
+
+
+@pytest.fixture
+def replay(monkeypatch):
+    server = FeedReplayServer().start()
+    monkeypatch.setitem(feeds.WATCHLIST_FEEDS["OFAC"], "url", server.url("OFAC"))
+    monkeypatch.setattr(scheduler_service.scheduler, "add_job", lambda *args, **kwargs: None)
+
+    yield server
+
+    server.stop()
+
+
+def test_failed_run_resumes_from_its_checkpoint(db, replay, monkeypatch):
+    replay.publish_synthetic("OFAC", synthetic_entries(200, random.Random(1)))
+
+    batched = feeds.batched
+    monkeypatch.setattr(feeds, "batched", lambda rows, size=50: batched(rows, size))
+
+    # The third batch fails after two were committed and checkpointed
+    entity_names = feeds.entity_names
+    calls = []
+
+    def flaky_entity_names(session, entity_ids):
+        calls.append(entity_ids)
+        if len(calls) == 3:
+            raise RuntimeError("connection lost")
+        return entity_names(session, entity_ids)
+
+    monkeypatch.setattr(feeds, "entity_names", flaky_entity_names)
+    scheduler_service.run_feed_with_tracking("OFAC", feeds.refresh_ofac_data)
+
+    failed = db.query(IngestionRun).one()
+    assert failed.status == "FAILED"
+    assert failed.checkpoint_offset > 0
+    assert db.query(SanctionedEntity).count() == 100
+
+    monkeypatch.setattr(feeds, "entity_names", entity_names)
+    scheduler_service.run_feed_with_tracking("OFAC", feeds.refresh_ofac_data)
+
+    db.expire_all()
+    resumed = db.query(IngestionRun).filter(IngestionRun.id != failed.id).one()
+    assert resumed.status == "SUCCESS"
+    assert resumed.resumed_from_run_id == failed.id
+
+    # Each entry written exactly once across both runs
+    assert db.query(SanctionedEntity).count() == 200
+    added = [list_entry_id for (list_entry_id,) in db.query(WatchlistChange.list_entry_id)]
+    assert sorted(added) == sorted(entry_id for (entry_id,) in db.query(SanctionedEntity.id))
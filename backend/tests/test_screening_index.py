@@ -0,0 +1,82 @@
+import random
+import string
+
+import pytest
+from rapidfuzz import fuzz, process
+
+from app.services.screening_index import WatchlistIndex
+
+
+def full_scan(query, names, score_cutoff):
+    return {
+        (names[position], round(score, 6))
+        for _, score, position in process.extract(
+            query, names, scorer=fuzz.token_set_ratio, score_cutoff=score_cutoff, limit=None
+        )
+    }
+
+
+def indexed(index, query, score_cutoff):
+    hits, _ = index.search(query, score_cutoff)
+    return {(entry["normalized_name"], round(score, 6)) for entry, score in hits}
+
+
+@pytest.mark.parametrize(
+    "query, name, score_cutoff",
+    [
+        ("cocrp ld", "corp ltd", 85),
+        ("cocrp ld", "corp ltd", 80),
+        ("apdx ienc", "apex inc", 80),
+        ("swar lotd", "star ltd", 80),
+    ],
+)
+def test_blocking_keeps_typo_matches_without_shared_tokens(query, name, score_cutoff):
+    index = WatchlistIndex([{"normalized_name": name}])
+
+    assert fuzz.token_set_ratio(query, name) >= score_cutoff
+    assert indexed(index, query, score_cutoff) == full_scan(query, [name], score_cutoff)
+
+
+def test_cascade_matches_full_scan():
+    rng = random.Random(11)
+
+    # A small alphabet repeats grams within and across names
+    def word():
+        return "".join(rng.choices("abcdexyz", k=rng.randint(1, 9)))
+
+    names = sorted({" ".join(word() for _ in range(rng.randint(1, 4))) for _ in range(1500)})
+    index = WatchlistIndex([{"normalized_name": name} for name in names])
+
+    for _ in range(150):
+        query = list(rng.choice(names))
+
+        for _ in range(rng.randint(0, 5)):
+            position = rng.randrange(len(query) + 1)
+            edit = rng.random()
+
+            if edit < 0.35:
+                query.insert(position, rng.choice("abcde "))
+            elif position < len(query):
+                if edit < 0.7:
+                    del query[position]
+                else:
+                    query[position] = rng.choice(string.ascii_lowercase[:5])
+
+        query = " ".join("".join(query).split())
+
+        if not query:
+            continue
+
+        for score_cutoff in (60, 75, 85, 95):
+            assert indexed(index, query, score_cutoff) == full_scan(query, names, score_cutoff), (query, score_cutoff)
+
+
+def test_removed_entries_are_not_matched():
+    index = WatchlistIndex([
+        {"list_name": "SANCTIONS", "entry_id": 1, "normalized_name": "apex inc"},
+        {"list_name": "SANCTIONS", "entry_id": 2, "normalized_name": "star ltd"},
+    ])
+    index.remove_entries([("SANCTIONS", 1)])
+
+    assert indexed(index, "apex inc", 80) == set()
+    assert indexed(index, "swar lotd", 80) == {("star ltd", round(fuzz.token_set_ratio("swar lotd", "star ltd"), 6))}